@@ -0,0 +1,158 @@
+from __future__ import absolute_import
+
+import copy
+import threading
+from collections import OrderedDict
+
+from openshift.client import clock
+from openshift.watch import Watch
+
+TTL = 30
+NEGATIVE_TTL = 5
+MAX_SIZE = 1024
+
+# returned by ObjectCache.get when there is no fresh entry
+MISSING = object()
+
+
+def object_key(api_version, kind, namespace, name):
+    """
+    Cache key of an object: (group, version, kind, namespace, name). kind is
+    normalized so that the helpers' snake case kinds, e.g. image_stream, and the
+    kinds of API objects, e.g. ImageStream, give the same key.
+    """
+    group, _, version = (api_version or '').rpartition('/')
+    return group, version, kind.replace('_', '').lower(), namespace or None, name
+
+
+def key_of(obj):
+    """ Cache key of an API object, or None if it does not carry its apiVersion and kind """
+    if not getattr(obj, 'kind', None) or getattr(obj, 'metadata', None) is None:
+        return None
+    return object_key(obj.api_version, obj.kind, obj.metadata.namespace, obj.metadata.name)
+
+
+def is_newer(resource_version, other):
+    """
+    True unless other is known to be a later resourceVersion. resourceVersions are
+    opaque, but etcd's are integers, which can be compared.
+    """
+    if resource_version is None or other is None:
+        return True
+    if resource_version.isdigit() and other.isdigit():
+        return int(resource_version) >= int(other)
+    return resource_version != other
+
+
+class ObjectCache(object):
+    """
+    Least recently used cache of API objects whose entries expire after ttl seconds.
+    Callers get a copy of the cached object, so they are free to modify it.
+
+    Objects found not to exist can be cached as well, for the shorter negative_ttl,
+    so that code checking for an object it is about to create doesn't hit the
+    server over and over. get() returns None for those.
+
+    Keep it fresh by invalidating the keys a client writes to, and optionally by
+    feeding it watch events with follow() or watch(). An event only replaces an entry
+    if it is not older than it, by resourceVersion.
+
+    :param ttl: seconds an object is served from the cache.
+    :param negative_ttl: seconds an object is known not to exist, 0 to not cache that.
+    :param maxsize: number of objects to keep.
+    """
+
+    def __init__(self, ttl=TTL, negative_ttl=NEGATIVE_TTL, maxsize=MAX_SIZE):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """ Return a copy of the object cached for key, None if it is known not to exist, or MISSING """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] < clock.monotonic():
+                self.misses += 1
+                return MISSING
+            self._entries[key] = entry
+            self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def set(self, key, obj):
+        self._store(key, copy.deepcopy(obj), self.ttl)
+
+    def set_missing(self, key):
+        """ Remember that the object for key does not exist """
+        if self.negative_ttl > 0:
+            self._store(key, None, self.negative_ttl)
+        else:
+            self.invalidate(key)
+
+    def _store(self, key, obj, ttl):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (clock.monotonic() + ttl, obj)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key, load, *args, **kwargs):
+        """ Return the object cached for key, or load(*args, **kwargs), which is then cached """
+        obj = self.get(key)
+        if obj is MISSING:
+            obj = load(*args, **kwargs)
+            self.set(key, obj)
+        return obj
+
+    def invalidate(self, key=None):
+        """ Drop the entry for key, or every entry """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def observe(self, event_type, obj):
+        """ Apply a watch event to the cache """
+        key = key_of(obj)
+        if key is None:
+            return
+        if event_type == 'DELETED':
+            self.set_missing(key)
+            return
+        if event_type not in ('ADDED', 'MODIFIED'):
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and \
+                    not is_newer(obj.metadata.resource_version, entry[1].metadata.resource_version):
+                return
+        self.set(key, obj)
+
+    def follow(self, events):
+        """ Apply every event of a watch stream, e.g. Watch().stream(...), until it ends """
+        for event in events:
+            if not isinstance(event.get('object'), dict):
+                self.observe(event['type'], event['object'])
+
+    def watch(self, func, *args, **kwargs):
+        """
+        Keep the cache fresh with the events of a watch on the list method func, from
+        a daemon thread. Returns the Watch, stop() it to end the thread.
+        """
+        watcher = Watch()
+        thread = threading.Thread(target=self.follow, args=(watcher.stream(func, *args, **kwargs),))
+        thread.daemon = True
+        thread.start()
+        return watcher
+
+    def metrics(self):
+        """ Return the cache hits and misses since the cache was created, and the number of entries it holds """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def __len__(self):
+        return len(self._entries)
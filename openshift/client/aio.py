@@ -0,0 +1,275 @@
+"""
+asyncio client for the OpenShift and Kubernetes APIs. Requires Python 3.5+ and aiohttp.
+
+The generated API classes work unchanged on top of AsyncApiClient: every operation
+returns a coroutine instead of a result.
+
+    api_client = AsyncApiClient(configuration)
+    oapi = OapiApi(api_client)
+    builds = await oapi.list_namespaced_build('test')
+"""
+import asyncio
+import json
+import ssl
+from inspect import getcallargs
+
+import aiohttp
+
+from kubernetes.client.api_client import ApiClient as K8sApiClient
+from kubernetes.client.rest import ApiException
+
+from openshift.watch import Watch
+
+from .api_client import ApiClient
+from .protobuf import PROTOBUF
+
+
+class PreparedRequest(object):
+    """ A request as kubernetes' ApiClient would hand it to the REST client """
+
+    def __init__(self, method, url, query_params=None, headers=None, post_params=None, body=None, timeout=None):
+        self.method = method
+        self.url = url
+        # stringified like urlencode does for urllib3
+        self.query_params = [(key, value if isinstance(value, str) else str(value)) for key, value in query_params or []]
+        self.headers = headers or {}
+        self.post_params = post_params or []
+        self.body = body
+        self.timeout = timeout
+
+
+class AsyncResponse(object):
+    """ Read response, with the interface of kubernetes.client.rest.RESTResponse """
+
+    def __init__(self, resp, data):
+        self.status = resp.status
+        self.reason = resp.reason
+        self.headers = resp.headers
+        self.raw_data = data
+        self.data = data.decode('utf8') if not resp.headers.get('Content-Type', '').startswith(PROTOBUF) else data
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+def ssl_context(configuration):
+    if not configuration.verify_ssl:
+        return False
+    context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file, configuration.key_file)
+    if configuration.assert_hostname is False:
+        context.check_hostname = False
+    return context
+
+
+def client_timeout(request_timeout):
+    if request_timeout is None:
+        return None
+    if isinstance(request_timeout, (tuple, list)):
+        return aiohttp.ClientTimeout(sock_connect=request_timeout[0], sock_read=request_timeout[1])
+    return aiohttp.ClientTimeout(total=request_timeout)
+
+
+class AsyncApiClient(ApiClient):
+    """
+    ApiClient whose call_api returns a coroutine, so every operation of the generated
+    API classes can be awaited. Requests are prepared by the kubernetes ApiClient
+    exactly as for synchronous calls, then sent over one pooled aiohttp session,
+    with at most connection_limit connections open at a time. Close the client with
+    `await api_client.close()`, or use it as an async context manager.
+
+    Calls made with _preload_content=False return the aiohttp ClientResponse, which
+    the caller has to release. The async= flag of the generated methods is ignored.
+
+    :param loop: event loop, defaults to the current one.
+    :param connection_limit: maximum number of simultaneous connections.
+    """
+
+    def __init__(self, configuration=None, header_name=None, header_value=None, cookie=None,
+                 loop=None, connection_limit=100):
+        super(AsyncApiClient, self).__init__(configuration, header_name, header_value, cookie)
+        self.loop = loop
+        self.connection_limit = connection_limit
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None or self._session.closed:
+            loop = {'loop': self.loop} if self.loop is not None else {}
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, ssl=ssl_context(self.configuration), **loop)
+            self._session = aiohttp.ClientSession(connector=connector, auto_decompress=True, **loop)
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def request(self, method, url, query_params=None, headers=None,
+                post_params=None, body=None, _preload_content=True, _request_timeout=None):
+        # Called by kubernetes' ApiClient once headers, auth, path and body are prepared.
+        # The request is sent by _send instead.
+        return PreparedRequest(method, url, query_params, headers, post_params, body, _request_timeout)
+
+    def call_api(self, *args, **kwargs):
+        params = getcallargs(K8sApiClient.call_api, self, *args, **kwargs)
+        del params['self']
+        preload_content = params['_preload_content'] in (None, True)
+        return_http_data_only = params['_return_http_data_only']
+        response_type = params['response_type']
+
+        params.update({'async': None, '_preload_content': False, '_return_http_data_only': True})
+        if preload_content and self.protobuf:
+            with self.protobuf_stream():
+                request = super(AsyncApiClient, self).call_api(**params)
+        else:
+            request = super(AsyncApiClient, self).call_api(**params)
+        return self._send(request, response_type, preload_content, return_http_data_only)
+
+    async def _send(self, request, response_type, preload_content, return_http_data_only):
+        data = self._request_data(request)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve()
+                if delay:
+                    await asyncio.sleep(delay)
+            try:
+                return await self._send_once(request, data, response_type, preload_content, return_http_data_only)
+            except ApiException as exc:
+                if self.retry_policy is None or not self.retry_policy.should_retry(attempt, request.method, exc.status):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(attempt, exc.headers))
+            except aiohttp.ClientConnectionError:
+                if self.retry_policy is None or not self.retry_policy.should_retry(attempt, request.method):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+            attempt += 1
+
+    async def _send_once(self, request, data, response_type, preload_content, return_http_data_only):
+        resp = await self.session.request(
+            request.method, request.url, params=request.query_params, headers=request.headers,
+            data=data, timeout=client_timeout(request.timeout), proxy=self.configuration.proxy
+        )
+        if not preload_content and 200 <= resp.status <= 299:
+            return resp
+
+        try:
+            response = AsyncResponse(resp, await resp.read())
+        finally:
+            resp.release()
+        if not 200 <= response.status <= 299:
+            raise ApiException(http_resp=response)
+
+        if not response_type:
+            return_data = None
+        elif response.getheader('Content-Type', '').startswith(PROTOBUF):
+            return_data = self.deserialize_data(self.protobuf_codec.decode(response.data, response_type), response_type)
+        else:
+            return_data = self.deserialize(response, response_type)
+
+        if return_http_data_only:
+            return return_data
+        return return_data, response.status, response.getheaders()
+
+    @staticmethod
+    def _request_data(request):
+        """ Encode the body the way kubernetes.client.rest.RESTClientObject does """
+        if request.method in ('GET', 'HEAD'):
+            return None
+        content_type = request.headers.setdefault('Content-Type', 'application/json')
+        if 'json' in content_type.lower():
+            if content_type == 'application/json-patch+json' and not isinstance(request.body, list):
+                request.headers['Content-Type'] = 'application/strategic-merge-patch+json'
+            return json.dumps(request.body) if request.body is not None else None
+        if content_type == 'application/x-www-form-urlencoded':
+            return aiohttp.FormData(request.post_params)
+        if content_type == 'multipart/form-data':
+            # aiohttp sets the content type, boundary included
+            del request.headers['Content-Type']
+            form = aiohttp.FormData()
+            for name, value in request.post_params:
+                if isinstance(value, tuple):
+                    filename, data, mimetype = value
+                    form.add_field(name, data, filename=filename, content_type=mimetype)
+                else:
+                    form.add_field(name, value)
+            return form
+        return request.body
+
+
+class AsyncWatch(Watch):
+    """
+    Watch for AsyncApiClient. stream() returns an async iterator of the same events
+    Watch.stream yields:
+
+        async for event in AsyncWatch().stream(oapi.list_namespaced_build, 'test'):
+            ...
+
+    Without timeout_seconds the watch reconnects from the last seen resourceVersion
+    whenever the server closes the stream, until stop() is called.
+    """
+
+    def stream(self, func, *args, **kwargs):
+        self._stop = False
+        kwargs['watch'] = True
+        kwargs['_preload_content'] = False
+        return WatchStream(self, func, args, kwargs)
+
+
+class WatchStream(object):
+
+    def __init__(self, watch, func, args, kwargs):
+        self.watch = watch
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.return_type = watch.get_return_type(func)
+        self.reconnect = 'timeout_seconds' not in kwargs
+        self.response = None
+        self.done = False
+        self._buffer = b''
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.watch._stop and not self.done:
+            if self.response is None:
+                self.response = await self.func(*self.args, **self.kwargs)
+                self._buffer = b''
+
+            line = await self._readline()
+            if line is None:
+                self.close()
+                self.kwargs['resource_version'] = self.watch.resource_version
+                self.done = not self.reconnect
+            elif line.strip():
+                return self.watch.unmarshal_event(line.decode('utf8'), self.return_type)
+        self.close()
+        raise StopAsyncIteration
+
+    async def _readline(self):
+        while b'\n' not in self._buffer:
+            chunk = await self.response.content.readany()
+            if not chunk:
+                line, self._buffer = self._buffer, b''
+                return line or None
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return line
+
+    def close(self):
+        if self.response is not None:
+            self.response.release()
+            self.response = None
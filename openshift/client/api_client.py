@@ -1,18 +1,559 @@
 from __future__ import absolute_import
 
+import inspect
+import json
+import operator
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from six import iteritems, string_types, text_type
+
 from kubernetes.client.api_client import ApiClient as K8sApiClient
 from kubernetes.client import models as k8s_models
+from kubernetes.client.rest import ApiException
 
 from . import models
+from .interning import intern_json
+from .lazy import lazy_model_class, new_lazy_model
+from .protobuf import PROTOBUF, ProtobufCodec
+from .ratelimit import RateLimiter
+from .retry import CONNECTION_ERRORS, RetryPolicy
+from .resource import ResourceObject, wrap
+from .singleflight import SingleFlight
+from .timestamps import DatetimeCache, parse_rfc3339
+
+LIST_TYPE_RX = re.compile(r'list\[(.*)\]')
+DICT_TYPE_RX = re.compile(r'dict\(([^,]*), (.*)\)')
+
+# Values for ApiClient.response_format
+MODEL_RESPONSES = 'model'
+DICT_RESPONSES = 'dict'
+OBJECT_RESPONSES = 'object'
+LAZY_RESPONSES = 'lazy'
+RESPONSE_FORMATS = (MODEL_RESPONSES, DICT_RESPONSES, OBJECT_RESPONSES, LAZY_RESPONSES)
+
+# Content codings urllib3 decodes for us
+ACCEPT_ENCODING = 'gzip, deflate'
+
+
+def class_registry(*modules):
+    """
+    Build a name -> class dict from one or more modules. When a name exists in more
+    than one module, the class from the earliest module wins.
+    """
+    registry = {}
+    for module in reversed(modules):
+        registry.update((name, obj) for name, obj in vars(module).items() if inspect.isclass(obj))
+    return registry
+
+
+# Kubernetes models take precedence over OpenShift models of the same name, which is
+# the order the kubernetes deserializer has always resolved them in.
+MODEL_REGISTRY = class_registry(k8s_models, models)
+
 
 class ApiClient(K8sApiClient):
-    def _ApiClient__deserialize(self, data, klass):
+    """
+    ApiClient that understands both OpenShift and Kubernetes models.
+
+    Deserialization is driven by compiled plans: the first time a swagger type string
+    or model class is seen, it is turned into a converter function, and every model
+    class gets a tuple of (json key, attribute, converter) entries. Both are cached on
+    the class, so every later object of that type skips the type string parsing and
+    the swagger_types/attribute_map walk.
+
+    response_format controls what API calls return. 'model' (the default) builds
+    openshift.client.models / kubernetes.client.models objects, 'dict' returns the
+    decoded JSON as plain dicts and lists, and 'object' wraps that JSON in a
+    ResourceObject for attribute access. 'lazy' returns model objects that hold the
+    decoded JSON and only build an attribute, and any nested model, when it is first
+    read. The initial value is read from a response_format attribute on the
+    configuration, if there is one.
+
+    Setting protobuf (or a protobuf attribute on the configuration) to True asks the
+    server for application/vnd.kubernetes.protobuf on operations that offer it, as long
+    as every model in the response type has a schema registered with
+    openshift.client.protobuf.register_schemas. Protobuf responses are decoded into the
+    same models as JSON. Streaming calls made with _preload_content=False only get
+    protobuf inside a protobuf_stream() block, because their callers read the body
+    themselves.
+
+    Setting compression (or a compression attribute on the configuration) to True sends
+    Accept-Encoding: gzip, deflate with every request. Compressed bodies are decoded by
+    urllib3 as they are read, including streamed list and watch responses.
+
+    datetime fields are parsed with a fixed format RFC3339 parser, falling back to
+    dateutil for anything else. Setting timestamp_cache_size (or a timestamp_cache_size
+    attribute on the configuration) to a positive number keeps that many parsed
+    timestamps in an LRU cache, so the many identical timestamps of a large list are
+    parsed once and share one datetime object.
+
+    Setting intern_strings (or an intern_strings attribute on the configuration) to
+    True interns every dict key of a response, and the values of low cardinality
+    fields such as namespace, kind and labels, before they are deserialized. This is
+    meant for processes that keep many objects in memory. On Python 2, the interned
+    strings are byte strings, and non-ASCII ones are not interned.
+
+    submit() and map() run API calls on a ThreadPoolExecutor owned by the client, with
+    max_workers threads (or a max_workers attribute on the configuration, default 8),
+    unless map() is asked for more workers than that. The connection pool only keeps
+    configuration.connection_pool_maxsize connections per host, so keep that at least
+    as large as max_workers.
+
+    Setting qps (and optionally burst) on the configuration limits the client to qps
+    requests per second with a token bucket, shared by every API object built on the
+    client. To share one limit between clients, set a RateLimiter as rate_limiter on
+    the configuration or the clients instead. rate_limiter.metrics() reports how
+    often and for how long requests were held back.
+
+    A RetryPolicy set as retry_policy on the client or the configuration (or a
+    max_retries attribute on the configuration, for the default policy) sends
+    requests that failed with 429, a 5xx status or a connection error again, after
+    the server's Retry-After or an exponential backoff with jitter. Only idempotent
+    methods are retried, except on 429.
+
+    With coalesce_requests set on the configuration, threads that send the same GET
+    (same URL, query and headers) while an identical one is in flight wait for it
+    and share its response, each deserializing its own copy of the result.
+    singleflight.metrics() reports how many requests were saved. Streamed calls
+    (_preload_content=False), such as watches, are never shared.
+    """
+
+    # swagger type string -> converter(client, data)
+    _converters = {}
+    # model class -> (plan entries, has discriminator)
+    _plans = {}
+    # model class -> lazy subclass
+    _lazy_classes = {}
+    # type -> serializer(client, obj)
+    _serializers = {}
+
+    def __init__(self, configuration=None, header_name=None, header_value=None, cookie=None):
+        super(ApiClient, self).__init__(configuration, header_name, header_value, cookie)
+        self.response_format = getattr(self.configuration, 'response_format', MODEL_RESPONSES)
+        self.protobuf = getattr(self.configuration, 'protobuf', False)
+        self.compression = getattr(self.configuration, 'compression', False)
+        self.timestamp_cache_size = getattr(self.configuration, 'timestamp_cache_size', 0)
+        self.intern_strings = getattr(self.configuration, 'intern_strings', False)
+        self.protobuf_codec = ProtobufCodec(self._model_class)
+        self.max_workers = getattr(self.configuration, 'max_workers', 8)
+        self.rate_limiter = getattr(self.configuration, 'rate_limiter', None)
+        qps = getattr(self.configuration, 'qps', None)
+        if self.rate_limiter is None and qps:
+            self.rate_limiter = RateLimiter(qps, getattr(self.configuration, 'burst', None))
+        self.retry_policy = getattr(self.configuration, 'retry_policy', None)
+        max_retries = getattr(self.configuration, 'max_retries', None)
+        if self.retry_policy is None and max_retries:
+            self.retry_policy = RetryPolicy(max_retries)
+        self.singleflight = SingleFlight() if getattr(self.configuration, 'coalesce_requests', False) else None
+        self._executor = None
+        self._local = threading.local()
+
+    def __del__(self):
+        if getattr(self, '_executor', None) is not None:
+            self._executor.shutdown(wait=False)
+        super(ApiClient, self).__del__()
+
+    @property
+    def response_format(self):
+        return self._response_format
+
+    @response_format.setter
+    def response_format(self, value):
+        if value not in RESPONSE_FORMATS:
+            raise ValueError("response_format must be one of {}, got {}".format(', '.join(RESPONSE_FORMATS), value))
+        self._response_format = value
+
+    @property
+    def compression(self):
+        return self.default_headers.get('Accept-Encoding') == ACCEPT_ENCODING
+
+    @compression.setter
+    def compression(self, value):
+        if value:
+            self.set_default_header('Accept-Encoding', ACCEPT_ENCODING)
+        else:
+            self.default_headers.pop('Accept-Encoding', None)
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def submit(self, func, *args, **kwargs):
+        """ Run func(*args, **kwargs), e.g. an API method, on the client's executor and return a Future """
+        return self.executor.submit(func, *args, **kwargs)
+
+    def map(self, func, arguments, max_workers=None, timeout=None, return_futures=False, **kwargs):
+        """
+        Call func once per item of arguments, and return the results in the order of
+        arguments:
+
+            routes = api_client.map(oapi.read_namespaced_route, [(name, namespace), ...], max_workers=20)
+
+        At most max_workers calls are queued or running at a time, so a long or lazy
+        iterable of arguments never floods the executor. The calls run on the client's
+        executor, and the first ones start right away, like Executor.map. When
+        max_workers is larger than the client's max_workers, they run instead on an
+        executor of their own, created once iterating starts and shut down once the
+        results are consumed. The connection pool must be large enough for them. The
+        first exception raised by a call is raised from the iterator, and the calls
+        not started yet are cancelled.
+
+        :param func: callable, usually an API method.
+        :param arguments: iterable of argument tuples; any other item is passed as the only argument.
+        :param max_workers: maximum number of calls in flight, defaults to the client's max_workers.
+        :param timeout: seconds to wait for each result once it is next in line,
+                        concurrent.futures.TimeoutError is raised when it runs out.
+        :param return_futures: yield the Future of every call, once it is done, instead of
+                               its result. Exceptions are then left to the caller.
+        :param kwargs: keyword arguments passed to every call, e.g. _request_timeout.
+        :return: iterator of results, or of futures.
+        """
+        window = max_workers or self.max_workers
+        own_executor = window > self.max_workers
+        arguments = iter(arguments)
+        pending = deque()
+
+        def submit_next(executor):
+            for args in arguments:
+                pending.append(executor.submit(func, *(args if isinstance(args, tuple) else (args,)), **kwargs))
+                return True
+            return False
+
+        if not own_executor:
+            while len(pending) < window and submit_next(self.executor):
+                pass
+
+        def results():
+            executor = ThreadPoolExecutor(max_workers=window) if own_executor else self.executor
+            try:
+                while len(pending) < window and submit_next(executor):
+                    pass
+                while pending:
+                    future = pending.popleft()
+                    if return_futures:
+                        # raises TimeoutError like result(), but returns the call's exception
+                        future.exception(timeout)
+                        result = future
+                    else:
+                        result = future.result(timeout)
+                    submit_next(executor)
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+                if own_executor:
+                    executor.shutdown(wait=False)
+        return results()
+
+    @property
+    def timestamp_cache_size(self):
+        return self._datetime_cache.maxsize if self._datetime_cache is not None else 0
+
+    @timestamp_cache_size.setter
+    def timestamp_cache_size(self, value):
+        self._datetime_cache = DatetimeCache(value) if value else None
+
+    def select_header_accept(self, accepts):
+        accept = super(ApiClient, self).select_header_accept(accepts)
+        if self.protobuf and accepts and PROTOBUF in [x.lower() for x in accepts]:
+            # call_api drops protobuf again when the response cannot be decoded
+            return '{}, {}'.format(PROTOBUF, accept)
+        return accept
+
+    @contextmanager
+    def protobuf_stream(self):
+        """ Allow protobuf responses for streaming (_preload_content=False) calls made by this thread in the block """
+        self._local.protobuf_stream = True
         try:
-            return super(ApiClient, self).__deserialize(data, klass)
-        except AttributeError:
+            yield
+        finally:
+            self._local.protobuf_stream = False
+
+    def call_api(self, *args, **kwargs):
+        header_params = args[4] if len(args) > 4 else kwargs.get('header_params')
+        if header_params and header_params.get('Accept', '').startswith(PROTOBUF):
+            response_type = kwargs.get('response_type')
+            if kwargs.get('_preload_content', True):
+                use_protobuf = not kwargs.get('async') and response_type and self.protobuf_codec.supports(response_type)
+            else:
+                use_protobuf = getattr(self._local, 'protobuf_stream', False) and response_type and self.protobuf_codec.supports(response_type)
+
+            if not use_protobuf:
+                header_params['Accept'] = header_params['Accept'][len(PROTOBUF) + 2:]
+            elif kwargs.get('_preload_content', True):
+                return self._call_protobuf(response_type, args, kwargs)
+        return super(ApiClient, self).call_api(*args, **kwargs)
+
+    def _call_protobuf(self, response_type, args, kwargs):
+        """ Make a request that may be answered with protobuf, and deserialize whichever format comes back """
+        return_http_data_only = kwargs.get('_return_http_data_only')
+        kwargs.update(_preload_content=False, _return_http_data_only=True)
+        response = super(ApiClient, self).call_api(*args, **kwargs)
+        try:
+            data = response.data
+        finally:
+            response.release_conn()
+
+        if response.getheader('Content-Type', '').startswith(PROTOBUF):
+            data = self.protobuf_codec.decode(data, response_type)
+        else:
             try:
-                klass = getattr(models, klass)
-            except AttributeError:
-                klass = getattr(k8s_models, klass)
-            return super(ApiClient, self).__deserialize_model(data, klass)
+                data = json.loads(data.decode('utf8'))
+            except ValueError:
+                pass
+        return_data = self.deserialize_data(data, response_type)
+
+        if return_http_data_only:
+            return return_data
+        return return_data, response.status, response.getheaders()
+
+    def sanitize_for_serialization(self, obj):
+        """
+        Builds a JSON POST object, see kubernetes.client.ApiClient.sanitize_for_serialization.
+
+        Serializers are compiled per type the first time an object of that type is seen,
+        so serializing a model reads its (json key, getter) pairs from a cached tuple
+        instead of walking swagger_types and attribute_map for every object.
+        """
+        if obj is None:
+            return None
+        return self._serializer(type(obj))(self, obj)
+
+    @classmethod
+    def _serializer(cls, obj_type):
+        """ Return the cached serializer for a type, compiling it on first use """
+        serializer = cls._serializers.get(obj_type)
+        if serializer is None:
+            serializer = cls._serializers[obj_type] = cls._compile_serializer(obj_type)
+        return serializer
+
+    @classmethod
+    def _compile_serializer(cls, obj_type):
+        if issubclass(obj_type, cls.PRIMITIVE_TYPES):
+            return lambda client, obj: obj
+        if issubclass(obj_type, list):
+            def serialize_list(client, obj):
+                return [client.sanitize_for_serialization(item) for item in obj]
+            return serialize_list
+        if issubclass(obj_type, tuple):
+            def serialize_tuple(client, obj):
+                return tuple(client.sanitize_for_serialization(item) for item in obj)
+            return serialize_tuple
+        if issubclass(obj_type, (datetime, date)):
+            return lambda client, obj: obj.isoformat()
+        if issubclass(obj_type, dict):
+            def serialize_dict(client, obj):
+                return {key: client.sanitize_for_serialization(value) for key, value in iteritems(obj)}
+            return serialize_dict
+        if issubclass(obj_type, ResourceObject):
+            return lambda client, obj: obj.to_dict()
+        if not hasattr(obj_type, 'swagger_types'):
+            return lambda client, obj: super(ApiClient, client).sanitize_for_serialization(obj)
+
+        primitive_types = frozenset(cls.PRIMITIVE_TYPES)
+        # Generated properties only return the private attribute, so read that directly.
+        # Lazy models fill it in on first access, and the private attribute of a name
+        # like _continue is mangled, so those go through the property.
+        private = not hasattr(obj_type, '_lazy_data')
+        fields = tuple(
+            (obj_type.attribute_map[attr], operator.attrgetter('_' + attr if private and not attr.startswith('_') else attr))
+            for attr in obj_type.swagger_types or {}
+        )
+
+        def serialize_model(client, obj):
+            result = {}
+            for key, get in fields:
+                value = get(obj)
+                if value is not None:
+                    value_type = type(value)
+                    result[key] = value if value_type in primitive_types else client._serializer(value_type)(client, value)
+            return result
+        return serialize_model
+
+    def request(self, method, url, query_params=None, headers=None, **kwargs):
+        if self.singleflight is not None and method == 'GET' and kwargs.get('_preload_content', True):
+            key = (url, tuple(query_params or ()), tuple(sorted(iteritems(headers or {}))))
+            return self.singleflight.do(key, self._request, method, url, query_params, headers, **kwargs)
+        return self._request(method, url, query_params, headers, **kwargs)
+
+    def _request(self, method, *args, **kwargs):
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                return super(ApiClient, self).request(method, *args, **kwargs)
+            except ApiException as exc:
+                if self.retry_policy is None or not self.retry_policy.should_retry(attempt, method, exc.status):
+                    raise
+                self.retry_policy.sleep(attempt, exc.headers)
+            except CONNECTION_ERRORS:
+                if self.retry_policy is None or not self.retry_policy.should_retry(attempt, method):
+                    raise
+                self.retry_policy.sleep(attempt)
+            attempt += 1
+
+    def deserialize(self, response, response_type):
+        if response_type == 'file':
+            return super(ApiClient, self).deserialize(response, response_type)
+
+        try:
+            data = json.loads(response.data)
+        except ValueError:
+            data = response.data
+        return self.deserialize_data(data, response_type)
+
+    def deserialize_data(self, data, response_type):
+        """
+        Deserialize already decoded JSON according to response_format.
+
+        :param data: dict, list or str.
+        :param response_type: swagger type string, e.g. 'V1Build' or 'list[V1Build]'.
+        :return: model object, dict, list or ResourceObject.
+        """
+        if self.intern_strings:
+            data = intern_json(data)
+        if self._response_format in (MODEL_RESPONSES, LAZY_RESPONSES):
+            return self._ApiClient__deserialize(data, response_type)
+        if self._response_format == OBJECT_RESPONSES:
+            return wrap(data)
+        return data
+
+    def _ApiClient__deserialize(self, data, klass):
+        if data is None:
+            return None
+        if isinstance(klass, string_types):
+            return self._converter(klass)(self, data)
+        return self._class_converter(klass)(self, data)
+
+    @classmethod
+    def _converter(cls, klass):
+        """ Return the cached converter for a swagger type string, compiling it on first use """
+        converter = cls._converters.get(klass)
+        if converter is None:
+            converter = cls._converters[klass] = cls._compile_converter(klass)
+        return converter
+
+    @classmethod
+    def _compile_converter(cls, klass):
+        if klass.startswith('list['):
+            sub_converter = cls._converter(LIST_TYPE_RX.match(klass).group(1))
+
+            def convert_list(client, data):
+                return [None if item is None else sub_converter(client, item) for item in data]
+            return convert_list
+
+        if klass.startswith('dict('):
+            sub_converter = cls._converter(DICT_TYPE_RX.match(klass).group(2))
+
+            def convert_dict(client, data):
+                return {key: None if value is None else sub_converter(client, value)
+                        for key, value in iteritems(data)}
+            return convert_dict
+
+        if klass in cls.NATIVE_TYPES_MAPPING:
+            return cls._class_converter(cls.NATIVE_TYPES_MAPPING[klass])
+
+        model_class = cls._model_class(klass)
+
+        def convert_model(client, data):
+            return client._deserialize_model(data, model_class)
+        return convert_model
+
+    @classmethod
+    def _class_converter(cls, klass):
+        if klass in cls.PRIMITIVE_TYPES:
+            def convert_primitive(client, data):
+                try:
+                    return klass(data)
+                except UnicodeEncodeError:
+                    return text_type(data)
+                except TypeError:
+                    return data
+            return convert_primitive
+        if klass == object:
+            return lambda client, data: data
+        if klass == date:
+            return lambda client, data: client._ApiClient__deserialize_date(data)
+        if klass == datetime:
+            return lambda client, data: client._deserialize_datetime(data)
+        return lambda client, data: client._deserialize_model(data, klass)
+
+    def _deserialize_datetime(self, data):
+        if not isinstance(data, string_types):
+            return self._ApiClient__deserialize_datatime(data)
+        cache = self._datetime_cache
+        if cache is not None:
+            value = cache.get(data)
+            if value is not None:
+                return value
+
+        value = parse_rfc3339(data)
+        if value is None:
+            value = self._ApiClient__deserialize_datatime(data)
+        if cache is not None:
+            cache.set(data, value)
+        return value
+
+    @staticmethod
+    def _model_class(name):
+        klass = MODEL_REGISTRY.get(name)
+        if klass is None:
+            raise AttributeError("No model named {} in kubernetes.client.models or openshift.client.models".format(name))
+        return klass
+
+    @classmethod
+    def _plan(cls, klass):
+        """ Return the cached deserialization plan for a model class, building it on first use """
+        plan = cls._plans.get(klass)
+        if plan is None:
+            entries = tuple(
+                (klass.attribute_map[attr], attr, cls._converter(attr_type))
+                for attr, attr_type in iteritems(klass.swagger_types or {})
+            )
+            plan = cls._plans[klass] = (entries, hasattr(klass, 'get_real_child_model'))
+        return plan
+
+    @classmethod
+    def _lazy_class(cls, klass):
+        lazy_class = cls._lazy_classes.get(klass)
+        if lazy_class is None:
+            lazy_class = cls._lazy_classes[klass] = lazy_model_class(klass, cls._plan(klass)[0])
+        return lazy_class
+
+    def _deserialize_model(self, data, klass):
+        """
+        Deserializes a dict into an instance of klass using the cached plan.
+
+        :param data: dict, list.
+        :param klass: class literal.
+        :return: model object.
+        """
+        entries, has_discriminator = self._plan(klass)
+        if not entries and not has_discriminator:
+            return data
+
+        if self._response_format == LAZY_RESPONSES and not has_discriminator and isinstance(data, dict):
+            return new_lazy_model(self._lazy_class(klass), self, data)
+
+        kwargs = {}
+        if isinstance(data, (list, dict)):
+            for key, attr, convert in entries:
+                if key in data:
+                    value = data[key]
+                    kwargs[attr] = None if value is None else convert(self, value)
+
+        instance = klass(**kwargs)
 
+        if has_discriminator:
+            klass_name = instance.get_real_child_model(data)
+            if klass_name:
+                instance = self._ApiClient__deserialize(data, klass_name)
+        return instance
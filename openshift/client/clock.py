@@ -0,0 +1,8 @@
+from __future__ import absolute_import
+
+import time
+
+# Clock for deadlines, expiries and rate limits. Python 2 has no monotonic clock,
+# so it falls back to the wall clock there. Modules call clock.monotonic() rather
+# than importing the function, so that tests can set the time in one place.
+monotonic = getattr(time, 'monotonic', time.time)
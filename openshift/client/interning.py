@@ -0,0 +1,64 @@
+from __future__ import absolute_import
+
+from six import PY2, iteritems, string_types, text_type
+from six.moves import intern as _intern_str
+
+# JSON keys whose string values repeat across many objects. Fields like status and
+# image are objects in most kinds; only their plain string values are interned.
+INTERNED_FIELDS = frozenset([
+    'apiVersion', 'kind', 'namespace', 'generateName',
+    'phase', 'type', 'status', 'reason', 'operator', 'protocol', 'imagePullPolicy', 'restartPolicy',
+    'dnsPolicy', 'schedulerName', 'serviceAccount', 'serviceAccountName', 'terminationMessagePolicy',
+    'terminationMessagePath', 'fieldPath', 'resource', 'apiGroup', 'image', 'nodeName', 'host',
+])
+# JSON keys of label style string maps, whose string values are interned as well
+INTERNED_MAPS = frozenset(['labels', 'matchLabels', 'nodeSelector', 'selector'])
+
+if PY2:
+    def intern_string(value):
+        """
+        Return the canonical copy of a string. intern() only takes byte strings on
+        Python 2, so ASCII unicode strings are interned as the byte strings that
+        the models convert them to anyway, and other unicode strings are returned
+        as they are.
+        """
+        if isinstance(value, text_type):
+            try:
+                value = value.encode('ascii')
+            except UnicodeEncodeError:
+                return value
+        return _intern_str(value)
+else:
+    def intern_string(value):
+        """ Return the canonical copy of a string """
+        return _intern_str(value)
+
+
+def intern_json(data, fields=INTERNED_FIELDS, maps=INTERNED_MAPS):
+    """
+    Return a copy of decoded JSON where every dict key, the string values of the
+    given fields, and the string values of the given maps, are interned, so that
+    objects cached side by side share one copy of their namespaces, labels, kinds
+    and so on.
+
+    :param data: dict, list or scalar
+    :param fields: JSON keys whose string values are interned
+    :param maps: JSON keys of string maps whose string values are interned
+    """
+    return _intern_json(data, fields, maps, False)
+
+
+def _intern_json(data, fields, maps, in_map):
+    if isinstance(data, dict):
+        result = {}
+        for key, value in iteritems(data):
+            if isinstance(value, string_types):
+                if in_map or key in fields:
+                    value = intern_string(value)
+            elif isinstance(value, (dict, list)):
+                value = _intern_json(value, fields, maps, key in maps)
+            result[intern_string(key)] = value
+        return result
+    if isinstance(data, list):
+        return [_intern_json(item, fields, maps, False) if isinstance(item, (dict, list)) else item for item in data]
+    return data
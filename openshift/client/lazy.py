@@ -0,0 +1,111 @@
+from __future__ import absolute_import
+
+import copy
+
+from six import iteritems
+
+_UNSET = object()
+
+
+def private_name(model_class, attr):
+    """
+    Name of the attribute a generated property of model_class keeps its value in.
+    For a property like _continue that is self.__continue, which Python mangles to
+    _V1ListMeta__continue.
+    """
+    private = '_' + attr
+    if private.startswith('__'):
+        return '_' + model_class.__name__.lstrip('_') + private
+    return private
+
+
+def _lazy_property(model_class, key, attr, convert):
+    private = private_name(model_class, attr)
+    model_setter = getattr(model_class, attr).fset
+
+    def fget(self):
+        value = getattr(self, private, _UNSET)
+        if value is _UNSET:
+            value = self._lazy_data.get(key)
+            if value is not None:
+                value = convert(self._lazy_client, value)
+            setattr(self, private, value)
+        return value
+
+    def fset(self, value):
+        model_setter(self, value)
+
+    return property(fget, fset, doc=getattr(model_class, attr).__doc__)
+
+
+def _lazy_eq(self, other):
+    if not isinstance(other, self._model_class):
+        return False
+    return self.to_dict() == other.to_dict()
+
+
+def _lazy_ne(self, other):
+    return not self == other
+
+
+def _lazy_deepcopy(self, memo):
+    # the copy shares the client, and converts the attributes not read yet from its own copy of the data
+    duplicate = new_lazy_model(type(self), self._lazy_client, None)
+    memo[id(self)] = duplicate
+    duplicate._lazy_data = copy.deepcopy(self._lazy_data, memo)
+    for attr in self.swagger_types:
+        private = private_name(self._model_class, attr)
+        value = getattr(self, private, _UNSET)
+        if value is not _UNSET:
+            setattr(duplicate, private, copy.deepcopy(value, memo))
+    return duplicate
+
+
+def _lazy_reduce_ex(self, protocol):
+    # pickle and copy.copy see an instance of the model class, with every attribute converted
+    return _materialized, (self._model_class, dict((attr, getattr(self, attr)) for attr in self.swagger_types))
+
+
+def _materialized(model_class, values):
+    instance = model_class.__new__(model_class)
+    instance.discriminator = None
+    for attr, value in iteritems(values):
+        setattr(instance, private_name(model_class, attr), value)
+    return instance
+
+
+def lazy_model_class(model_class, entries):
+    """
+    Create a subclass of model_class that keeps the decoded JSON for an object and
+    only converts an attribute, and builds any nested model, the first time the
+    attribute is read. Instances pass isinstance checks for model_class, and their
+    setters still run the model's validation. copy.deepcopy keeps them lazy and
+    shares the client; pickling converts them to model_class.
+
+    :param model_class: a generated model class
+    :param entries: the (json key, attribute, converter) deserialization plan for model_class
+    :return: class
+    """
+    namespace = {
+        '__slots__': ('_lazy_client', '_lazy_data'),
+        '__doc__': model_class.__doc__,
+        '__module__': model_class.__module__,
+        '__eq__': _lazy_eq,
+        '__ne__': _lazy_ne,
+        '__hash__': None,
+        '__deepcopy__': _lazy_deepcopy,
+        '__reduce_ex__': _lazy_reduce_ex,
+        '_model_class': model_class,
+    }
+    for key, attr, convert in entries:
+        namespace[attr] = _lazy_property(model_class, key, attr, convert)
+    return type(model_class.__name__, (model_class,), namespace)
+
+
+def new_lazy_model(lazy_class, client, data):
+    """ Create an instance of a lazy model class without running the model's __init__ """
+    instance = lazy_class.__new__(lazy_class)
+    instance._lazy_client = client
+    instance._lazy_data = data
+    instance.discriminator = None
+    return instance
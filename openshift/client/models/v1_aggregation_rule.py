@@ -38,6 +38,11 @@ class V1AggregationRule(object):
         'cluster_role_selectors': 'clusterRoleSelectors'
     }
 
+    __slots__ = (
+        '_cluster_role_selectors',
+        'discriminator'
+    )
+
     def __init__(self, cluster_role_selectors=None):
         """
         V1AggregationRule - a model defined in Swagger
@@ -117,10 +122,32 @@ class V1AggregationRule(object):
         if not isinstance(other, V1AggregationRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1AggregationRule' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -38,6 +38,11 @@ class V1AllowedFlexVolume(object):
         'driver': 'driver'
     }
 
+    __slots__ = (
+        '_driver',
+        'discriminator'
+    )
+
     def __init__(self, driver=None):
         """
         V1AllowedFlexVolume - a model defined in Swagger
@@ -117,10 +122,32 @@ class V1AllowedFlexVolume(object):
         if not isinstance(other, V1AllowedFlexVolume):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1AllowedFlexVolume' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
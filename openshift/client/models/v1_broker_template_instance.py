@@ -44,6 +44,14 @@ class V1BrokerTemplateInstance(object):
         'spec': 'spec'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_spec',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, spec=None):
         """
         V1BrokerTemplateInstance - a model defined in Swagger
@@ -202,10 +210,32 @@ class V1BrokerTemplateInstance(object):
         if not isinstance(other, V1BrokerTemplateInstance):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BrokerTemplateInstance' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
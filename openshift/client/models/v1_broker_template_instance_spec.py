@@ -42,6 +42,13 @@ class V1BrokerTemplateInstanceSpec(object):
         'template_instance': 'templateInstance'
     }
 
+    __slots__ = (
+        '_binding_i_ds',
+        '_secret',
+        '_template_instance',
+        'discriminator'
+    )
+
     def __init__(self, binding_i_ds=None, secret=None, template_instance=None):
         """
         V1BrokerTemplateInstanceSpec - a model defined in Swagger
@@ -175,10 +182,32 @@ class V1BrokerTemplateInstanceSpec(object):
         if not isinstance(other, V1BrokerTemplateInstanceSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BrokerTemplateInstanceSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -62,6 +62,23 @@ class V1BuildConfigSpec(object):
         'triggers': 'triggers'
     }
 
+    __slots__ = (
+        '_completion_deadline_seconds',
+        '_failed_builds_history_limit',
+        '_node_selector',
+        '_output',
+        '_post_commit',
+        '_resources',
+        '_revision',
+        '_run_policy',
+        '_service_account',
+        '_source',
+        '_strategy',
+        '_successful_builds_history_limit',
+        '_triggers',
+        'discriminator'
+    )
+
     def __init__(self, completion_deadline_seconds=None, failed_builds_history_limit=None, node_selector=None, output=None, post_commit=None, resources=None, revision=None, run_policy=None, service_account=None, source=None, strategy=None, successful_builds_history_limit=None, triggers=None):
         """
         V1BuildConfigSpec - a model defined in Swagger
@@ -454,10 +471,32 @@ class V1BuildConfigSpec(object):
         if not isinstance(other, V1BuildConfigSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BuildConfigSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
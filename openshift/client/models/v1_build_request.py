@@ -60,6 +60,22 @@ class V1BuildRequest(object):
         'triggered_by_image': 'triggeredByImage'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_binary',
+        '_docker_strategy_options',
+        '_env',
+        '__from',
+        '_kind',
+        '_last_version',
+        '_metadata',
+        '_revision',
+        '_source_strategy_options',
+        '_triggered_by',
+        '_triggered_by_image',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, binary=None, docker_strategy_options=None, env=None, _from=None, kind=None, last_version=None, metadata=None, revision=None, source_strategy_options=None, triggered_by=None, triggered_by_image=None):
         """
         V1BuildRequest - a model defined in Swagger
@@ -426,10 +442,32 @@ class V1BuildRequest(object):
         if not isinstance(other, V1BuildRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BuildRequest' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -52,6 +52,18 @@ class V1BuildSource(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_binary',
+        '_context_dir',
+        '_dockerfile',
+        '_git',
+        '_images',
+        '_secrets',
+        '_source_secret',
+        '_type',
+        'discriminator'
+    )
+
     def __init__(self, binary=None, context_dir=None, dockerfile=None, git=None, images=None, secrets=None, source_secret=None, type=None):
         """
         V1BuildSource - a model defined in Swagger
@@ -314,10 +326,32 @@ class V1BuildSource(object):
         if not isinstance(other, V1BuildSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BuildSource' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
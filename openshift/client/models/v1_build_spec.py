@@ -56,6 +56,20 @@ class V1BuildSpec(object):
         'triggered_by': 'triggeredBy'
     }
 
+    __slots__ = (
+        '_completion_deadline_seconds',
+        '_node_selector',
+        '_output',
+        '_post_commit',
+        '_resources',
+        '_revision',
+        '_service_account',
+        '_source',
+        '_strategy',
+        '_triggered_by',
+        'discriminator'
+    )
+
     def __init__(self, completion_deadline_seconds=None, node_selector=None, output=None, post_commit=None, resources=None, revision=None, service_account=None, source=None, strategy=None, triggered_by=None):
         """
         V1BuildSpec - a model defined in Swagger
@@ -372,10 +386,32 @@ class V1BuildSpec(object):
         if not isinstance(other, V1BuildSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BuildSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
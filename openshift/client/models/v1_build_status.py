@@ -60,6 +60,22 @@ class V1BuildStatus(object):
         'start_timestamp': 'startTimestamp'
     }
 
+    __slots__ = (
+        '_cancelled',
+        '_completion_timestamp',
+        '_config',
+        '_duration',
+        '_log_snippet',
+        '_message',
+        '_output',
+        '_output_docker_image_reference',
+        '_phase',
+        '_reason',
+        '_stages',
+        '_start_timestamp',
+        'discriminator'
+    )
+
     def __init__(self, cancelled=None, completion_timestamp=None, config=None, duration=None, log_snippet=None, message=None, output=None, output_docker_image_reference=None, phase=None, reason=None, stages=None, start_timestamp=None):
         """
         V1BuildStatus - a model defined in Swagger
@@ -426,10 +442,32 @@ class V1BuildStatus(object):
         if not isinstance(other, V1BuildStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BuildStatus' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -46,6 +46,15 @@ class V1BuildStrategy(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_custom_strategy',
+        '_docker_strategy',
+        '_jenkins_pipeline_strategy',
+        '_source_strategy',
+        '_type',
+        'discriminator'
+    )
+
     def __init__(self, custom_strategy=None, docker_strategy=None, jenkins_pipeline_strategy=None, source_strategy=None, type=None):
         """
         V1BuildStrategy - a model defined in Swagger
@@ -230,10 +239,32 @@ class V1BuildStrategy(object):
         if not isinstance(other, V1BuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BuildStrategy' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
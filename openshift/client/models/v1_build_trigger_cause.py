@@ -48,6 +48,16 @@ class V1BuildTriggerCause(object):
         'message': 'message'
     }
 
+    __slots__ = (
+        '_bitbucket_web_hook',
+        '_generic_web_hook',
+        '_github_web_hook',
+        '_gitlab_web_hook',
+        '_image_change_build',
+        '_message',
+        'discriminator'
+    )
+
     def __init__(self, bitbucket_web_hook=None, generic_web_hook=None, github_web_hook=None, gitlab_web_hook=None, image_change_build=None, message=None):
         """
         V1BuildTriggerCause - a model defined in Swagger
@@ -257,10 +267,32 @@ class V1BuildTriggerCause(object):
         if not isinstance(other, V1BuildTriggerCause):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BuildTriggerCause' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -48,6 +48,16 @@ class V1BuildTriggerPolicy(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_bitbucket',
+        '_generic',
+        '_github',
+        '_gitlab',
+        '_image_change',
+        '_type',
+        'discriminator'
+    )
+
     def __init__(self, bitbucket=None, generic=None, github=None, gitlab=None, image_change=None, type=None):
         """
         V1BuildTriggerPolicy - a model defined in Swagger
@@ -258,10 +268,32 @@ class V1BuildTriggerPolicy(object):
         if not isinstance(other, V1BuildTriggerPolicy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1BuildTriggerPolicy' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -52,6 +52,18 @@ class V1ClusterNetwork(object):
         'service_network': 'serviceNetwork'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_cluster_networks',
+        '_hostsubnetlength',
+        '_kind',
+        '_metadata',
+        '_network',
+        '_plugin_name',
+        '_service_network',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, cluster_networks=None, hostsubnetlength=None, kind=None, metadata=None, network=None, plugin_name=None, service_network=None):
         """
         V1ClusterNetwork - a model defined in Swagger
@@ -315,10 +327,32 @@ class V1ClusterNetwork(object):
         if not isinstance(other, V1ClusterNetwork):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ClusterNetwork' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
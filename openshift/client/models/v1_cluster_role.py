@@ -46,6 +46,15 @@ class V1ClusterRole(object):
         'rules': 'rules'
     }
 
+    __slots__ = (
+        '_aggregation_rule',
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_rules',
+        'discriminator'
+    )
+
     def __init__(self, aggregation_rule=None, api_version=None, kind=None, metadata=None, rules=None):
         """
         V1ClusterRole - a model defined in Swagger
@@ -230,10 +239,32 @@ class V1ClusterRole(object):
         if not isinstance(other, V1ClusterRole):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ClusterRole' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
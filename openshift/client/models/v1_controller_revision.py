@@ -46,6 +46,15 @@ class V1ControllerRevision(object):
         'revision': 'revision'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_data',
+        '_kind',
+        '_metadata',
+        '_revision',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, data=None, kind=None, metadata=None, revision=None):
         """
         V1ControllerRevision - a model defined in Swagger
@@ -230,10 +239,32 @@ class V1ControllerRevision(object):
         if not isinstance(other, V1ControllerRevision):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ControllerRevision' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
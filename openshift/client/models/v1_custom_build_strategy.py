@@ -50,6 +50,17 @@ class V1CustomBuildStrategy(object):
         'secrets': 'secrets'
     }
 
+    __slots__ = (
+        '_build_api_version',
+        '_env',
+        '_expose_docker_socket',
+        '_force_pull',
+        '__from',
+        '_pull_secret',
+        '_secrets',
+        'discriminator'
+    )
+
     def __init__(self, build_api_version=None, env=None, expose_docker_socket=None, force_pull=None, _from=None, pull_secret=None, secrets=None):
         """
         V1CustomBuildStrategy - a model defined in Swagger
@@ -286,10 +297,32 @@ class V1CustomBuildStrategy(object):
         if not isinstance(other, V1CustomBuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1CustomBuildStrategy' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
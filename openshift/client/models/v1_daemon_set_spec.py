@@ -46,6 +46,15 @@ class V1DaemonSetSpec(object):
         'update_strategy': 'updateStrategy'
     }
 
+    __slots__ = (
+        '_min_ready_seconds',
+        '_revision_history_limit',
+        '_selector',
+        '_template',
+        '_update_strategy',
+        'discriminator'
+    )
+
     def __init__(self, min_ready_seconds=None, revision_history_limit=None, selector=None, template=None, update_strategy=None):
         """
         V1DaemonSetSpec - a model defined in Swagger
@@ -231,10 +240,32 @@ class V1DaemonSetSpec(object):
         if not isinstance(other, V1DaemonSetSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DaemonSetSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -56,6 +56,20 @@ class V1DaemonSetStatus(object):
         'updated_number_scheduled': 'updatedNumberScheduled'
     }
 
+    __slots__ = (
+        '_collision_count',
+        '_conditions',
+        '_current_number_scheduled',
+        '_desired_number_scheduled',
+        '_number_available',
+        '_number_misscheduled',
+        '_number_ready',
+        '_number_unavailable',
+        '_observed_generation',
+        '_updated_number_scheduled',
+        'discriminator'
+    )
+
     def __init__(self, collision_count=None, conditions=None, current_number_scheduled=None, desired_number_scheduled=None, number_available=None, number_misscheduled=None, number_ready=None, number_unavailable=None, observed_generation=None, updated_number_scheduled=None):
         """
         V1DaemonSetStatus - a model defined in Swagger
@@ -373,10 +387,32 @@ class V1DaemonSetStatus(object):
         if not isinstance(other, V1DaemonSetStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DaemonSetStatus' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -46,6 +46,15 @@ class V1DeploymentConfigRollback(object):
         'updated_annotations': 'updatedAnnotations'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_name',
+        '_spec',
+        '_updated_annotations',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, kind=None, name=None, spec=None, updated_annotations=None):
         """
         V1DeploymentConfigRollback - a model defined in Swagger
@@ -231,10 +240,32 @@ class V1DeploymentConfigRollback(object):
         if not isinstance(other, V1DeploymentConfigRollback):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DeploymentConfigRollback' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -48,6 +48,16 @@ class V1DeploymentConfigRollbackSpec(object):
         'revision': 'revision'
     }
 
+    __slots__ = (
+        '__from',
+        '_include_replication_meta',
+        '_include_strategy',
+        '_include_template',
+        '_include_triggers',
+        '_revision',
+        'discriminator'
+    )
+
     def __init__(self, _from=None, include_replication_meta=None, include_strategy=None, include_template=None, include_triggers=None, revision=None):
         """
         V1DeploymentConfigRollbackSpec - a model defined in Swagger
@@ -262,10 +272,32 @@ class V1DeploymentConfigRollbackSpec(object):
         if not isinstance(other, V1DeploymentConfigRollbackSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DeploymentConfigRollbackSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -54,6 +54,19 @@ class V1DeploymentConfigSpec(object):
         'triggers': 'triggers'
     }
 
+    __slots__ = (
+        '_min_ready_seconds',
+        '_paused',
+        '_replicas',
+        '_revision_history_limit',
+        '_selector',
+        '_strategy',
+        '_template',
+        '_test',
+        '_triggers',
+        'discriminator'
+    )
+
     def __init__(self, min_ready_seconds=None, paused=None, replicas=None, revision_history_limit=None, selector=None, strategy=None, template=None, test=None, triggers=None):
         """
         V1DeploymentConfigSpec - a model defined in Swagger
@@ -341,10 +354,32 @@ class V1DeploymentConfigSpec(object):
         if not isinstance(other, V1DeploymentConfigSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DeploymentConfigSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
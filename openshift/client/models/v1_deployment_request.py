@@ -48,6 +48,16 @@ class V1DeploymentRequest(object):
         'name': 'name'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_exclude_triggers',
+        '_force',
+        '_kind',
+        '_latest',
+        '_name',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, exclude_triggers=None, force=None, kind=None, latest=None, name=None):
         """
         V1DeploymentRequest - a model defined in Swagger
@@ -260,10 +270,32 @@ class V1DeploymentRequest(object):
         if not isinstance(other, V1DeploymentRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DeploymentRequest' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -52,6 +52,18 @@ class V1DeploymentStrategy(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_active_deadline_seconds',
+        '_annotations',
+        '_custom_params',
+        '_labels',
+        '_recreate_params',
+        '_resources',
+        '_rolling_params',
+        '_type',
+        'discriminator'
+    )
+
     def __init__(self, active_deadline_seconds=None, annotations=None, custom_params=None, labels=None, recreate_params=None, resources=None, rolling_params=None, type=None):
         """
         V1DeploymentStrategy - a model defined in Swagger
@@ -313,10 +325,32 @@ class V1DeploymentStrategy(object):
         if not isinstance(other, V1DeploymentStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DeploymentStrategy' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -44,6 +44,14 @@ class V1DeploymentTriggerImageChangeParams(object):
         'last_triggered_image': 'lastTriggeredImage'
     }
 
+    __slots__ = (
+        '_automatic',
+        '_container_names',
+        '__from',
+        '_last_triggered_image',
+        'discriminator'
+    )
+
     def __init__(self, automatic=None, container_names=None, _from=None, last_triggered_image=None):
         """
         V1DeploymentTriggerImageChangeParams - a model defined in Swagger
@@ -202,10 +210,32 @@ class V1DeploymentTriggerImageChangeParams(object):
         if not isinstance(other, V1DeploymentTriggerImageChangeParams):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DeploymentTriggerImageChangeParams' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
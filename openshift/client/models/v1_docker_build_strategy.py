@@ -52,6 +52,18 @@ class V1DockerBuildStrategy(object):
         'pull_secret': 'pullSecret'
     }
 
+    __slots__ = (
+        '_build_args',
+        '_dockerfile_path',
+        '_env',
+        '_force_pull',
+        '__from',
+        '_image_optimization_policy',
+        '_no_cache',
+        '_pull_secret',
+        'discriminator'
+    )
+
     def __init__(self, build_args=None, dockerfile_path=None, env=None, force_pull=None, _from=None, image_optimization_policy=None, no_cache=None, pull_secret=None):
         """
         V1DockerBuildStrategy - a model defined in Swagger
@@ -313,10 +325,32 @@ class V1DockerBuildStrategy(object):
         if not isinstance(other, V1DockerBuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1DockerBuildStrategy' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -44,6 +44,14 @@ class V1ExecNewPodHook(object):
         'volumes': 'volumes'
     }
 
+    __slots__ = (
+        '_command',
+        '_container_name',
+        '_env',
+        '_volumes',
+        'discriminator'
+    )
+
     def __init__(self, command=None, container_name=None, env=None, volumes=None):
         """
         V1ExecNewPodHook - a model defined in Swagger
@@ -203,10 +211,32 @@ class V1ExecNewPodHook(object):
         if not isinstance(other, V1ExecNewPodHook):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ExecNewPodHook' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -46,6 +46,15 @@ class V1GitBuildSource(object):
         'uri': 'uri'
     }
 
+    __slots__ = (
+        '_http_proxy',
+        '_https_proxy',
+        '_no_proxy',
+        '_ref',
+        '_uri',
+        'discriminator'
+    )
+
     def __init__(self, http_proxy=None, https_proxy=None, no_proxy=None, ref=None, uri=None):
         """
         V1GitBuildSource - a model defined in Swagger
@@ -230,10 +239,32 @@ class V1GitBuildSource(object):
         if not isinstance(other, V1GitBuildSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1GitBuildSource' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -44,6 +44,14 @@ class V1GitSourceRevision(object):
         'message': 'message'
     }
 
+    __slots__ = (
+        '_author',
+        '_commit',
+        '_committer',
+        '_message',
+        'discriminator'
+    )
+
     def __init__(self, author=None, commit=None, committer=None, message=None):
         """
         V1GitSourceRevision - a model defined in Swagger
@@ -201,10 +209,32 @@ class V1GitSourceRevision(object):
         if not isinstance(other, V1GitSourceRevision):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1GitSourceRevision' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -50,6 +50,17 @@ class V1HostSubnet(object):
         'subnet': 'subnet'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_egress_i_ps',
+        '_host',
+        '_host_ip',
+        '_kind',
+        '_metadata',
+        '_subnet',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, egress_i_ps=None, host=None, host_ip=None, kind=None, metadata=None, subnet=None):
         """
         V1HostSubnet - a model defined in Swagger
@@ -288,10 +299,32 @@ class V1HostSubnet(object):
         if not isinstance(other, V1HostSubnet):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1HostSubnet' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
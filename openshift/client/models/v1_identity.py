@@ -50,6 +50,17 @@ class V1Identity(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_extra',
+        '_kind',
+        '_metadata',
+        '_provider_name',
+        '_provider_user_name',
+        '_user',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, extra=None, kind=None, metadata=None, provider_name=None, provider_user_name=None, user=None):
         """
         V1Identity - a model defined in Swagger
@@ -288,10 +299,32 @@ class V1Identity(object):
         if not isinstance(other, V1Identity):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1Identity' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
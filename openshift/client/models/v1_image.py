@@ -60,6 +60,22 @@ class V1Image(object):
         'signatures': 'signatures'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_docker_image_config',
+        '_docker_image_layers',
+        '_docker_image_manifest',
+        '_docker_image_manifest_media_type',
+        '_docker_image_metadata',
+        '_docker_image_metadata_version',
+        '_docker_image_reference',
+        '_docker_image_signatures',
+        '_kind',
+        '_metadata',
+        '_signatures',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, docker_image_config=None, docker_image_layers=None, docker_image_manifest=None, docker_image_manifest_media_type=None, docker_image_metadata=None, docker_image_metadata_version=None, docker_image_reference=None, docker_image_signatures=None, kind=None, metadata=None, signatures=None):
         """
         V1Image - a model defined in Swagger
@@ -426,10 +442,32 @@ class V1Image(object):
         if not isinstance(other, V1Image):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1Image' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
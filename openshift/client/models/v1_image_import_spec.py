@@ -46,6 +46,15 @@ class V1ImageImportSpec(object):
         'to': 'to'
     }
 
+    __slots__ = (
+        '__from',
+        '_import_policy',
+        '_include_manifest',
+        '_reference_policy',
+        '_to',
+        'discriminator'
+    )
+
     def __init__(self, _from=None, import_policy=None, include_manifest=None, reference_policy=None, to=None):
         """
         V1ImageImportSpec - a model defined in Swagger
@@ -230,10 +239,32 @@ class V1ImageImportSpec(object):
         if not isinstance(other, V1ImageImportSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ImageImportSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -58,6 +58,21 @@ class V1ImageSignature(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_conditions',
+        '_content',
+        '_created',
+        '_image_identity',
+        '_issued_by',
+        '_issued_to',
+        '_kind',
+        '_metadata',
+        '_signed_claims',
+        '_type',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, conditions=None, content=None, created=None, image_identity=None, issued_by=None, issued_to=None, kind=None, metadata=None, signed_claims=None, type=None):
         """
         V1ImageSignature - a model defined in Swagger
@@ -401,10 +416,32 @@ class V1ImageSignature(object):
         if not isinstance(other, V1ImageSignature):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ImageSignature' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
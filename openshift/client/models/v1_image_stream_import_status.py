@@ -42,6 +42,13 @@ class V1ImageStreamImportStatus(object):
         'repository': 'repository'
     }
 
+    __slots__ = (
+        '_images',
+        '__import',
+        '_repository',
+        'discriminator'
+    )
+
     def __init__(self, images=None, _import=None, repository=None):
         """
         V1ImageStreamImportStatus - a model defined in Swagger
@@ -173,10 +180,32 @@ class V1ImageStreamImportStatus(object):
         if not isinstance(other, V1ImageStreamImportStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ImageStreamImportStatus' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -46,6 +46,15 @@ class V1ImageStreamMapping(object):
         'tag': 'tag'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_image',
+        '_kind',
+        '_metadata',
+        '_tag',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, image=None, kind=None, metadata=None, tag=None):
         """
         V1ImageStreamMapping - a model defined in Swagger
@@ -231,10 +240,32 @@ class V1ImageStreamMapping(object):
         if not isinstance(other, V1ImageStreamMapping):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ImageStreamMapping' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
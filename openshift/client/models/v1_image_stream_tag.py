@@ -52,6 +52,18 @@ class V1ImageStreamTag(object):
         'tag': 'tag'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_conditions',
+        '_generation',
+        '_image',
+        '_kind',
+        '_lookup_policy',
+        '_metadata',
+        '_tag',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, conditions=None, generation=None, image=None, kind=None, lookup_policy=None, metadata=None, tag=None):
         """
         V1ImageStreamTag - a model defined in Swagger
@@ -317,10 +329,32 @@ class V1ImageStreamTag(object):
         if not isinstance(other, V1ImageStreamTag):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ImageStreamTag' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -58,6 +58,21 @@ class V1ISCSIPersistentVolumeSource(object):
         'target_portal': 'targetPortal'
     }
 
+    __slots__ = (
+        '_chap_auth_discovery',
+        '_chap_auth_session',
+        '_fs_type',
+        '_initiator_name',
+        '_iqn',
+        '_iscsi_interface',
+        '_lun',
+        '_portals',
+        '_read_only',
+        '_secret_ref',
+        '_target_portal',
+        'discriminator'
+    )
+
     def __init__(self, chap_auth_discovery=None, chap_auth_session=None, fs_type=None, initiator_name=None, iqn=None, iscsi_interface=None, lun=None, portals=None, read_only=None, secret_ref=None, target_portal=None):
         """
         V1ISCSIPersistentVolumeSource - a model defined in Swagger
@@ -400,10 +415,32 @@ class V1ISCSIPersistentVolumeSource(object):
         if not isinstance(other, V1ISCSIPersistentVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ISCSIPersistentVolumeSource' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -42,6 +42,13 @@ class V1LifecycleHook(object):
         'tag_images': 'tagImages'
     }
 
+    __slots__ = (
+        '_exec_new_pod',
+        '_failure_policy',
+        '_tag_images',
+        'discriminator'
+    )
+
     def __init__(self, exec_new_pod=None, failure_policy=None, tag_images=None):
         """
         V1LifecycleHook - a model defined in Swagger
@@ -174,10 +181,32 @@ class V1LifecycleHook(object):
         if not isinstance(other, V1LifecycleHook):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1LifecycleHook' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -58,6 +58,21 @@ class V1LocalResourceAccessReview(object):
         'verb': 'verb'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_content',
+        '_is_non_resource_url',
+        '_kind',
+        '_namespace',
+        '_path',
+        '_resource',
+        '_resource_api_group',
+        '_resource_api_version',
+        '_resource_name',
+        '_verb',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, content=None, is_non_resource_url=None, kind=None, namespace=None, path=None, resource=None, resource_api_group=None, resource_api_version=None, resource_name=None, verb=None):
         """
         V1LocalResourceAccessReview - a model defined in Swagger
@@ -405,10 +420,32 @@ class V1LocalResourceAccessReview(object):
         if not isinstance(other, V1LocalResourceAccessReview):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1LocalResourceAccessReview' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -64,6 +64,24 @@ class V1LocalSubjectAccessReview(object):
         'verb': 'verb'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_content',
+        '_groups',
+        '_is_non_resource_url',
+        '_kind',
+        '_namespace',
+        '_path',
+        '_resource',
+        '_resource_api_group',
+        '_resource_api_version',
+        '_resource_name',
+        '_scopes',
+        '_user',
+        '_verb',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, content=None, groups=None, is_non_resource_url=None, kind=None, namespace=None, path=None, resource=None, resource_api_group=None, resource_api_version=None, resource_name=None, scopes=None, user=None, verb=None):
         """
         V1LocalSubjectAccessReview - a model defined in Swagger
@@ -492,10 +510,32 @@ class V1LocalSubjectAccessReview(object):
         if not isinstance(other, V1LocalSubjectAccessReview):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1LocalSubjectAccessReview' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
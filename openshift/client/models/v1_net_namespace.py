@@ -48,6 +48,16 @@ class V1NetNamespace(object):
         'netname': 'netname'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_egress_i_ps',
+        '_kind',
+        '_metadata',
+        '_netid',
+        '_netname',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, egress_i_ps=None, kind=None, metadata=None, netid=None, netname=None):
         """
         V1NetNamespace - a model defined in Swagger
@@ -259,10 +269,32 @@ class V1NetNamespace(object):
         if not isinstance(other, V1NetNamespace):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1NetNamespace' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -60,6 +60,22 @@ class V1OAuthAccessToken(object):
         'user_uid': 'userUID'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_authorize_token',
+        '_client_name',
+        '_expires_in',
+        '_inactivity_timeout_seconds',
+        '_kind',
+        '_metadata',
+        '_redirect_uri',
+        '_refresh_token',
+        '_scopes',
+        '_user_name',
+        '_user_uid',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, authorize_token=None, client_name=None, expires_in=None, inactivity_timeout_seconds=None, kind=None, metadata=None, redirect_uri=None, refresh_token=None, scopes=None, user_name=None, user_uid=None):
         """
         V1OAuthAccessToken - a model defined in Swagger
@@ -425,10 +441,32 @@ class V1OAuthAccessToken(object):
         if not isinstance(other, V1OAuthAccessToken):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1OAuthAccessToken' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
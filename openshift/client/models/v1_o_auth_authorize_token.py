@@ -60,6 +60,22 @@ class V1OAuthAuthorizeToken(object):
         'user_uid': 'userUID'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_client_name',
+        '_code_challenge',
+        '_code_challenge_method',
+        '_expires_in',
+        '_kind',
+        '_metadata',
+        '_redirect_uri',
+        '_scopes',
+        '_state',
+        '_user_name',
+        '_user_uid',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, client_name=None, code_challenge=None, code_challenge_method=None, expires_in=None, kind=None, metadata=None, redirect_uri=None, scopes=None, state=None, user_name=None, user_uid=None):
         """
         V1OAuthAuthorizeToken - a model defined in Swagger
@@ -425,10 +441,32 @@ class V1OAuthAuthorizeToken(object):
         if not isinstance(other, V1OAuthAuthorizeToken):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1OAuthAuthorizeToken' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
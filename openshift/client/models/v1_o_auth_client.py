@@ -58,6 +58,21 @@ class V1OAuthClient(object):
         'secret': 'secret'
     }
 
+    __slots__ = (
+        '_access_token_inactivity_timeout_seconds',
+        '_access_token_max_age_seconds',
+        '_additional_secrets',
+        '_api_version',
+        '_grant_method',
+        '_kind',
+        '_metadata',
+        '_redirect_ur_is',
+        '_respond_with_challenges',
+        '_scope_restrictions',
+        '_secret',
+        'discriminator'
+    )
+
     def __init__(self, access_token_inactivity_timeout_seconds=None, access_token_max_age_seconds=None, additional_secrets=None, api_version=None, grant_method=None, kind=None, metadata=None, redirect_ur_is=None, respond_with_challenges=None, scope_restrictions=None, secret=None):
         """
         V1OAuthClient - a model defined in Swagger
@@ -397,10 +412,32 @@ class V1OAuthClient(object):
         if not isinstance(other, V1OAuthClient):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1OAuthClient' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
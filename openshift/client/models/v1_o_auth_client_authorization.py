@@ -50,6 +50,17 @@ class V1OAuthClientAuthorization(object):
         'user_uid': 'userUID'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_client_name',
+        '_kind',
+        '_metadata',
+        '_scopes',
+        '_user_name',
+        '_user_uid',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, client_name=None, kind=None, metadata=None, scopes=None, user_name=None, user_uid=None):
         """
         V1OAuthClientAuthorization - a model defined in Swagger
@@ -285,10 +296,32 @@ class V1OAuthClientAuthorization(object):
         if not isinstance(other, V1OAuthClientAuthorization):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1OAuthClientAuthorization' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -50,6 +50,17 @@ class V1Parameter(object):
         'value': 'value'
     }
 
+    __slots__ = (
+        '_description',
+        '_display_name',
+        '__from',
+        '_generate',
+        '_name',
+        '_required',
+        '_value',
+        'discriminator'
+    )
+
     def __init__(self, description=None, display_name=None, _from=None, generate=None, name=None, required=None, value=None):
         """
         V1Parameter - a model defined in Swagger
@@ -286,10 +297,32 @@ class V1Parameter(object):
         if not isinstance(other, V1Parameter):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1Parameter' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
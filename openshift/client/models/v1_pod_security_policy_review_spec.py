@@ -40,6 +40,12 @@ class V1PodSecurityPolicyReviewSpec(object):
         'template': 'template'
     }
 
+    __slots__ = (
+        '_service_account_names',
+        '_template',
+        'discriminator'
+    )
+
     def __init__(self, service_account_names=None, template=None):
         """
         V1PodSecurityPolicyReviewSpec - a model defined in Swagger
@@ -146,10 +152,32 @@ class V1PodSecurityPolicyReviewSpec(object):
         if not isinstance(other, V1PodSecurityPolicyReviewSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1PodSecurityPolicyReviewSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -52,6 +52,18 @@ class V1RBDPersistentVolumeSource(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_image',
+        '_keyring',
+        '_monitors',
+        '_pool',
+        '_read_only',
+        '_secret_ref',
+        '_user',
+        'discriminator'
+    )
+
     def __init__(self, fs_type=None, image=None, keyring=None, monitors=None, pool=None, read_only=None, secret_ref=None, user=None):
         """
         V1RBDPersistentVolumeSource - a model defined in Swagger
@@ -315,10 +327,32 @@ class V1RBDPersistentVolumeSource(object):
         if not isinstance(other, V1RBDPersistentVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1RBDPersistentVolumeSource' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
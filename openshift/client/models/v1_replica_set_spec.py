@@ -44,6 +44,14 @@ class V1ReplicaSetSpec(object):
         'template': 'template'
     }
 
+    __slots__ = (
+        '_min_ready_seconds',
+        '_replicas',
+        '_selector',
+        '_template',
+        'discriminator'
+    )
+
     def __init__(self, min_ready_seconds=None, replicas=None, selector=None, template=None):
         """
         V1ReplicaSetSpec - a model defined in Swagger
@@ -202,10 +210,32 @@ class V1ReplicaSetSpec(object):
         if not isinstance(other, V1ReplicaSetSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ReplicaSetSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -48,6 +48,16 @@ class V1ReplicaSetStatus(object):
         'replicas': 'replicas'
     }
 
+    __slots__ = (
+        '_available_replicas',
+        '_conditions',
+        '_fully_labeled_replicas',
+        '_observed_generation',
+        '_ready_replicas',
+        '_replicas',
+        'discriminator'
+    )
+
     def __init__(self, available_replicas=None, conditions=None, fully_labeled_replicas=None, observed_generation=None, ready_replicas=None, replicas=None):
         """
         V1ReplicaSetStatus - a model defined in Swagger
@@ -258,10 +268,32 @@ class V1ReplicaSetStatus(object):
         if not isinstance(other, V1ReplicaSetStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ReplicaSetStatus' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -50,6 +50,17 @@ class V1RoleBinding(object):
         'user_names': 'userNames'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_group_names',
+        '_kind',
+        '_metadata',
+        '_role_ref',
+        '_subjects',
+        '_user_names',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, group_names=None, kind=None, metadata=None, role_ref=None, subjects=None, user_names=None):
         """
         V1RoleBinding - a model defined in Swagger
@@ -289,10 +300,32 @@ class V1RoleBinding(object):
         if not isinstance(other, V1RoleBinding):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1RoleBinding' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
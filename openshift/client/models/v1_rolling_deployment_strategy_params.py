@@ -50,6 +50,17 @@ class V1RollingDeploymentStrategyParams(object):
         'update_period_seconds': 'updatePeriodSeconds'
     }
 
+    __slots__ = (
+        '_interval_seconds',
+        '_max_surge',
+        '_max_unavailable',
+        '_post',
+        '_pre',
+        '_timeout_seconds',
+        '_update_period_seconds',
+        'discriminator'
+    )
+
     def __init__(self, interval_seconds=None, max_surge=None, max_unavailable=None, post=None, pre=None, timeout_seconds=None, update_period_seconds=None):
         """
         V1RollingDeploymentStrategyParams - a model defined in Swagger
@@ -285,10 +296,32 @@ class V1RollingDeploymentStrategyParams(object):
         if not isinstance(other, V1RollingDeploymentStrategyParams):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1RollingDeploymentStrategyParams' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -40,6 +40,12 @@ class V1RollingUpdateDeployment(object):
         'max_unavailable': 'maxUnavailable'
     }
 
+    __slots__ = (
+        '_max_surge',
+        '_max_unavailable',
+        'discriminator'
+    )
+
     def __init__(self, max_surge=None, max_unavailable=None):
         """
         V1RollingUpdateDeployment - a model defined in Swagger
@@ -145,10 +151,32 @@ class V1RollingUpdateDeployment(object):
         if not isinstance(other, V1RollingUpdateDeployment):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1RollingUpdateDeployment' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -46,6 +46,15 @@ class V1RouteIngress(object):
         'wildcard_policy': 'wildcardPolicy'
     }
 
+    __slots__ = (
+        '_conditions',
+        '_host',
+        '_router_canonical_hostname',
+        '_router_name',
+        '_wildcard_policy',
+        'discriminator'
+    )
+
     def __init__(self, conditions=None, host=None, router_canonical_hostname=None, router_name=None, wildcard_policy=None):
         """
         V1RouteIngress - a model defined in Swagger
@@ -229,10 +238,32 @@ class V1RouteIngress(object):
         if not isinstance(other, V1RouteIngress):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1RouteIngress' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -50,6 +50,17 @@ class V1RouteSpec(object):
         'wildcard_policy': 'wildcardPolicy'
     }
 
+    __slots__ = (
+        '_alternate_backends',
+        '_host',
+        '_path',
+        '_port',
+        '_tls',
+        '_to',
+        '_wildcard_policy',
+        'discriminator'
+    )
+
     def __init__(self, alternate_backends=None, host=None, path=None, port=None, tls=None, to=None, wildcard_policy=None):
         """
         V1RouteSpec - a model defined in Swagger
@@ -287,10 +298,32 @@ class V1RouteSpec(object):
         if not isinstance(other, V1RouteSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1RouteSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -40,6 +40,12 @@ class V1ScopeRestriction(object):
         'literals': 'literals'
     }
 
+    __slots__ = (
+        '_cluster_role',
+        '_literals',
+        'discriminator'
+    )
+
     def __init__(self, cluster_role=None, literals=None):
         """
         V1ScopeRestriction - a model defined in Swagger
@@ -145,10 +151,32 @@ class V1ScopeRestriction(object):
         if not isinstance(other, V1ScopeRestriction):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ScopeRestriction' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -82,6 +82,33 @@ class V1SecurityContextConstraints(object):
         'volumes': 'volumes'
     }
 
+    __slots__ = (
+        '_allow_host_dir_volume_plugin',
+        '_allow_host_ipc',
+        '_allow_host_network',
+        '_allow_host_pid',
+        '_allow_host_ports',
+        '_allow_privileged_container',
+        '_allowed_capabilities',
+        '_allowed_flex_volumes',
+        '_api_version',
+        '_default_add_capabilities',
+        '_fs_group',
+        '_groups',
+        '_kind',
+        '_metadata',
+        '_priority',
+        '_read_only_root_filesystem',
+        '_required_drop_capabilities',
+        '_run_as_user',
+        '_se_linux_context',
+        '_seccomp_profiles',
+        '_supplemental_groups',
+        '_users',
+        '_volumes',
+        'discriminator'
+    )
+
     def __init__(self, allow_host_dir_volume_plugin=None, allow_host_ipc=None, allow_host_network=None, allow_host_pid=None, allow_host_ports=None, allow_privileged_container=None, allowed_capabilities=None, allowed_flex_volumes=None, api_version=None, default_add_capabilities=None, fs_group=None, groups=None, kind=None, metadata=None, priority=None, read_only_root_filesystem=None, required_drop_capabilities=None, run_as_user=None, se_linux_context=None, seccomp_profiles=None, supplemental_groups=None, users=None, volumes=None):
         """
         V1SecurityContextConstraints - a model defined in Swagger
@@ -746,10 +773,32 @@ class V1SecurityContextConstraints(object):
         if not isinstance(other, V1SecurityContextConstraints):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1SecurityContextConstraints' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
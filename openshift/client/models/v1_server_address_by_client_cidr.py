@@ -40,6 +40,12 @@ class V1ServerAddressByClientCIDR(object):
         'server_address': 'serverAddress'
     }
 
+    __slots__ = (
+        '_client_cidr',
+        '_server_address',
+        'discriminator'
+    )
+
     def __init__(self, client_cidr=None, server_address=None):
         """
         V1ServerAddressByClientCIDR - a model defined in Swagger
@@ -147,10 +153,32 @@ class V1ServerAddressByClientCIDR(object):
         if not isinstance(other, V1ServerAddressByClientCIDR):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ServerAddressByClientCIDR' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -40,6 +40,12 @@ class V1ServiceAccountReference(object):
         'namespace': 'namespace'
     }
 
+    __slots__ = (
+        '_name',
+        '_namespace',
+        'discriminator'
+    )
+
     def __init__(self, name=None, namespace=None):
         """
         V1ServiceAccountReference - a model defined in Swagger
@@ -147,10 +153,32 @@ class V1ServiceAccountReference(object):
         if not isinstance(other, V1ServiceAccountReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1ServiceAccountReference' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
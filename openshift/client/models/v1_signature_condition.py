@@ -48,6 +48,16 @@ class V1SignatureCondition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_last_probe_time',
+        '_last_transition_time',
+        '_message',
+        '_reason',
+        '_status',
+        '_type',
+        'discriminator'
+    )
+
     def __init__(self, last_probe_time=None, last_transition_time=None, message=None, reason=None, status=None, type=None):
         """
         V1SignatureCondition - a model defined in Swagger
@@ -259,10 +269,32 @@ class V1SignatureCondition(object):
         if not isinstance(other, V1SignatureCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1SignatureCondition' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -42,6 +42,13 @@ class V1SignatureSubject(object):
         'public_key_id': 'publicKeyID'
     }
 
+    __slots__ = (
+        '_common_name',
+        '_organization',
+        '_public_key_id',
+        'discriminator'
+    )
+
     def __init__(self, common_name=None, organization=None, public_key_id=None):
         """
         V1SignatureSubject - a model defined in Swagger
@@ -174,10 +181,32 @@ class V1SignatureSubject(object):
         if not isinstance(other, V1SignatureSubject):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1SignatureSubject' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -48,6 +48,16 @@ class V1SourceBuildStrategy(object):
         'scripts': 'scripts'
     }
 
+    __slots__ = (
+        '_env',
+        '_force_pull',
+        '__from',
+        '_incremental',
+        '_pull_secret',
+        '_scripts',
+        'discriminator'
+    )
+
     def __init__(self, env=None, force_pull=None, _from=None, incremental=None, pull_secret=None, scripts=None):
         """
         V1SourceBuildStrategy - a model defined in Swagger
@@ -258,10 +268,32 @@ class V1SourceBuildStrategy(object):
         if not isinstance(other, V1SourceBuildStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1SourceBuildStrategy' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -52,6 +52,18 @@ class V1StatefulSetSpec(object):
         'volume_claim_templates': 'volumeClaimTemplates'
     }
 
+    __slots__ = (
+        '_pod_management_policy',
+        '_replicas',
+        '_revision_history_limit',
+        '_selector',
+        '_service_name',
+        '_template',
+        '_update_strategy',
+        '_volume_claim_templates',
+        'discriminator'
+    )
+
     def __init__(self, pod_management_policy=None, replicas=None, revision_history_limit=None, selector=None, service_name=None, template=None, update_strategy=None, volume_claim_templates=None):
         """
         V1StatefulSetSpec - a model defined in Swagger
@@ -316,10 +328,32 @@ class V1StatefulSetSpec(object):
         if not isinstance(other, V1StatefulSetSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1StatefulSetSpec' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
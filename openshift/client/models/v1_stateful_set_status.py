@@ -54,6 +54,19 @@ class V1StatefulSetStatus(object):
         'updated_replicas': 'updatedReplicas'
     }
 
+    __slots__ = (
+        '_collision_count',
+        '_conditions',
+        '_current_replicas',
+        '_current_revision',
+        '_observed_generation',
+        '_ready_replicas',
+        '_replicas',
+        '_update_revision',
+        '_updated_replicas',
+        'discriminator'
+    )
+
     def __init__(self, collision_count=None, conditions=None, current_replicas=None, current_revision=None, observed_generation=None, ready_replicas=None, replicas=None, update_revision=None, updated_replicas=None):
         """
         V1StatefulSetStatus - a model defined in Swagger
@@ -342,10 +355,32 @@ class V1StatefulSetStatus(object):
         if not isinstance(other, V1StatefulSetStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1StatefulSetStatus' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -44,6 +44,14 @@ class V1TagEvent(object):
         'image': 'image'
     }
 
+    __slots__ = (
+        '_created',
+        '_docker_image_reference',
+        '_generation',
+        '_image',
+        'discriminator'
+    )
+
     def __init__(self, created=None, docker_image_reference=None, generation=None, image=None):
         """
         V1TagEvent - a model defined in Swagger
@@ -205,10 +213,32 @@ class V1TagEvent(object):
         if not isinstance(other, V1TagEvent):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1TagEvent' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -50,6 +50,17 @@ class V1TagReference(object):
         'reference_policy': 'referencePolicy'
     }
 
+    __slots__ = (
+        '_annotations',
+        '__from',
+        '_generation',
+        '_import_policy',
+        '_name',
+        '_reference',
+        '_reference_policy',
+        'discriminator'
+    )
+
     def __init__(self, annotations=None, _from=None, generation=None, import_policy=None, name=None, reference=None, reference_policy=None):
         """
         V1TagReference - a model defined in Swagger
@@ -286,10 +297,32 @@ class V1TagReference(object):
         if not isinstance(other, V1TagReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1TagReference' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -50,6 +50,17 @@ class V1Template(object):
         'parameters': 'parameters'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_labels',
+        '_message',
+        '_metadata',
+        '_objects',
+        '_parameters',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, kind=None, labels=None, message=None, metadata=None, objects=None, parameters=None):
         """
         V1Template - a model defined in Swagger
@@ -286,10 +297,32 @@ class V1Template(object):
         if not isinstance(other, V1Template):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1Template' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -48,6 +48,16 @@ class V1TLSConfig(object):
         'termination': 'termination'
     }
 
+    __slots__ = (
+        '_ca_certificate',
+        '_certificate',
+        '_destination_ca_certificate',
+        '_insecure_edge_termination_policy',
+        '_key',
+        '_termination',
+        'discriminator'
+    )
+
     def __init__(self, ca_certificate=None, certificate=None, destination_ca_certificate=None, insecure_edge_termination_policy=None, key=None, termination=None):
         """
         V1TLSConfig - a model defined in Swagger
@@ -258,10 +268,32 @@ class V1TLSConfig(object):
         if not isinstance(other, V1TLSConfig):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1TLSConfig' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
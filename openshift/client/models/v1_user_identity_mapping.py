@@ -46,6 +46,15 @@ class V1UserIdentityMapping(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_identity',
+        '_kind',
+        '_metadata',
+        '_user',
+        'discriminator'
+    )
+
     def __init__(self, api_version=None, identity=None, kind=None, metadata=None, user=None):
         """
         V1UserIdentityMapping - a model defined in Swagger
@@ -229,10 +238,32 @@ class V1UserIdentityMapping(object):
         if not isinstance(other, V1UserIdentityMapping):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1UserIdentityMapping' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -40,6 +40,12 @@ class V1VolumeDevice(object):
         'name': 'name'
     }
 
+    __slots__ = (
+        '_device_path',
+        '_name',
+        'discriminator'
+    )
+
     def __init__(self, device_path=None, name=None):
         """
         V1VolumeDevice - a model defined in Swagger
@@ -147,10 +153,32 @@ class V1VolumeDevice(object):
         if not isinstance(other, V1VolumeDevice):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1VolumeDevice' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
@@ -70,6 +70,27 @@ class V1beta1Event(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_action',
+        '_api_version',
+        '_deprecated_count',
+        '_deprecated_first_timestamp',
+        '_deprecated_last_timestamp',
+        '_deprecated_source',
+        '_event_time',
+        '_kind',
+        '_metadata',
+        '_note',
+        '_reason',
+        '_regarding',
+        '_related',
+        '_reporting_controller',
+        '_reporting_instance',
+        '_series',
+        '_type',
+        'discriminator'
+    )
+
     def __init__(self, action=None, api_version=None, deprecated_count=None, deprecated_first_timestamp=None, deprecated_last_timestamp=None, deprecated_source=None, event_time=None, kind=None, metadata=None, note=None, reason=None, regarding=None, related=None, reporting_controller=None, reporting_instance=None, series=None, type=None):
         """
         V1beta1Event - a model defined in Swagger
@@ -564,10 +585,32 @@ class V1beta1Event(object):
         if not isinstance(other, V1beta1Event):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1beta1Event' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
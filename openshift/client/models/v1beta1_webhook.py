@@ -46,6 +46,15 @@ class V1beta1Webhook(object):
         'rules': 'rules'
     }
 
+    __slots__ = (
+        '_client_config',
+        '_failure_policy',
+        '_name',
+        '_namespace_selector',
+        '_rules',
+        'discriminator'
+    )
+
     def __init__(self, client_config=None, failure_policy=None, name=None, namespace_selector=None, rules=None):
         """
         V1beta1Webhook - a model defined in Swagger
@@ -231,10 +240,32 @@ class V1beta1Webhook(object):
         if not isinstance(other, V1beta1Webhook):
             return False
 
-        return self.__dict__ == other.__dict__
+        for attr in self.swagger_types:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
 
     def __ne__(self, other):
         """
         Returns true if both objects are not equal
         """
         return not self == other
+
+    def __getstate__(self):
+        """
+        Returns the model attributes, for pickle
+        """
+        state = {}
+        for slot in self.__slots__:
+            if slot.startswith('__'):
+                slot = '_V1beta1Webhook' + slot
+            if hasattr(self, slot):
+                state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the model attributes returned by __getstate__
+        """
+        for slot, value in iteritems(state):
+            setattr(self, slot, value)
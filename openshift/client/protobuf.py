@@ -0,0 +1,276 @@
+from __future__ import absolute_import
+
+import base64
+import json
+import struct
+from datetime import datetime, timedelta
+
+from six import binary_type, iteritems
+
+PROTOBUF = 'application/vnd.kubernetes.protobuf'
+PROTOBUF_WATCH = 'application/vnd.kubernetes.protobuf;stream=watch'
+
+# Every protobuf encoded object starts with this prefix, followed by a runtime.Unknown envelope
+MAGIC = b'k8s\x00'
+
+VARINT = 0
+FIXED64 = 1
+LENGTH_DELIMITED = 2
+FIXED32 = 5
+
+# Field hints for proto types that do not map one to one onto a swagger type
+QUANTITY = 'quantity'
+INT_OR_STRING = 'intstr'
+RAW_EXTENSION = 'raw'
+BYTES = 'bytes'
+
+EPOCH = datetime(1970, 1, 1)
+
+SCALAR_TYPES = ('int', 'long', 'float', 'str', 'bool', 'date', 'datetime', 'object')
+
+# model name -> {field number: json key or (json key, hint)}
+SCHEMAS = {}
+
+
+def register_schemas(schemas):
+    """
+    Register protobuf field numbers for model classes, e.g. the SCHEMAS dict of a module
+    generated with scripts/proto_schemas.py from the generated.proto files of the API
+    server. Protobuf is only negotiated for response types whose schema, and the schema
+    of every model they contain, is registered.
+
+    :param schemas: dict of model name -> {field number: json key or (json key, hint)}
+    """
+    SCHEMAS.update(schemas)
+    ProtobufCodec.clear_cache()
+
+
+def _varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = ord(data[pos:pos + 1])
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def iter_fields(data):
+    """ Yield (field number, wire type, value) for every field of an encoded message """
+    pos = 0
+    end = len(data)
+    while pos < end:
+        key, pos = _varint(data, pos)
+        number, wire_type = key >> 3, key & 0x7
+        if wire_type == VARINT:
+            value, pos = _varint(data, pos)
+        elif wire_type == FIXED64:
+            value, pos = data[pos:pos + 8], pos + 8
+        elif wire_type == LENGTH_DELIMITED:
+            length, pos = _varint(data, pos)
+            value, pos = data[pos:pos + length], pos + length
+        elif wire_type == FIXED32:
+            value, pos = data[pos:pos + 4], pos + 4
+        else:
+            raise ValueError("Unsupported protobuf wire type {}".format(wire_type))
+        yield number, wire_type, value
+
+
+def _signed(value):
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _fields(data):
+    return dict((number, value) for number, _, value in iter_fields(data))
+
+
+def unwrap(data):
+    """
+    Strip the magic prefix and runtime.Unknown envelope from a protobuf encoded object.
+
+    :return: (apiVersion, kind, raw message bytes)
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("Protobuf data does not start with the kubernetes magic prefix")
+    unknown = _fields(data[len(MAGIC):])
+    type_meta = _fields(unknown.get(1, b''))
+    return (type_meta.get(1, b'').decode('utf8'), type_meta.get(2, b'').decode('utf8'), unknown.get(2, b''))
+
+
+def iter_frames(chunks):
+    """ Split a length-delimited watch stream (4 byte network order length + payload) into frames """
+    buf = b''
+    for chunk in chunks:
+        buf += chunk
+        while len(buf) >= 4:
+            length = struct.unpack('>I', buf[:4])[0]
+            if len(buf) < 4 + length:
+                break
+            yield buf[4:4 + length]
+            buf = buf[4 + length:]
+
+
+def _list_item_type(swagger_type):
+    """ 'list[V1Build]' -> 'V1Build' """
+    return swagger_type[len('list['):-1]
+
+
+def _dict_value_type(swagger_type):
+    """ 'dict(str, V1Build)' -> 'V1Build' """
+    return swagger_type[:-1].split(', ', 1)[1]
+
+
+def _time(data):
+    fields = _fields(data)
+    value = EPOCH + timedelta(seconds=_signed(fields.get(1, 0)), microseconds=fields.get(2, 0) // 1000)
+    if value.microsecond:
+        return value.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class ProtobufCodec(object):
+    """
+    Decode protobuf encoded API objects into the JSON shaped dicts the deserializer
+    already understands, using the registered field numbers and the swagger types of
+    the model classes.
+
+    :param model_class: callable that resolves a model name to its class
+    """
+
+    # model name -> {field number: (json key, swagger type, hint)}, and type -> supported
+    _field_cache = {}
+    _supported_cache = {}
+
+    def __init__(self, model_class):
+        self.model_class = model_class
+
+    @classmethod
+    def clear_cache(cls):
+        cls._field_cache.clear()
+        cls._supported_cache.clear()
+
+    def _model_fields(self, name):
+        fields = self._field_cache.get(name)
+        if fields is None:
+            klass = self.model_class(name)
+            types = dict((json_key, klass.swagger_types[attr]) for attr, json_key in iteritems(klass.attribute_map))
+            fields = {}
+            for number, entry in iteritems(SCHEMAS[name]):
+                json_key, hint = entry if isinstance(entry, tuple) else (entry, None)
+                if json_key in types:
+                    fields[number] = (json_key, types[json_key], hint)
+            self._field_cache[name] = fields
+        return fields
+
+    def supports(self, swagger_type, _seen=None):
+        """ Return True if swagger_type and every model it contains have a registered schema """
+        supported = self._supported_cache.get(swagger_type)
+        if supported is not None:
+            return supported
+        seen = _seen if _seen is not None else set()
+        if swagger_type in seen:
+            return True
+        seen.add(swagger_type)
+
+        if swagger_type.startswith('list['):
+            supported = self.supports(_list_item_type(swagger_type), seen)
+        elif swagger_type.startswith('dict('):
+            supported = self.supports(_dict_value_type(swagger_type), seen)
+        elif swagger_type in SCALAR_TYPES:
+            supported = True
+        elif swagger_type not in SCHEMAS:
+            supported = False
+        else:
+            supported = all(self.supports(field_type, seen)
+                            for _, field_type, hint in self._model_fields(swagger_type).values() if hint is None)
+        if _seen is None:
+            self._supported_cache[swagger_type] = supported
+        return supported
+
+    def decode(self, data, swagger_type):
+        """ Decode a protobuf encoded object (magic prefix and envelope included) into a dict """
+        _, _, raw = unwrap(data)
+        return self.decode_message(raw, swagger_type)
+
+    def decode_message(self, data, name):
+        result = {}
+        fields = self._model_fields(name)
+        for number, wire_type, value in iter_fields(data):
+            field = fields.get(number)
+            if field is None:
+                continue
+            json_key, swagger_type, hint = field
+            if swagger_type.startswith('list['):
+                item_type = _list_item_type(swagger_type)
+                result.setdefault(json_key, []).extend(self._repeated(wire_type, value, item_type, hint))
+            elif swagger_type.startswith('dict('):
+                entry = _fields(value)
+                value_type = _dict_value_type(swagger_type)
+                map_value = entry.get(2)
+                result.setdefault(json_key, {})[entry.get(1, b'').decode('utf8')] = (
+                    None if map_value is None else self._value(LENGTH_DELIMITED if isinstance(map_value, binary_type) else VARINT,
+                                                               map_value, value_type, hint))
+            else:
+                result[json_key] = self._value(wire_type, value, swagger_type, hint)
+        return result
+
+    def _repeated(self, wire_type, value, item_type, hint):
+        if wire_type == LENGTH_DELIMITED and item_type in ('int', 'bool', 'float'):
+            # packed repeated scalars
+            if item_type == 'float':
+                return list(struct.unpack('<{}d'.format(len(value) // 8), value))
+            items = []
+            pos = 0
+            while pos < len(value):
+                item, pos = _varint(value, pos)
+                items.append(bool(item) if item_type == 'bool' else _signed(item))
+            return items
+        return [self._value(wire_type, value, item_type, hint)]
+
+    def _value(self, wire_type, value, swagger_type, hint):
+        if hint == QUANTITY:
+            return _fields(value).get(1, b'').decode('utf8')
+        if hint == INT_OR_STRING:
+            fields = _fields(value)
+            if fields.get(1, 0) == 1:
+                return fields.get(3, b'').decode('utf8')
+            return _signed(fields.get(2, 0))
+        if hint == RAW_EXTENSION:
+            raw = _fields(value).get(1, b'')
+            if raw.startswith(MAGIC):
+                return raw
+            return json.loads(raw.decode('utf8')) if raw else None
+        if hint == BYTES:
+            return base64.b64encode(value).decode('ascii')
+
+        if wire_type == VARINT:
+            if swagger_type == 'bool':
+                return bool(value)
+            return _signed(value)
+        if wire_type == FIXED64:
+            return struct.unpack('<d', value)[0]
+        if wire_type == FIXED32:
+            return struct.unpack('<f', value)[0]
+        if swagger_type in ('datetime', 'date'):
+            return _time(value)
+        if swagger_type in SCALAR_TYPES:
+            return value.decode('utf8')
+        return self.decode_message(value, swagger_type)
+
+    def decode_watch_event(self, frame, swagger_type):
+        """
+        Decode one frame of a protobuf watch stream (a versioned.Watch message).
+
+        :return: (event type, decoded object dict)
+        """
+        if frame.startswith(MAGIC):
+            _, _, frame = unwrap(frame)
+        event = _fields(frame)
+        event_type = event.get(1, b'').decode('utf8')
+        raw_object = _fields(event.get(2, b'')).get(1, b'')
+        if event_type == 'ERROR':
+            # the object of an ERROR event is a Status, not the watched type
+            return event_type, self.decode(raw_object, 'V1Status') if self.supports('V1Status') else {}
+        return event_type, self.decode(raw_object, swagger_type)
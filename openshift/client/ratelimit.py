@@ -0,0 +1,61 @@
+from __future__ import absolute_import
+
+import threading
+import time
+
+from openshift.client import clock
+
+
+class RateLimiter(object):
+    """
+    Token bucket that allows qps requests per second on average, and bursts of up to
+    burst requests after a quiet period.
+
+    Requests reserve a token and wait until it is due, so concurrent callers are
+    served in the order they asked and never over-throttled. The counters requests,
+    throttled_requests and throttled_seconds record how much waiting the limit caused.
+
+    :param qps: average requests per second.
+    :param burst: bucket size, defaults to qps rounded up.
+    """
+
+    def __init__(self, qps, burst=None):
+        if qps <= 0:
+            raise ValueError("qps must be positive, got {}".format(qps))
+        self.qps = float(qps)
+        self.burst = max(1, int(burst if burst is not None else -(-qps // 1)))
+        self.requests = 0
+        self.throttled_requests = 0
+        self.throttled_seconds = 0.0
+        self._tokens = float(self.burst)
+        self._last = clock.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """ Take a token and return the number of seconds to wait before it may be used """
+        with self._lock:
+            now = clock.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.qps) - 1
+            self._last = now
+            delay = -self._tokens / self.qps if self._tokens < 0 else 0.0
+            self.requests += 1
+            if delay:
+                self.throttled_requests += 1
+                self.throttled_seconds += delay
+            return delay
+
+    def acquire(self):
+        """ Block until a request may be sent, return the seconds waited """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def metrics(self):
+        """ Return the number of requests, how many of them had to wait for a token, and the seconds they waited in total """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'throttled_requests': self.throttled_requests,
+                'throttled_seconds': self.throttled_seconds,
+            }
@@ -0,0 +1,102 @@
+from __future__ import absolute_import
+
+import json
+
+_camel_case_keys = {}
+
+# Names serializers probe for to tell generated models apart, which must not read as missing fields
+_MODEL_ATTRIBUTES = frozenset(('swagger_types', 'openapi_types', 'attribute_map'))
+
+
+def camel_case_key(name):
+    """ Convert a model attribute name (resource_version) to its JSON key (resourceVersion) """
+    key = _camel_case_keys.get(name)
+    if key is None:
+        head, _, tail = name.lstrip('_').partition('_')
+        key = head + ''.join(part[:1].upper() + part[1:] for part in tail.split('_'))
+        _camel_case_keys[name] = key
+    return key
+
+
+def wrap(value):
+    """ Wrap decoded JSON so nested objects support attribute access """
+    if isinstance(value, dict):
+        return ResourceObject(value)
+    if isinstance(value, list):
+        return [wrap(item) for item in value]
+    return value
+
+
+class ResourceObject(object):
+    """
+    Thin attribute-access wrapper over a decoded JSON object.
+
+    Attributes are looked up by their JSON key (obj.metadata.resourceVersion) or by
+    the snake_case name the generated models use (obj.metadata.resource_version).
+    Missing fields return None, the same as an unset model attribute, except for
+    dunder names and swagger_types/attribute_map, which raise AttributeError so
+    the object is not mistaken for a generated model. Nested objects are wrapped
+    when they are accessed; the underlying dict is never copied.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        if name.startswith('__') or name in _MODEL_ATTRIBUTES:
+            raise AttributeError(name)
+        data = self._data
+        if name in data:
+            return wrap(data[name])
+        return wrap(data.get(camel_case_key(name)))
+
+    def __getitem__(self, key):
+        return wrap(self._data[key])
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __eq__(self, other):
+        if isinstance(other, ResourceObject):
+            return self._data == other._data
+        return self._data == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'ResourceObject({!r})'.format(self._data)
+
+    def to_dict(self):
+        """ Return the underlying JSON dict """
+        return self._data
+
+    def to_str(self):
+        return json.dumps(self._data, indent=2, sort_keys=True)
+
+
+def call_raw(func, *args, **kwargs):
+    """
+    Call a generated API method and return the decoded JSON body as plain dicts and
+    lists, skipping model construction for this call only.
+
+        images = call_raw(oapi.list_image)
+        names = [image['metadata']['name'] for image in images['items']]
+
+    :param func: a generated API method, e.g. OapiApi().list_image
+    :return: dict, list, or the body as a string if it is not JSON
+    """
+    kwargs['_preload_content'] = False
+    response = func(*args, **kwargs)
+    try:
+        data = response.data
+    finally:
+        response.release_conn()
+    if isinstance(data, bytes):
+        data = data.decode('utf8')
+    try:
+        return json.loads(data)
+    except ValueError:
+        return data
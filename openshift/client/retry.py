@@ -0,0 +1,82 @@
+from __future__ import absolute_import
+
+import random
+import threading
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+from six import string_types
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+# Methods that can be sent twice without changing the outcome
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+# Failures that mean the request never reached the server or the connection broke
+CONNECTION_ERRORS = (MaxRetryError, ProtocolError)
+
+
+def retry_after(headers):
+    """ Seconds to wait according to a Retry-After header, or None """
+    value = headers.get('Retry-After') if headers else None
+    if not value or not isinstance(value, string_types):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0.0, mktime_tz(parsed) - time.time())
+
+
+class RetryPolicy(object):
+    """
+    When and how long to wait before sending a failed request again.
+
+    Requests are retried when the server answers with one of statuses, or the
+    connection fails, but only for idempotent methods. 429 Too Many Requests means
+    the server did not process the request, so it is retried for every method. The
+    wait is the server's Retry-After when it sends one, and otherwise a random time
+    between 0 and backoff * 2 ** attempt seconds; either is capped at max_backoff.
+    retries counts the retries made with the policy, which can be shared by threads.
+
+    :param max_retries: retries per request, 0 disables retrying.
+    :param backoff: base of the exponential backoff, in seconds.
+    :param max_backoff: longest backoff, in seconds.
+    :param statuses: HTTP statuses to retry.
+    :param methods: HTTP methods to retry on any of statuses or a connection error.
+    """
+
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=30.0, statuses=RETRY_STATUSES, methods=IDEMPOTENT_METHODS):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def should_retry(self, attempt, method, status=None):
+        """
+        :param attempt: number of retries made so far
+        :param status: HTTP status of the failed response, None for a connection error
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status == 429:
+            return True
+        if status is not None and status not in self.statuses:
+            return False
+        return method.upper() in self.methods
+
+    def delay(self, attempt, headers=None):
+        """ Count a retry and return the seconds to wait before retry number attempt + 1 """
+        with self._lock:
+            self.retries += 1
+        wait = retry_after(headers)
+        if wait is None:
+            return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        return min(self.max_backoff, wait)
+
+    def sleep(self, attempt, headers=None):
+        time.sleep(self.delay(attempt, headers))
@@ -0,0 +1,63 @@
+from __future__ import absolute_import
+
+import sys
+import threading
+
+from six import reraise
+
+
+class _Call(object):
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Runs at most one call per key at a time. Threads that ask for a key while a call
+    for it is in flight wait for that call and get its result, or its exception,
+    instead of making their own. The counters calls and shared record how many
+    calls were made and how many callers were served by another thread's call.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        """ Return func(*args, **kwargs), or the result of the call in flight for key """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                reraise(*call.error)
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except Exception:
+            call.error = sys.exc_info()
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def metrics(self):
+        """ Return the number of calls made, and of callers that got the result of another thread's call instead """
+        with self._lock:
+            return {'calls': self.calls, 'shared': self.shared}
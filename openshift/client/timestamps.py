@@ -0,0 +1,81 @@
+from __future__ import absolute_import
+
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from dateutil.tz import tzoffset, tzutc
+
+RFC3339_RX = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(?:([Zz])|([+-])(\d{2}):(\d{2}))$'
+)
+
+UTC = tzutc()
+
+# offset in seconds -> tzinfo, the API server only ever uses a handful
+_offsets = {}
+
+
+def _tzinfo(sign, hours, minutes):
+    seconds = (int(hours) * 60 + int(minutes)) * 60
+    if sign == '-':
+        seconds = -seconds
+    tz = _offsets.get(seconds)
+    if tz is None:
+        tz = _offsets[seconds] = UTC if seconds == 0 else tzoffset(None, seconds)
+    return tz
+
+
+def parse_rfc3339(value):
+    """
+    Parse an RFC3339 timestamp, the format the API server writes every datetime in,
+    e.g. 2018-01-30T20:49:53Z or 2018-01-30T20:49:53.123456+02:00. Fractions beyond
+    microseconds are truncated, like dateutil does.
+
+    :return: timezone aware datetime, or None if value is not in that format.
+    """
+    match = RFC3339_RX.match(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, utc, sign, tz_hours, tz_minutes = match.groups()
+    try:
+        return datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second),
+            int(fraction[:6].ljust(6, '0')) if fraction else 0,
+            UTC if utc else _tzinfo(sign, tz_hours, tz_minutes)
+        )
+    except ValueError:
+        # out of range fields, e.g. a leap second, are left to dateutil
+        return None
+
+
+class DatetimeCache(object):
+    """
+    Least recently used cache of parsed timestamps. Lists of builds or events carry
+    many identical timestamps, and datetime objects are immutable, so one instance
+    can be shared by every object that has the same value.
+
+    :param maxsize: number of timestamps to keep.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, value):
+        with self._lock:
+            result = self._entries.pop(value, None)
+            if result is not None:
+                self._entries[value] = result
+            return result
+
+    def set(self, value, result):
+        with self._lock:
+            self._entries[value] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
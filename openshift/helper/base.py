@@ -15,12 +15,16 @@ from logging import config as logging_config
 import string_utils
 
 from dictdiffer import diff
-from kubernetes import watch
 from kubernetes.client.models import V1DeleteOptions
 from kubernetes.client.rest import ApiException
 from six import add_metaclass
 from urllib3.exceptions import MaxRetryError
 
+from openshift.cache import MISSING, object_key
+from openshift.client.retry import RetryPolicy
+from openshift.listing import PAGE_SIZE, list_all, supports_paging
+from openshift.watch import COALESCE, shared_watches
+
 from . import VERSION_RX
 from .exceptions import KubernetesException
 
@@ -35,11 +39,15 @@ class BaseObjectHelper(object):
 
     logger = logging.getLogger(__name__)
 
-    def __init__(self, api_version=None, kind=None, debug=False, reset_logfile=True, timeout=20, **auth):
+    def __init__(self, api_version=None, kind=None, debug=False, reset_logfile=True, timeout=20, page_size=PAGE_SIZE,
+                 max_retries=0, object_cache=None, **auth):
         self.version_rx = re.compile("V\d((alpha|beta)\d)?")
         self.api_version = api_version
         self.kind = kind
         self.timeout = timeout  # number of seconds to wait for an API request
+        self.page_size = page_size  # number of items to request per page when listing, None for all at once
+        self.max_retries = max_retries  # number of times to resend a request that failed transiently
+        self.object_cache = object_cache  # optional openshift.cache.ObjectCache that get_object reads through
 
         if api_version and kind:
             self.set_model(api_version, kind)
@@ -99,6 +107,8 @@ class BaseObjectHelper(object):
         context = auth.get('context')
 
         self.api_client = self.client_from_config(config_file, context)
+        if getattr(self.api_client, 'retry_policy', False) is None and self.max_retries:
+            self.api_client.retry_policy = RetryPolicy(self.max_retries)
 
         if auth.get('host') is not None:
             self.api_client.host = auth['host']
@@ -174,20 +184,50 @@ class BaseObjectHelper(object):
                 pass
         return obj
 
-    def get_object(self, name=None, namespace=None):
+    def _cache_key(self, name, namespace):
+        if self.object_cache is None or not name or self.kind.endswith('list'):
+            return None
+        return object_key(self.api_version, self.kind, namespace, name)
+
+    def _invalidate(self, name, namespace):
+        """ Drop an object the client wrote to from the object cache """
+        key = self._cache_key(name, namespace)
+        if key is not None:
+            self.object_cache.invalidate(key)
+
+    def get_object(self, name=None, namespace=None, cached=True):
+        """
+        Read an object, or list objects. With an object cache, reads are served from
+        the cache unless cached is False, and the result is stored in the cache, as is
+        the absence of an object that the server answered 404 for.
+
+        :return: the object, or None if it does not exist
+        """
+        cache_key = self._cache_key(name, namespace)
+        if cache_key is not None and cached:
+            k8s_obj = self.object_cache.get(cache_key)
+            if k8s_obj is not MISSING:
+                return k8s_obj
+
         k8s_obj = None
+        not_found = False
         method_name = 'list' if self.kind.endswith('list') else 'read'
         try:
             get_method = self.lookup_method(method_name, namespace)
             if name is None and namespace is None:
-                k8s_obj = get_method()
+                args = ()
             elif name and namespace is None:
-                k8s_obj = get_method(name)
+                args = (name,)
             elif namespace and not name:
-                k8s_obj = get_method(namespace)
+                args = (namespace,)
+            else:
+                args = (name, namespace)
+            if method_name == 'list' and self.page_size and supports_paging(get_method):
+                k8s_obj = list_all(get_method, *args, limit=self.page_size)
             else:
-                k8s_obj = get_method(name, namespace)
+                k8s_obj = get_method(*args)
         except ApiException as exc:
+            not_found = exc.status == 404
             if exc.status != 404:
                 if self.base_model_name == 'Project' and exc.status == 403:
                     pass
@@ -197,6 +237,13 @@ class BaseObjectHelper(object):
         except MaxRetryError as ex:
             raise self.get_exception_class()(str(ex.reason))
 
+        if cache_key is not None:
+            if not_found:
+                self.object_cache.set_missing(cache_key)
+            elif k8s_obj is None:
+                self.object_cache.invalidate(cache_key)
+            else:
+                self.object_cache.set(cache_key, k8s_obj)
         return k8s_obj
 
     def patch_object(self, name, namespace, k8s_obj):
@@ -208,17 +255,23 @@ class BaseObjectHelper(object):
         return_obj = None
         self.logger.debug("Patching object: {}".format(k8s_obj.to_str()))
         try:
-            patch_method = self.lookup_method('patch', namespace)
-            if namespace:
-                patch_method(name, namespace, k8s_obj)
-            else:
-                patch_method(name, k8s_obj)
-        except ApiException as exc:
-            msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-            raise self.get_exception_class()(msg, status=exc.status)
+            try:
+                patch_method = self.lookup_method('patch', namespace)
+                if namespace:
+                    patch_method(name, namespace, k8s_obj)
+                else:
+                    patch_method(name, k8s_obj)
+            except ApiException as exc:
+                msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
+                raise self.get_exception_class()(msg, status=exc.status)
+            finally:
+                self._invalidate(name, namespace)
 
-        if stream is not None:
-            return_obj = self._read_stream(w, stream, name)
+            if stream is not None:
+                return_obj = self._read_stream(w, stream, name)
+        finally:
+            if stream is not None:
+                stream.close()
 
         if not return_obj or self.kind in ('project', 'namespace'):
             return_obj = self._wait_for_response(name, namespace, 'patch')
@@ -242,25 +295,31 @@ class BaseObjectHelper(object):
         elif body:
             name = body.get('metadata', {}).get('name', None)
         try:
-            create_method = self.lookup_method('create', namespace)
-            if namespace:
-                if k8s_obj:
-                    create_method(namespace, k8s_obj)
-                else:
-                    create_method(namespace, body=body)
-            else:
-                if k8s_obj:
-                    create_method(k8s_obj)
+            try:
+                create_method = self.lookup_method('create', namespace)
+                if namespace:
+                    if k8s_obj:
+                        create_method(namespace, k8s_obj)
+                    else:
+                        create_method(namespace, body=body)
                 else:
-                    create_method(body=body)
-        except ApiException as exc:
-            msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-            raise self.get_exception_class()(msg, status=exc.status)
-        except MaxRetryError as ex:
-            raise self.get_exception_class()(str(ex.reason))
+                    if k8s_obj:
+                        create_method(k8s_obj)
+                    else:
+                        create_method(body=body)
+            except ApiException as exc:
+                msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
+                raise self.get_exception_class()(msg, status=exc.status)
+            except MaxRetryError as ex:
+                raise self.get_exception_class()(str(ex.reason))
+            finally:
+                self._invalidate(name, namespace)
 
-        if stream is not None:
-            return_obj = self._read_stream(w, stream, name)
+            if stream is not None:
+                return_obj = self._read_stream(w, stream, name)
+        finally:
+            if stream is not None:
+                stream.close()
 
         if not return_obj or self.kind in ('project', 'namespace'):
             return_obj = self._wait_for_response(name, namespace, 'create')
@@ -270,6 +329,7 @@ class BaseObjectHelper(object):
     def delete_object(self, name, namespace):
         self.logger.debug('Starting delete object {0} {1} {2}'.format(self.kind, name, namespace))
         delete_method = self.lookup_method('delete', namespace)
+        self._invalidate(name, namespace)
 
         if not namespace:
             try:
@@ -310,7 +370,39 @@ class BaseObjectHelper(object):
         """
         self.logger.debug('Starting replace object')
 
-        existing_obj = self.get_object(name, namespace)
+        w, stream = self._create_stream(namespace)
+        return_obj = None
+
+        try:
+            try:
+                try:
+                    self._replace(name, namespace, k8s_obj, body, cached=True)
+                except ApiException as exc:
+                    if exc.status != 409 or self._cache_key(name, namespace) is None:
+                        raise
+                    # the cached resourceVersion was stale, try again with the current one
+                    self._replace(name, namespace, k8s_obj, body, cached=False)
+            except ApiException as exc:
+                msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
+                raise self.get_exception_class()(msg, status=exc.status)
+            except MaxRetryError as ex:
+                raise self.get_exception_class()(str(ex.reason))
+            finally:
+                self._invalidate(name, namespace)
+
+            if stream is not None:
+                return_obj = self._read_stream(w, stream, name)
+        finally:
+            if stream is not None:
+                stream.close()
+
+        if not return_obj or self.kind in ('project', 'namespace'):
+            return_obj = self._wait_for_response(name, namespace, 'replace')
+
+        return self.fix_serialization(return_obj)
+
+    def _replace(self, name, namespace, k8s_obj, body, cached):
+        existing_obj = self.get_object(name, namespace, cached=cached)
         if not existing_obj:
             msg = "Error: Replacing object. Unable to find {}".format(name)
             msg += " in namespace {}".format(namespace) if namespace else ""
@@ -323,34 +415,17 @@ class BaseObjectHelper(object):
         elif body:
             body['metadata']['resourceVersion'] = existing_obj.metadata.resource_version
 
-        w, stream = self._create_stream(namespace)
-        return_obj = None
-
-        try:
-            replace_method = self.lookup_method('replace', namespace)
-            if k8s_obj:
-                if namespace is None:
-                    replace_method(name, k8s_obj)
-                else:
-                    replace_method(name, namespace, k8s_obj)
+        replace_method = self.lookup_method('replace', namespace)
+        if k8s_obj:
+            if namespace is None:
+                replace_method(name, k8s_obj)
             else:
-                if namespace is None:
-                    replace_method(name, body=body)
-                else:
-                    replace_method(name, namespace, body=body)
-        except ApiException as exc:
-            msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-            raise self.get_exception_class()(msg, status=exc.status)
-        except MaxRetryError as ex:
-            raise self.get_exception_class()(str(ex.reason))
-
-        if stream is not None:
-            return_obj = self._read_stream(w, stream, name)
-
-        if not return_obj or self.kind in ('project', 'namespace'):
-            return_obj = self._wait_for_response(name, namespace, 'replace')
-
-        return self.fix_serialization(return_obj)
+                replace_method(name, namespace, k8s_obj)
+        else:
+            if namespace is None:
+                replace_method(name, body=body)
+            else:
+                replace_method(name, namespace, body=body)
 
     @staticmethod
     def objects_match(obj_a, obj_b):
@@ -533,7 +608,7 @@ class BaseObjectHelper(object):
             time.sleep(1)
 
         while tries <= half:
-            obj = self.get_object(name, namespace)
+            obj = self.get_object(name, namespace, cached=False)
             if action == 'delete':
                 if not obj:
                     break
@@ -549,19 +624,15 @@ class BaseObjectHelper(object):
         return obj
 
     def _create_stream(self, namespace):
-        """ Create a stream that gets events for the our model """
+        """ Subscribe to the events of our model, from a watch shared by every helper of the process """
         w = None
         stream = None
         exception_class = self.get_exception_class()
 
         try:
             list_method = self.lookup_method('list', namespace)
-            w = watch.Watch()
-            w._api_client = self.api_client  # monkey patch for access to OpenShift models
-            if namespace:
-                stream = w.stream(list_method, namespace, _request_timeout=self.timeout)
-            else:
-                stream = w.stream(list_method, _request_timeout=self.timeout)
+            args = (namespace,) if namespace else ()
+            stream = w = shared_watches.subscribe(list_method, *args, timeout=self.timeout, overflow=COALESCE)
         except exception_class:
             pass
         except Exception:
@@ -13,9 +13,14 @@ from .. import config
 from ..client import models as openshift_models
 from ..client import apis as openshift_apis
 from ..client import ApiClient, Configuration
+from ..client.api_client import class_registry
 from .base import BaseObjectHelper
 from .exceptions import OpenShiftException
 
+# OpenShift classes take precedence over Kubernetes classes of the same name
+MODEL_REGISTRY = class_registry(openshift_models, k8s_models)
+API_REGISTRY = class_registry(openshift_apis, k8s_apis)
+
 
 class OpenShiftObjectHelper(BaseObjectHelper):
     @staticmethod
@@ -42,17 +47,17 @@ class OpenShiftObjectHelper(BaseObjectHelper):
 
     @staticmethod
     def model_class_from_name(model_name):
-        try:
-            return getattr(openshift_models, model_name)
-        except AttributeError:
-            return getattr(k8s_models, model_name)
+        model_class = MODEL_REGISTRY.get(model_name)
+        if model_class is None:
+            raise AttributeError("No model named {}".format(model_name))
+        return model_class
 
     @staticmethod
     def api_class_from_name(api_name):
-        try:
-            return getattr(openshift_apis, api_name)
-        except AttributeError:
-            return getattr(k8s_apis, api_name)
+        api_class = API_REGISTRY.get(api_name)
+        if api_class is None:
+            raise AttributeError("No API named {}".format(api_name))
+        return api_class
 
     def create_project(self, metadata, display_name=None, description=None):
         """ Creating a project requires using the project_request endpoint. """
@@ -61,14 +66,19 @@ class OpenShiftObjectHelper(BaseObjectHelper):
 
         w, stream = self._create_stream(None)
         try:
-            proj_req = openshift_models.V1ProjectRequest(metadata=metadata, display_name=display_name, description=description)
-            openshift_apis.OapiApi(self.api_client).create_project_request(proj_req)
-        except ApiException as exc:
-            msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
-            raise OpenShiftException(msg, status=exc.status)
-        except MaxRetryError as ex:
-            raise OpenShiftException(str(ex.reason))
+            try:
+                proj_req = openshift_models.V1ProjectRequest(metadata=metadata, display_name=display_name, description=description)
+                openshift_apis.OapiApi(self.api_client).create_project_request(proj_req)
+            except ApiException as exc:
+                msg = json.loads(exc.body).get('message', exc.reason) if exc.body.startswith('{') else exc.body
+                raise OpenShiftException(msg, status=exc.status)
+            except MaxRetryError as ex:
+                raise OpenShiftException(str(ex.reason))
 
-        self._read_stream(w, stream, metadata.name)
+            if stream is not None:
+                self._read_stream(w, stream, metadata.name)
+        finally:
+            if stream is not None:
+                stream.close()
 
         return self._wait_for_response(metadata.name, None, 'create')
@@ -0,0 +1,491 @@
+"""
+Informers keep an in-memory copy of every object of a list method up to date, by
+listing them once and then watching for changes, and tell registered handlers
+about each change.
+
+    informer = Informer(OapiApi(api_client).list_namespaced_build, 'test')
+    informer.add_handler(on_add=print_build, on_delete=print_build)
+    informer.start()
+    informer.wait_for_sync()
+    running = informer.store.by_index(LABEL_INDEX, 'app=web')
+"""
+from __future__ import absolute_import
+
+import heapq
+import itertools
+import logging
+import threading
+from collections import deque
+
+from kubernetes.client.rest import ApiException
+from six import iteritems
+
+from openshift.client import clock
+from openshift.listing import PAGE_SIZE, api_client_for, call_key, item_key, list_all, metadata_field, page_parts, resource_version_of, supports_paging
+from openshift.watch import Watch
+
+NAMESPACE_INDEX = 'namespace'
+LABEL_INDEX = 'label'
+OWNER_INDEX = 'owner'
+
+# seconds a watch request stays open before it is renewed
+WATCH_TIMEOUT = 300
+# seconds to wait before listing again after a failure
+RETRY_PERIOD = 5
+
+logger = logging.getLogger(__name__)
+
+
+def namespace_index(obj):
+    """ Index objects by namespace """
+    return [metadata_field(obj, 'namespace', 'namespace') or '']
+
+
+def label_index(obj):
+    """ Index objects by each of their labels, as 'key=value' """
+    labels = metadata_field(obj, 'labels', 'labels') or {}
+    return ['{}={}'.format(key, value) for key, value in iteritems(labels)]
+
+
+def owner_index(obj):
+    """ Index objects by the uid of each of their owners """
+    owners = metadata_field(obj, 'owner_references', 'ownerReferences') or []
+    return [owner['uid'] if isinstance(owner, dict) else owner.uid for owner in owners]
+
+
+DEFAULT_INDEXERS = {
+    NAMESPACE_INDEX: namespace_index,
+    LABEL_INDEX: label_index,
+    OWNER_INDEX: owner_index,
+}
+
+
+class Store(object):
+    """
+    Thread-safe collection of objects, keyed by (namespace, name), with indexes.
+
+    An indexer is a function that returns the list of values an object is indexed
+    under. by_index returns the objects indexed under a value.
+
+    :param indexers: dict of index name -> indexer, defaults to namespace, label and owner indexes.
+    """
+
+    def __init__(self, indexers=None):
+        self._objects = {}
+        self._indexers = dict(DEFAULT_INDEXERS if indexers is None else indexers)
+        self._indexes = dict((name, {}) for name in self._indexers)
+        self._lock = threading.RLock()
+
+    def add_indexer(self, name, indexer):
+        with self._lock:
+            self._indexers[name] = indexer
+            self._indexes[name] = {}
+            for key, obj in iteritems(self._objects):
+                self._index(name, key, obj)
+
+    def _index(self, name, key, obj):
+        index = self._indexes[name]
+        for value in self._indexers[name](obj):
+            index.setdefault(value, set()).add(key)
+
+    def _unindex(self, key, obj):
+        for name, indexer in iteritems(self._indexers):
+            index = self._indexes[name]
+            for value in indexer(obj):
+                keys = index.get(value)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del index[value]
+
+    def put(self, obj):
+        """ Add or update an object, return the version it replaced, or None """
+        key = item_key(obj)
+        with self._lock:
+            old = self._objects.get(key)
+            if old is not None:
+                self._unindex(key, old)
+            self._objects[key] = obj
+            for name in self._indexers:
+                self._index(name, key, obj)
+            return old
+
+    def delete(self, obj):
+        """ Remove an object, return the version that was stored, or None """
+        key = item_key(obj)
+        with self._lock:
+            old = self._objects.pop(key, None)
+            if old is not None:
+                self._unindex(key, old)
+            return old
+
+    def replace(self, objects):
+        """
+        Make objects the content of the store.
+
+        :return: list of (old, new) pairs, where old is None for added objects and new
+                 is None for deleted ones.
+        """
+        changes = []
+        with self._lock:
+            keys = set()
+            for obj in objects:
+                keys.add(item_key(obj))
+                old = self.put(obj)
+                if old is None or resource_version_of(old) != resource_version_of(obj):
+                    changes.append((old, obj))
+            for key in [key for key in self._objects if key not in keys]:
+                changes.append((self.delete(self._objects[key]), None))
+        return changes
+
+    def get(self, name, namespace=None):
+        with self._lock:
+            return self._objects.get((namespace, name))
+
+    def list(self):
+        with self._lock:
+            return list(self._objects.values())
+
+    def keys(self):
+        with self._lock:
+            return list(self._objects)
+
+    def by_index(self, name, value):
+        with self._lock:
+            return [self._objects[key] for key in self._indexes[name].get(value, ())]
+
+    def index_values(self, name):
+        with self._lock:
+            return list(self._indexes[name])
+
+    def __len__(self):
+        return len(self._objects)
+
+
+class _Relist(Exception):
+    """ The watch cannot be resumed, list again """
+
+
+class Informer(object):
+    """
+    Lists every object of a list method, then watches from the resourceVersion of
+    that list, keeping store up to date and calling the registered handlers. When
+    the watch cannot be resumed, e.g. with 410 Gone once the resourceVersion is too
+    old, it lists again, and the handlers are told about what changed meanwhile.
+
+    Handlers are called from the informer's thread: on_add(obj), on_update(old, new)
+    and on_delete(obj). They should not block; exceptions they raise are logged.
+
+    :param func: a generated list method, e.g. OapiApi().list_namespaced_build
+    :param indexers: dict of index name -> indexer for the store
+    :param limit: page size of the initial list, default 500
+    Other arguments are passed to func for both the list and the watch.
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.store = Store(kwargs.pop('indexers', None))
+        self.limit = kwargs.pop('limit', PAGE_SIZE)
+        self.kwargs = kwargs
+        self.resource_version = None
+        self._handlers = []
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch = None
+        self._thread = None
+
+    def add_handler(self, on_add=None, on_update=None, on_delete=None):
+        """ Register event handlers. Handlers added after the start are told about the objects already stored. """
+        self._handlers.append((on_add, on_update, on_delete))
+        if on_add is not None:
+            for obj in self.store.list():
+                self._call(on_add, obj)
+
+    def start(self):
+        """ Run the informer in a daemon thread """
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self.run)
+        self._thread.daemon = True
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.close()
+
+    @property
+    def has_synced(self):
+        """ True once the initial list is in the store """
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout=None):
+        return self._synced.wait(timeout)
+
+    def run(self):
+        """ List and watch until stop() is called """
+        while not self._stopped.is_set():
+            try:
+                self.list()
+                self.watch()
+            except _Relist as exc:
+                logger.debug('Listing again: %s', exc)
+            except Exception:
+                if self._stopped.is_set():
+                    break
+                logger.exception('Informer for %s failed, listing again in %s seconds', self.func.__name__, RETRY_PERIOD)
+                self._stopped.wait(RETRY_PERIOD)
+
+    def list(self):
+        if self.limit and supports_paging(self.func):
+            page = list_all(self.func, *self.args, limit=self.limit, **self.kwargs)
+        else:
+            page = self.func(*self.args, **self.kwargs)
+        items, _ = page_parts(page)
+        self.resource_version = resource_version_of(page)
+        for old, new in self.store.replace(items):
+            self._notify('ADDED' if old is None else 'DELETED' if new is None else 'MODIFIED', new or old, old)
+        self._synced.set()
+
+    def watch(self):
+        self._watch = Watch()
+        self._watch.resource_version = self.resource_version
+        api_client = api_client_for(self.func)
+        if hasattr(api_client, 'deserialize_data'):
+            # deserialize events like the list, in the client's response format
+            self._watch._api_client = api_client
+        kwargs = dict(self.kwargs, resource_version=self.resource_version, timeout_seconds=WATCH_TIMEOUT)
+        while not self._stopped.is_set():
+            try:
+                for event in self._watch.stream(self.func, *self.args, **kwargs):
+                    self._handle(event)
+            except ApiException as exc:
+                if exc.status == 410:
+                    raise _Relist('resourceVersion {} is too old'.format(self.resource_version))
+                raise
+            kwargs['resource_version'] = self.resource_version
+
+    def _handle(self, event):
+        event_type = event['type']
+        if event_type == 'ERROR':
+            raw = event.get('raw_object') or {}
+            raise _Relist('watch error {}: {}'.format(raw.get('code'), raw.get('message')))
+        obj = event['object']
+        if event_type in ('ADDED', 'MODIFIED'):
+            old = self.store.put(obj)
+            self._notify('ADDED' if old is None else 'MODIFIED', obj, old)
+        elif event_type == 'DELETED':
+            self.store.delete(obj)
+            self._notify(event_type, obj)
+        self.resource_version = resource_version_of(obj) or self.resource_version
+
+    def _notify(self, event_type, obj, old=None):
+        for on_add, on_update, on_delete in self._handlers:
+            if event_type == 'ADDED' and on_add is not None:
+                self._call(on_add, obj)
+            elif event_type == 'MODIFIED' and on_update is not None:
+                self._call(on_update, old, obj)
+            elif event_type == 'DELETED' and on_delete is not None:
+                self._call(on_delete, obj)
+
+    @staticmethod
+    def _call(handler, *args):
+        try:
+            handler(*args)
+        except Exception:
+            logger.exception('Informer event handler %r failed', handler)
+
+
+class InformerFactory(object):
+    """
+    Hands out one informer per list call, so that every controller of a process
+    watching the same objects shares one list, one watch and one store.
+
+        factory = InformerFactory()
+        builds = factory.informer(oapi.list_namespaced_build, 'test')
+        factory.start()
+    """
+
+    def __init__(self):
+        self._informers = {}
+        self._lock = threading.Lock()
+
+    def informer(self, func, *args, **kwargs):
+        key = call_key(func, args, kwargs)
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is None:
+                informer = self._informers[key] = Informer(func, *args, **kwargs)
+            return informer
+
+    def start(self):
+        """ Start the informers that aren't running yet """
+        with self._lock:
+            for informer in self._informers.values():
+                if informer._thread is None or not informer._thread.is_alive():
+                    informer.start()
+
+    def stop(self):
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+
+    def wait_for_sync(self, timeout=None):
+        """ Wait for every informer to list its objects, return False on timeout """
+        deadline = None if timeout is None else clock.monotonic() + timeout
+        for informer in list(self._informers.values()):
+            remaining = None if deadline is None else max(0, deadline - clock.monotonic())
+            if not informer.wait_for_sync(remaining):
+                return False
+        return True
+
+
+class DeltaFIFO(object):
+    """
+    Queue of objects to reconcile that holds at most one entry per object. While an
+    object waits, new events for it only replace its state with the latest one, so
+    workers handle each object once however many events it had. An object that
+    changes while a worker handles it is queued again when the worker calls done(),
+    and never handed to two workers at once.
+
+    With min_interval, an object is handed out at most once every min_interval
+    seconds; events in between are coalesced.
+
+        fifo = DeltaFIFO(min_interval=1)
+        informer.add_handler(**fifo.handlers())
+        threading.Thread(target=fifo.run, args=(reconcile,)).start()
+
+    The event type handed out is the latest one, except that an object ADDED and
+    then MODIFIED is still ADDED. metrics() reports how many events were queued,
+    coalesced and delivered.
+
+    :param min_interval: seconds between two deliveries of the same object.
+    :param key: function returning the key of an object, default (namespace, name).
+    """
+
+    def __init__(self, min_interval=0, key=item_key):
+        self.min_interval = min_interval
+        self.key = key
+        self.added = 0
+        self.coalesced = 0
+        self.delivered = 0
+        # key -> [event type, object] waiting to be handed out
+        self._items = {}
+        self._ready = deque()
+        # (due time, sequence, key) of objects held back by min_interval
+        self._delayed = []
+        self._sequence = itertools.count()
+        self._processing = set()
+        self._last_delivery = {}
+        # (expiry, key) of the entries of _last_delivery, pruned by put() and get()
+        self._expiries = []
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def put(self, event_type, obj):
+        key = self.key(obj)
+        with self._cond:
+            self._expire(clock.monotonic())
+            self.added += 1
+            item = self._items.get(key)
+            if item is not None:
+                self.coalesced += 1
+                item[:] = ['ADDED' if item[0] == 'ADDED' and event_type == 'MODIFIED' else event_type, obj]
+                return
+            self._items[key] = [event_type, obj]
+            if key not in self._processing:
+                self._schedule(key)
+
+    def _expire(self, now):
+        while self._expiries and self._expiries[0][0] <= now:
+            key = heapq.heappop(self._expiries)[1]
+            # a later delivery of the key has an entry of its own further down the heap
+            if self._last_delivery.get(key, now) + self.min_interval <= now:
+                del self._last_delivery[key]
+
+    def _schedule(self, key):
+        due = self._last_delivery.get(key, 0) + self.min_interval
+        if self.min_interval and due > clock.monotonic():
+            heapq.heappush(self._delayed, (due, next(self._sequence), key))
+        else:
+            self._ready.append(key)
+        self._cond.notify_all()
+
+    def get(self, timeout=None):
+        """
+        Wait for the next object to handle, and return (key, event type, object), or
+        None on timeout or once the queue is closed and empty. Call done(key) after
+        handling it.
+        """
+        deadline = None if timeout is None else clock.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = clock.monotonic()
+                self._expire(now)
+                while self._delayed and (self._closed or self._delayed[0][0] <= now):
+                    self._ready.append(heapq.heappop(self._delayed)[2])
+                if self._ready or (self._closed and not self._items):
+                    break
+                wait = self._delayed[0][0] - now if self._delayed else None
+                if deadline is not None:
+                    if deadline <= now:
+                        return None
+                    wait = min(wait, deadline - now) if wait is not None else deadline - now
+                self._cond.wait(wait)
+            if not self._ready:
+                return None
+            key = self._ready.popleft()
+            event_type, obj = self._items.pop(key)
+            self._processing.add(key)
+            if self.min_interval:
+                now = clock.monotonic()
+                self._last_delivery[key] = now
+                heapq.heappush(self._expiries, (now + self.min_interval, key))
+            self.delivered += 1
+            return key, event_type, obj
+
+    def done(self, key):
+        """ Mark an object handed out by get() as handled """
+        with self._cond:
+            self._processing.discard(key)
+            if key in self._items:
+                self._schedule(key)
+
+    def run(self, handler):
+        """ Call handler(key, event_type, obj) for every object until the queue is closed """
+        while True:
+            item = self.get()
+            if item is None:
+                return
+            try:
+                handler(*item)
+            except Exception:
+                logger.exception('DeltaFIFO handler %r failed for %s', handler, item[0])
+            finally:
+                self.done(item[0])
+
+    def handlers(self):
+        """ Informer event handlers that queue the objects, for Informer.add_handler(**fifo.handlers()) """
+        return {
+            'on_add': lambda obj: self.put('ADDED', obj),
+            'on_update': lambda old, new: self.put('MODIFIED', new),
+            'on_delete': lambda obj: self.put('DELETED', obj),
+        }
+
+    def close(self):
+        """
+        Make get() return None once the queue is empty. Objects held back by
+        min_interval are handed out right away, and objects changed while they are
+        handled once they are done.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def metrics(self):
+        with self._cond:
+            return {'depth': len(self._items), 'added': self.added, 'coalesced': self.coalesced, 'delivered': self.delivered}
+
+    def __len__(self):
+        return len(self._items)
@@ -0,0 +1,429 @@
+from __future__ import absolute_import
+
+import codecs
+import json
+import pydoc
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from kubernetes.client.rest import ApiException
+from six import iteritems
+
+from openshift import client
+from openshift.client.resource import ResourceObject, wrap
+
+PYDOC_RETURN_LABEL = ":return:"
+TYPE_LIST_SUFFIX = "List"
+CHUNK_SIZE = 64 * 1024
+PAGE_SIZE = 500
+MAX_RESTARTS = 3
+MAX_WORKERS = 8
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def item_type(func):
+    """ Return the swagger type of the items returned by a generated list method, e.g. V1Image for list_image """
+    for line in pydoc.getdoc(func).splitlines():
+        if line.startswith(PYDOC_RETURN_LABEL):
+            return_type = line[len(PYDOC_RETURN_LABEL):].strip()
+            if return_type.endswith(TYPE_LIST_SUFFIX):
+                return return_type[:-len(TYPE_LIST_SUFFIX)]
+            return return_type
+    return None
+
+
+def supports_paging(func):
+    """ Return True if a generated list method takes the limit and _continue parameters """
+    doc = pydoc.getdoc(func)
+    return ':param str _continue:' in doc and ':param int limit:' in doc
+
+
+def api_client_for(func):
+    """ Return the ApiClient a generated API method is bound to """
+    api = getattr(func, '__self__', None)
+    api_client = getattr(api, 'api_client', None)
+    if api_client is None:
+        api_client = client.ApiClient()
+    return api_client
+
+
+class ListStream(object):
+    """
+    Iterate over the items of a LIST response while it is still being read.
+
+    The response body is decoded in chunks, and each element of the top level
+    "items" array is deserialized and yielded as soon as it is complete, so memory
+    use is bounded by the size of one item rather than the whole list. The other top
+    level fields (kind, apiVersion, metadata) are collected in the metadata dict as
+    they are parsed.
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.api_client = api_client_for(func)
+        self.item_type = item_type(func)
+        self.metadata = {}
+
+    def __iter__(self):
+        kwargs = dict(self.kwargs, _preload_content=False)
+        response = self.func(*self.args, **kwargs)
+        try:
+            for item in self._parse(response.stream(CHUNK_SIZE, decode_content=True)):
+                if self.item_type:
+                    item = self.api_client.deserialize_data(item, self.item_type)
+                yield item
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _parse(self, chunks):
+        reader = _BufferReader(chunks)
+        reader.expect('{')
+        if reader.peek() == '}':
+            return
+        while True:
+            key = reader.value()
+            reader.expect(':')
+            if key == 'items' and reader.peek() == '[':
+                reader.expect('[')
+                if reader.peek() == ']':
+                    reader.expect(']')
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.next_char(',]') == ']':
+                            break
+            else:
+                self.metadata[key] = reader.value()
+            if reader.next_char(',}') == '}':
+                return
+
+
+class _BufferReader(object):
+    """ Minimal incremental JSON tokenizer over an iterator of byte chunks """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.text = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        if self.eof:
+            raise ValueError("Unexpected end of JSON list response")
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.eof = True
+            self.buffer += self.text.decode(b'', final=True)
+            return
+        if isinstance(chunk, bytes):
+            chunk = self.text.decode(chunk)
+        self.buffer += chunk
+
+    def _skip_whitespace(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return
+            self._fill()
+
+    def peek(self):
+        self._skip_whitespace()
+        return self.buffer[self.pos]
+
+    def next_char(self, allowed):
+        char = self.peek()
+        if char not in allowed:
+            raise ValueError("Expected one of {!r} at position {} of JSON list response, got {!r}".format(allowed, self.pos, char))
+        self.pos += 1
+        return char
+
+    def expect(self, char):
+        self.next_char(char)
+
+    def value(self):
+        """
+        Decode the next complete JSON value. A value is only accepted once something
+        follows it in the buffer, so a number split across two chunks is never cut short.
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def iter_list(func, *args, **kwargs):
+    """
+    Stream the items of a list call one at a time instead of loading the whole response.
+
+        for image in iter_list(oapi.list_image):
+            print(image.metadata.name)
+
+    :param func: a generated list method, e.g. OapiApi().list_image
+    :return: ListStream, an iterable of deserialized items
+    """
+    return ListStream(func, *args, **kwargs)
+
+
+def page_parts(page):
+    """ Return the items and the continue token of a list response in any response format """
+    if isinstance(page, dict):
+        return page.get('items') or [], (page.get('metadata') or {}).get('continue')
+    metadata = page.metadata
+    return page.items or [], getattr(metadata, '_continue', None) if metadata is not None else None
+
+
+def _metadata_of(obj):
+    return obj.get('metadata') if isinstance(obj, dict) else getattr(obj, 'metadata', None)
+
+
+def metadata_field(obj, attr, key):
+    """ A metadata field of an object in any response format, by model attribute and JSON key """
+    metadata = _metadata_of(obj)
+    if metadata is None:
+        return None
+    if isinstance(metadata, dict):
+        return metadata.get(key)
+    return getattr(metadata, attr, None)
+
+
+def item_key(item):
+    """ (namespace, name) of a listed item in any response format """
+    metadata = _metadata_of(item)
+    if metadata is None:
+        return None
+    if isinstance(metadata, dict):
+        return metadata.get('namespace'), metadata.get('name')
+    return metadata.namespace, metadata.name
+
+
+def resource_version_of(obj):
+    """ resourceVersion of an object or list in any response format """
+    return metadata_field(obj, 'resource_version', 'resourceVersion')
+
+
+def call_key(func, args, kwargs):
+    """ Hashable key of a call of a generated API method, with its client and arguments """
+    return id(api_client_for(func)), func.__name__, args, tuple(sorted(iteritems(kwargs)))
+
+
+class Paginator(object):
+    """
+    Iterate over every item of a list call, requesting limit items at a time and
+    following the continue token of each page.
+
+    The first page is requested inline. While the items of one page are being
+    consumed, the next page is already being requested on a single thread owned by
+    the paginator, never on the executor of the ApiClient, so paginating from a task
+    running on that executor cannot wait on a full pool. When the server answers
+    410 Gone because the continue token expired, the list is restarted from the
+    beginning, and the items up to the end of the last page yielded are skipped.
+    Only the keys of that page are kept for this, which relies on the server
+    listing objects in the same order every time, as continue tokens do.
+
+    The list response of the last page read is kept in the page attribute.
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.limit = kwargs.pop('limit', None) or PAGE_SIZE
+        self.prefetch = kwargs.pop('prefetch', True)
+        self.kwargs = kwargs
+        self.page = None
+
+    def _submit(self, executor, continue_token):
+        kwargs = dict(self.kwargs, limit=self.limit)
+        if continue_token:
+            kwargs['_continue'] = continue_token
+        return executor.submit(self.func, *self.args, **kwargs)
+
+    def __iter__(self):
+        inline = _Inline()
+        own_executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        prefetcher = own_executor or inline
+
+        # keys of the last page yielded, and its last key, to find where to resume after a restart
+        last_page, last_key = None, None
+        skipping = in_last_page = False
+        restarts = 0
+        future = self._submit(inline, None)
+        try:
+            while future is not None:
+                try:
+                    self.page = future.result()
+                except ApiException as exc:
+                    if exc.status != 410 or restarts >= MAX_RESTARTS:
+                        raise
+                    # expired continue token, relist and skip what was already yielded
+                    restarts += 1
+                    skipping, in_last_page = last_page is not None, False
+                    future = self._submit(inline, None)
+                    continue
+
+                items, continue_token = page_parts(self.page)
+                future = self._submit(prefetcher, continue_token) if continue_token else None
+                page_keys = set()
+                for item in items:
+                    key = item_key(item)
+                    if skipping:
+                        if key in last_page:
+                            in_last_page = True
+                            skipping = key != last_key
+                            continue
+                        if not in_last_page:
+                            continue
+                        # past the last page yielded, whose last item was deleted meanwhile
+                        skipping = False
+                    page_keys.add(key)
+                    yield item
+                if page_keys:
+                    last_page, last_key = page_keys, key
+        finally:
+            if future is not None:
+                future.cancel()
+            if own_executor is not None:
+                own_executor.shutdown(wait=False)
+
+
+class _Inline(object):
+    """ Executor stand-in that makes the call when submit is called """
+
+    def submit(self, func, *args, **kwargs):
+        return _Done(func, args, kwargs)
+
+
+class _Done(object):
+
+    def __init__(self, func, args, kwargs):
+        self.func, self.args, self.kwargs = func, args, kwargs
+
+    def result(self):
+        return self.func(*self.args, **self.kwargs)
+
+    def cancel(self):
+        return False
+
+
+def paginate(func, *args, **kwargs):
+    """
+    Iterate over every item of a list call, one page of limit items at a time.
+
+        for build in paginate(oapi.list_namespaced_build, 'test', limit=200):
+            print(build.metadata.name)
+
+    :param func: a generated list method, e.g. OapiApi().list_namespaced_build
+    :param limit: page size, default 500
+    :param prefetch: request the next page while the current one is consumed, default True
+    :return: Paginator, an iterable of deserialized items
+    """
+    return Paginator(func, *args, **kwargs)
+
+
+def list_all(func, *args, **kwargs):
+    """
+    Make a list call in pages, and return the list response of the last page with the
+    items of every page. Takes the same arguments as paginate.
+    """
+    paginator = Paginator(func, *args, **kwargs)
+    items = list(paginator)
+    page = paginator.page
+    if isinstance(page, ResourceObject):
+        page = page.to_dict()
+        items = [item.to_dict() if isinstance(item, ResourceObject) else item for item in items]
+        metadata = dict(page.get('metadata') or {})
+        metadata.pop('continue', None)
+        return wrap(dict(page, items=items, metadata=metadata))
+    if isinstance(page, dict):
+        page['items'] = items
+        page.setdefault('metadata', {}).pop('continue', None)
+    else:
+        page.items = items
+        if page.metadata is not None:
+            page.metadata._continue = None
+    return page
+
+
+def project_names(api_client):
+    """ Names of the projects the user of api_client can see """
+    return [item_key(project)[1] for project in paginate(client.OapiApi(api_client).list_project)]
+
+
+def list_in_namespaces(func, namespaces=None, max_workers=None, skip_status=(403, 404), **kwargs):
+    """
+    List a namespaced kind in many namespaces at once, for users who cannot list it
+    across all namespaces:
+
+        for namespace, route in list_in_namespaces(oapi.list_namespaced_route, max_workers=20):
+            print(namespace, route.metadata.name)
+
+    One list call per namespace runs on the executor of the ApiClient behind func,
+    with at most max_workers calls in flight. When max_workers is larger than the
+    client's max_workers, the calls run on an executor of their own instead. Items
+    are yielded, tagged with their namespace, as soon as the list of their namespace
+    completes, so namespaces come back in completion order. Namespaces whose list
+    fails with a status in skip_status, e.g. deleted or forbidden projects, are
+    skipped.
+
+    :param func: a generated list_namespaced_* method
+    :param namespaces: iterable of namespace names, defaults to every project the user can see
+    :param max_workers: maximum number of list calls in flight, defaults to the client's max_workers
+    :param kwargs: passed to every list call, e.g. label_selector
+    :return: iterator of (namespace, item)
+    """
+    api_client = api_client_for(func)
+    if namespaces is None:
+        namespaces = project_names(api_client)
+    window = max_workers or getattr(api_client, 'max_workers', MAX_WORKERS)
+    own_executor = None
+    if hasattr(api_client, 'submit') and window <= api_client.max_workers:
+        executor = api_client
+    else:
+        executor = own_executor = ThreadPoolExecutor(max_workers=window)
+
+    namespaces = iter(namespaces)
+    pending = {}
+
+    def submit_next():
+        for namespace in namespaces:
+            pending[executor.submit(func, namespace, **kwargs)] = namespace
+            return True
+        return False
+
+    try:
+        while len(pending) < window and submit_next():
+            pass
+        while pending:
+            done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                namespace = pending.pop(future)
+                submit_next()
+                try:
+                    items, _ = page_parts(future.result())
+                except ApiException as exc:
+                    if exc.status in skip_status:
+                        continue
+                    raise
+                for item in items:
+                    yield namespace, item
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor is not None:
+            own_executor.shutdown(wait=False)
@@ -1,11 +1,645 @@
+import json
+import logging
+import socket
+import threading
+import time
+from collections import deque
+
+from kubernetes.client.rest import ApiException
 from kubernetes.watch import Watch as K8sWatch
+from kubernetes.watch import watch as k8s_watch
+from six.moves import queue
+from urllib3.exceptions import ReadTimeoutError
 
 from openshift import client
+from openshift.client import clock
+from openshift.client.protobuf import PROTOBUF, iter_frames
+from openshift.client.retry import CONNECTION_ERRORS, RETRY_STATUSES, RetryPolicy
+from openshift.listing import api_client_for, call_key, item_key, list_all, page_parts, resource_version_of, supports_paging
+
+CHUNK_SIZE = 64 * 1024
+# failures that end a watch request but allow to resume it
+RESUMABLE_ERRORS = CONNECTION_ERRORS + (ReadTimeoutError,)
+# parameters of a watch request that the list made on 410 Gone doesn't take
+WATCH_PARAMS = ('watch', '_preload_content', 'resource_version', 'timeout_seconds')
+
+# what a full EventQueue does with a new event
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+COALESCE = 'coalesce'
+
+logger = logging.getLogger(__name__)
+
+
+def content_type(resp):
+    headers = getattr(resp, 'headers', None) or {}
+    return headers.get('Content-Type', '')
+
+
+def content_encoding(resp):
+    headers = getattr(resp, 'headers', None) or {}
+    return headers.get('Content-Encoding', '').lower()
+
+
+def iter_decoded_lines(resp):
+    """ Like kubernetes.watch.watch.iter_resp_lines, but lets urllib3 decompress the chunks """
+    prev = b''
+    for seg in resp.read_chunked(decode_content=True):
+        lines = (prev + seg).split(b'\n')
+        prev = lines.pop()
+        for line in lines:
+            if line:
+                yield line.decode('utf8')
+    if prev:
+        yield prev.decode('utf8')
+
+
+class EventQueue(object):
+    """
+    Bounded queue between a watch's reader thread and its consumer.
+
+    When the queue is full, put() waits for room with overflow=BLOCK, and discards
+    the oldest event with DROP_OLDEST. With COALESCE, an event for an object that
+    already has an event waiting is merged into it instead, wherever the queue is:
+    the waiting event gets the newer object, and an ADDED followed by DELETED
+    cancel out. Other events wait for room.
+
+    metrics() reports the current and highest depth, and the events dropped and
+    coalesced.
+    """
+
+    def __init__(self, maxsize, overflow=BLOCK):
+        if overflow not in (BLOCK, DROP_OLDEST, COALESCE):
+            raise ValueError("overflow must be one of {}, {} or {}, got {}".format(BLOCK, DROP_OLDEST, COALESCE, overflow))
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.depth = 0
+        self.max_depth = 0
+        self.dropped = 0
+        self.coalesced = 0
+        # [key, event] entries, event is None once cancelled
+        self._entries = deque()
+        self._pending = {}
+        self._end = None
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def _key(event):
+        obj = event.get('object')
+        if event.get('type') == 'ERROR' or obj is None or isinstance(obj, dict):
+            return None
+        return item_key(obj)
+
+    def put(self, event, block=True):
+        """
+        Queue an event, return False if the queue was closed. With block=False, a
+        put that would have to wait for room raises queue.Full instead.
+        """
+        with self._cond:
+            key = self._key(event) if self.overflow == COALESCE else None
+            entry = self._pending.get(key) if key is not None else None
+            if entry is not None and entry[1]['type'] != 'DELETED' and event['type'] != 'ADDED':
+                self._coalesce(entry, event)
+                return self._end is None
+            while self.depth >= self.maxsize and self._end is None:
+                if self.overflow == DROP_OLDEST:
+                    self._pop()
+                    self.dropped += 1
+                elif not block:
+                    raise queue.Full
+                else:
+                    self._cond.wait()
+            if self._end is not None:
+                return False
+            entry = [key, event]
+            self._entries.append(entry)
+            if key is not None:
+                self._pending[key] = entry
+            self.depth += 1
+            self.max_depth = max(self.max_depth, self.depth)
+            self._cond.notify_all()
+            return True
+
+    def _coalesce(self, entry, event):
+        self.coalesced += 1
+        if entry[1]['type'] == 'ADDED' and event['type'] == 'DELETED':
+            entry[1] = None
+            del self._pending[entry[0]]
+            self.depth -= 1
+            self._cond.notify_all()
+        else:
+            entry[1] = dict(event, type=entry[1]['type'] if entry[1]['type'] == 'ADDED' else event['type'])
+
+    def _pop(self):
+        while True:
+            entry = self._entries.popleft()
+            if entry[0] is not None and self._pending.get(entry[0]) is entry:
+                del self._pending[entry[0]]
+            if entry[1] is not None:
+                self.depth -= 1
+                return entry[1]
+
+    def get(self, timeout=None):
+        """
+        Next event, or what close() was called with once the queue is empty. Raises
+        queue.Empty if neither came within timeout seconds.
+        """
+        deadline = None if timeout is None else clock.monotonic() + timeout
+        with self._cond:
+            while not self.depth and self._end is None:
+                if deadline is None:
+                    self._cond.wait()
+                    continue
+                remaining = deadline - clock.monotonic()
+                if remaining <= 0:
+                    raise queue.Empty
+                self._cond.wait(remaining)
+            if not self.depth:
+                return self._end
+            event = self._pop()
+            self._cond.notify_all()
+            return event
+
+    def close(self, end=None):
+        """ End the queue, get() returns end once the events queued are consumed """
+        with self._cond:
+            if self._end is None:
+                self._end = _END if end is None else end
+            self._cond.notify_all()
+
+    def metrics(self):
+        with self._cond:
+            return {'depth': self.depth, 'max_depth': self.max_depth, 'dropped': self.dropped, 'coalesced': self.coalesced}
+
+    def __len__(self):
+        return self.depth
 
 
 class Watch(K8sWatch):
+    """
+    Watch that deserializes events into OpenShift as well as Kubernetes models.
+
+    With protobuf=True, the watch asks the server for a protobuf stream when the client
+    behind the watched function has protobuf enabled and schemas for the watched type,
+    and decodes the length-delimited frames. Any other response is read as JSON lines,
+    decompressing them first when the server sent a compressed stream.
+
+    With resilient=True, the stream only ends when stop() is called. It reconnects
+    from the last resourceVersion seen whenever the request ends, times out, or
+    fails with a connection error or a 5xx status, backing off between failed
+    attempts. When the server answers 410 Gone because that resourceVersion is too
+    old, it lists the objects again and yields ADDED, MODIFIED and DELETED events
+    for the differences from the objects it had seen, marked with 'synthetic': True,
+    then resumes watching from the list's resourceVersion. Objects that existed
+    before a watch started from a given resource_version are only known after the
+    server sends an event for them, so a relist reports them as ADDED.
 
-    def __init__(self, return_type=None):
+    With queue_size set, events are read and deserialized on a separate thread into
+    an EventQueue of that size, so that the connection keeps being drained while the
+    consumer is busy. overflow says what happens when the queue is full, see
+    EventQueue; events holds the queue of the current stream, for its metrics().
+    Dropping or coalescing events skips resourceVersions, so consumers that keep a
+    copy of the objects should use BLOCK.
+    """
+
+    # failures a resilient watch reconnects after
+    resumable_errors = RESUMABLE_ERRORS
+
+    def __init__(self, return_type=None, protobuf=False, resilient=False, queue_size=0, overflow=BLOCK):
         self._raw_return_type = return_type
         self._stop = False
         self._api_client = client.ApiClient()
+        self.resource_version = 0
+        self.protobuf = protobuf
+        self.resilient = resilient
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.events = None
+        self._response = None
+
+    def stream(self, func, *args, **kwargs):
+        """Watch an API resource and stream the result back via a generator.
+
+        See kubernetes.watch.Watch.stream for the arguments and the event format.
+        """
+        self._stop = False
+        return_type = self.get_return_type(func)
+        kwargs['watch'] = True
+        kwargs['_preload_content'] = False
+
+        if self.resilient:
+            events = self._resilient_stream(func, args, kwargs, return_type)
+        else:
+            events = self._stream(func, args, kwargs, return_type)
+        if self.queue_size:
+            events = self._background(events)
+        for event in events:
+            yield event
+
+    def close(self):
+        """
+        Stop the watch and shut down the connection of the response it is reading,
+        so a watch blocked waiting for the next event ends right away instead of at
+        the next event or the server's timeout. Can be called from any thread.
+        """
+        self.stop()
+        resp = self._response
+        if resp is None:
+            return
+        sock = getattr(getattr(resp, '_connection', None), 'sock', None)
+        if sock is not None:
+            try:
+                # closing the socket alone doesn't wake up a thread blocked reading it
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+        resp.close()
+
+    def _background(self, events):
+        """ Consume events on a reader thread, and yield them from an EventQueue """
+        event_queue = self.events = EventQueue(self.queue_size, self.overflow)
+
+        def read():
+            try:
+                for event in events:
+                    if not event_queue.put(event) or self._stop:
+                        break
+                event_queue.close()
+            except Exception as exc:
+                event_queue.close(exc)
+
+        reader = threading.Thread(target=read)
+        reader.daemon = True
+        reader.start()
+        try:
+            while True:
+                event = event_queue.get()
+                if event is _END:
+                    break
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+                if self._stop:
+                    break
+        finally:
+            # unblock and end the reader if the consumer stopped first, closing the
+            # response it may be waiting on for the next event
+            self.close()
+            event_queue.close()
+
+    def _stream(self, func, args, kwargs, return_type):
+        timeouts = ('timeout_seconds' in kwargs)
+        while True:
+            resp = self._response = self._open(func, args, kwargs)
+            try:
+                for event in self._iter_events(resp, return_type):
+                    yield event
+                    if self._stop:
+                        break
+            finally:
+                kwargs['resource_version'] = self.resource_version
+                self._response = None
+                resp.close()
+                resp.release_conn()
+
+            if timeouts or self._stop:
+                break
+
+    def _resilient_stream(self, func, args, kwargs, return_type):
+        if kwargs.get('resource_version'):
+            self.resource_version = kwargs['resource_version']
+        backoff = RetryPolicy(max_backoff=30.0)
+        known = {}
+        failures = 0
+        relist = False
+        while not self._stop:
+            failed = False
+            try:
+                if relist:
+                    for event in self._relist(func, args, kwargs, known):
+                        yield event
+                    relist = False
+                    kwargs['resource_version'] = self.resource_version
+                    if self._stop:
+                        break
+                resp = self._response = self._open(func, args, kwargs)
+            except ApiException as exc:
+                if exc.status == 410:
+                    relist = True
+                elif exc.status in RETRY_STATUSES:
+                    logger.debug('Watch request failed with %s, retrying', exc.status)
+                    failed = True
+                else:
+                    raise
+            except self.resumable_errors as exc:
+                logger.debug('Watch request failed: %s', exc)
+                failed = True
+            else:
+                try:
+                    for event in self._iter_events(resp, return_type):
+                        if event['type'] == 'ERROR':
+                            relist = (event['raw_object'] or {}).get('code') == 410
+                            if relist:
+                                break
+                            failed = True
+                        else:
+                            key = item_key(event['object'])
+                            if event['type'] == 'DELETED':
+                                known.pop(key, None)
+                            else:
+                                known[key] = event['object']
+                        yield event
+                        if self._stop:
+                            break
+                except self.resumable_errors as exc:
+                    logger.debug('Watch interrupted: %s', exc)
+                    failed = True
+                finally:
+                    self._response = None
+                    resp.close()
+                    resp.release_conn()
+
+            if failed and not self._stop:
+                failures += 1
+                time.sleep(backoff.delay(min(failures - 1, 10)))
+            else:
+                failures = 0
+            if self.resource_version and not relist:
+                kwargs['resource_version'] = self.resource_version
+
+    def _relist(self, func, args, kwargs, known):
+        """ List again after 410 Gone, and yield events for what changed since the last event seen """
+        list_kwargs = dict((key, value) for key, value in kwargs.items() if key not in WATCH_PARAMS)
+        if supports_paging(func):
+            page = list_all(func, *args, **list_kwargs)
+        else:
+            page = func(*args, **list_kwargs)
+        items, _ = page_parts(page)
+        self.resource_version = resource_version_of(page)
+
+        listed = set()
+        for item in items:
+            key = item_key(item)
+            listed.add(key)
+            old = known.get(key)
+            if old is not None and resource_version_of(old) == resource_version_of(item):
+                continue
+            known[key] = item
+            yield self._synthetic_event('ADDED' if old is None else 'MODIFIED', item)
+        for key in [key for key in known if key not in listed]:
+            yield self._synthetic_event('DELETED', known.pop(key))
+
+    def _synthetic_event(self, event_type, obj):
+        raw_object = obj if isinstance(obj, dict) else self._api_client.sanitize_for_serialization(obj)
+        return {'type': event_type, 'object': obj, 'raw_object': raw_object, 'synthetic': True}
+
+    def _open(self, func, args, kwargs):
+        if not self.protobuf:
+            return func(*args, **kwargs)
+        with api_client_for(func).protobuf_stream():
+            return func(*args, **kwargs)
+
+    def _iter_events(self, resp, return_type):
+        if self._stop:
+            # close() was called while the request was being sent, and found no response to close
+            return
+        if content_type(resp).startswith(PROTOBUF):
+            for frame in iter_frames(resp.stream(CHUNK_SIZE)):
+                yield self.unmarshal_protobuf_event(frame, return_type)
+        elif content_encoding(resp) in ('gzip', 'deflate'):
+            for line in iter_decoded_lines(resp):
+                yield self.unmarshal_event(line, return_type)
+        else:
+            for line in k8s_watch.iter_resp_lines(resp):
+                yield self.unmarshal_event(line, return_type)
+
+    def unmarshal_event(self, data, return_type):
+        js = json.loads(data)
+        js['raw_object'] = js['object']
+        if return_type:
+            js['object'] = self._api_client.deserialize_data(js['raw_object'], 'V1Status' if js['type'] == 'ERROR' else return_type)
+            self._update_resource_version(js['raw_object'])
+        return js
+
+    def unmarshal_protobuf_event(self, frame, return_type):
+        event_type, raw_object = self._api_client.protobuf_codec.decode_watch_event(frame, return_type)
+        event = {'type': event_type, 'raw_object': raw_object, 'object': raw_object}
+        if return_type:
+            event['object'] = self._api_client.deserialize_data(raw_object, 'V1Status' if event_type == 'ERROR' else return_type)
+            self._update_resource_version(raw_object)
+        return event
+
+    def _update_resource_version(self, raw_object):
+        resource_version = (raw_object.get('metadata') or {}).get('resourceVersion') if isinstance(raw_object, dict) else None
+        if resource_version:
+            self.resource_version = resource_version
+
+
+# seconds a shared watch is kept open after its last subscriber left
+IDLE_TIMEOUT = 30
+# timeout_seconds of the requests of a shared watch, so that it notices stop() when no events come
+SHARED_WATCH_TIMEOUT = 300
+# client side timeout of those requests, which ends a shared watch whose connection stalled
+SHARED_WATCH_REQUEST_TIMEOUT = SHARED_WATCH_TIMEOUT + 30
+# events a subscription holds before it discards the oldest ones
+SUBSCRIPTION_QUEUE_SIZE = 1000
+
+_END = object()
+
+
+class Subscription(object):
+    """
+    One consumer's view of a watch shared through a WatchMultiplexer. Iterating
+    over it yields the events of the shared watch from the moment it subscribed,
+    until it is closed, the shared watch fails, or no event came for timeout
+    seconds. Like Watch, it has stop(), so it can stand in for a watch.
+
+    Close subscriptions that are not iterated to the end: the shared watch stays
+    open as long as it has subscribers. Events wait in an EventQueue of maxsize
+    events. With the default overflow, DROP_OLDEST, a subscription that falls
+    behind loses the oldest ones, counted by dropped. With COALESCE, it keeps the
+    latest event of every object; once its queue is full of distinct objects, it
+    is unsubscribed, and iterating over it raises queue.Full after the events it
+    holds, so a slow consumer never holds up the shared watch.
+    """
+
+    def __init__(self, multiplexer, upstream, timeout=None, maxsize=SUBSCRIPTION_QUEUE_SIZE, overflow=DROP_OLDEST):
+        self.timeout = timeout
+        self._multiplexer = multiplexer
+        self._upstream = upstream
+        self._queue = EventQueue(maxsize, overflow)
+        self._closed = False
+
+    @property
+    def dropped(self):
+        return self._queue.dropped
+
+    def put(self, event):
+        if event is _END or isinstance(event, Exception):
+            self._queue.close(event)
+            return
+        try:
+            self._queue.put(event, block=False)
+        except queue.Full:
+            self._queue.close(queue.Full('Subscription fell {} objects behind its shared watch'.format(self._queue.maxsize)))
+            self._multiplexer._unsubscribe(self._upstream, self)
+
+    def __iter__(self):
+        try:
+            while not self._closed:
+                try:
+                    event = self._queue.get(self.timeout)
+                except queue.Empty:
+                    break
+                if event is _END:
+                    break
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+        finally:
+            self.close()
+
+    def close(self):
+        """ Unsubscribe from the shared watch """
+        if not self._closed:
+            self._closed = True
+            self._queue.close()
+            self._multiplexer._unsubscribe(self._upstream, self)
+
+    stop = close
+
+
+class _Upstream(object):
+    """ The server watch behind a WatchMultiplexer key """
+
+    def __init__(self, multiplexer, key, func, args, kwargs):
+        self.key = key
+        self.subscribers = set()
+        self.idle_timer = None
+        self.watch = Watch(resilient=True)
+        api_client = api_client_for(func)
+        if hasattr(api_client, 'deserialize_data'):
+            self.watch._api_client = api_client
+        self._multiplexer = multiplexer
+        self._func = func
+        self._args = args
+        self._kwargs = dict(kwargs, timeout_seconds=SHARED_WATCH_TIMEOUT, _request_timeout=SHARED_WATCH_REQUEST_TIMEOUT)
+        # a stalled connection ends the shared watch, so that its key is freed for a new one
+        self.watch.resumable_errors = CONNECTION_ERRORS
+
+    def start(self):
+        thread = threading.Thread(target=self.run)
+        thread.daemon = True
+        thread.start()
+
+    def run(self):
+        end = _END
+        try:
+            for event in self.watch.stream(self._func, *self._args, **self._kwargs):
+                self._multiplexer._publish(self, event)
+        except Exception as exc:
+            logger.debug('Shared watch %s failed: %s', self.key, exc)
+            end = exc
+        self._multiplexer._ended(self, end)
+
+
+class WatchMultiplexer(object):
+    """
+    Shares one server watch between every consumer of the same list call. The watch
+    is opened by the first subscriber, each subscriber gets every event in its own
+    queue, and the watch is closed idle_timeout seconds after the last subscriber
+    left, unless a new one arrived meanwhile.
+
+        subscription = shared_watches.subscribe(oapi.list_namespaced_build, 'test', timeout=20)
+        for event in subscription:
+            ...
+        subscription.close()
+
+    Shared watches are resilient Watches, so they resume after timeouts and errors.
+    """
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._upstreams = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, func, *args, **kwargs):
+        """
+        Subscribe to the watch of a generated list method.
+
+        :param timeout: seconds after which iterating over the subscription ends if no event came.
+        :param overflow: what the subscription's queue does when it is full, DROP_OLDEST or COALESCE.
+        Other arguments, e.g. the namespace and selectors, are passed to func and are
+        part of the key that watches are shared by.
+        :return: Subscription
+        """
+        timeout = kwargs.pop('timeout', None)
+        overflow = kwargs.pop('overflow', DROP_OLDEST)
+        key = call_key(func, args, kwargs)
+        with self._lock:
+            upstream = self._upstreams.get(key)
+            start = upstream is None
+            if start:
+                upstream = self._upstreams[key] = _Upstream(self, key, func, args, kwargs)
+            elif upstream.idle_timer is not None:
+                upstream.idle_timer.cancel()
+                upstream.idle_timer = None
+            subscription = Subscription(self, upstream, timeout, overflow=overflow)
+            upstream.subscribers.add(subscription)
+        if start:
+            upstream.start()
+        return subscription
+
+    def _unsubscribe(self, upstream, subscription):
+        with self._lock:
+            upstream.subscribers.discard(subscription)
+            if upstream.subscribers or self._upstreams.get(upstream.key) is not upstream:
+                return
+            if not self.idle_timeout:
+                self._close(upstream)
+                return
+            timer = threading.Timer(self.idle_timeout, lambda: self._close_idle(upstream, timer))
+            timer.daemon = True
+            upstream.idle_timer = timer
+            timer.start()
+
+    def _close_idle(self, upstream, timer):
+        with self._lock:
+            if upstream.idle_timer is timer and not upstream.subscribers:
+                self._close(upstream)
+
+    def _close(self, upstream):
+        del self._upstreams[upstream.key]
+        upstream.idle_timer = None
+        upstream.watch.close()
+
+    def _publish(self, upstream, event):
+        with self._lock:
+            subscribers = list(upstream.subscribers)
+        # Subscription.put never blocks, a subscriber that cannot keep up is dropped instead
+        for subscriber in subscribers:
+            subscriber.put(event)
+
+    def _ended(self, upstream, end):
+        with self._lock:
+            if self._upstreams.get(upstream.key) is upstream:
+                del self._upstreams[upstream.key]
+            subscribers = list(upstream.subscribers)
+            upstream.subscribers.clear()
+        for subscriber in subscribers:
+            subscriber.put(end)
+
+    def close(self):
+        """ Stop every shared watch """
+        with self._lock:
+            for upstream in list(self._upstreams.values()):
+                if upstream.idle_timer is not None:
+                    upstream.idle_timer.cancel()
+                self._close(upstream)
+
+    def __len__(self):
+        return len(self._upstreams)
+
+
+# the multiplexer the helpers share watches through
+shared_watches = WatchMultiplexer()
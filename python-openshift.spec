@@ -28,6 +28,7 @@ Requires: python-requests
 Requires: python2-ruamel-yaml
 Requires: python-six
 Requires: python-jinja2
+Requires: python-futures
 
 %description -n python2-%{library}
 Python client for the kubernetes API.
@@ -0,0 +1,157 @@
+"""
+Measure the wire size and client CPU cost of gzip/deflate compressed LIST responses.
+
+Usage: python benchmark_compression.py [ITEMS] [JSON_FILE ...]
+
+Without JSON files, synthetic ImageStream, Image and RoleBinding lists with ITEMS
+items (default 2000) are used. Saved LIST responses, e.g. from
+`oc get imagestreams --all-namespaces -o json`, can be passed instead.
+
+For every list and coding the script reports the body size, the time to decode the
+body (decompression included) and to deserialize it into models with
+openshift.client.ApiClient, and how fast the link has to be before compression stops
+paying for itself on the client.
+"""
+from __future__ import print_function
+
+import io
+import json
+import sys
+import timeit
+import zlib
+
+from openshift.client import ApiClient
+
+REPEAT = 5
+
+
+def image_stream_list(count):
+    return 'V1ImageStreamList', {
+        'kind': 'ImageStreamList',
+        'apiVersion': 'v1',
+        'metadata': {'resourceVersion': '123456'},
+        'items': [{
+            'metadata': {
+                'name': 'stream-{}'.format(idx),
+                'namespace': 'project-{}'.format(idx % 50),
+                'uid': '{:08x}-1c2d-11e8-9bc5-0242ac110002'.format(idx),
+                'resourceVersion': str(100000 + idx),
+                'creationTimestamp': '2018-02-28T15:20:11Z',
+                'annotations': {'openshift.io/image.dockerRepositoryCheck': '2018-02-28T15:20:12Z'},
+            },
+            'spec': {'lookupPolicy': {'local': False}, 'tags': [{
+                'name': 'latest',
+                'from': {'kind': 'DockerImage', 'name': 'docker.io/library/stream-{}:latest'.format(idx)},
+                'importPolicy': {}, 'referencePolicy': {'type': 'Source'},
+            }]},
+            'status': {
+                'dockerImageRepository': '172.30.1.1:5000/project-{}/stream-{}'.format(idx % 50, idx),
+                'tags': [{'tag': 'latest', 'items': [{
+                    'created': '2018-02-28T15:20:12Z',
+                    'dockerImageReference': 'docker.io/library/stream-{}@sha256:{:064x}'.format(idx, idx),
+                    'image': 'sha256:{:064x}'.format(idx),
+                    'generation': 2,
+                }]}],
+            },
+        } for idx in range(count)]
+    }
+
+
+def image_list(count):
+    return 'V1ImageList', {
+        'kind': 'ImageList',
+        'apiVersion': 'v1',
+        'metadata': {'resourceVersion': '123456'},
+        'items': [{
+            'metadata': {'name': 'sha256:{:064x}'.format(idx), 'resourceVersion': str(idx),
+                         'creationTimestamp': '2018-02-28T15:20:11Z'},
+            'dockerImageReference': 'docker.io/library/image@sha256:{:064x}'.format(idx),
+            'dockerImageMetadataVersion': '1.0',
+            'dockerImageManifestMediaType': 'application/vnd.docker.distribution.manifest.v2+json',
+            'dockerImageLayers': [{
+                'name': 'sha256:{:064x}'.format(idx * 10 + layer),
+                'size': 1024 * (layer + 1),
+                'mediaType': 'application/vnd.docker.image.rootfs.diff.tar.gzip',
+            } for layer in range(5)],
+        } for idx in range(count)]
+    }
+
+
+def role_binding_list(count):
+    return 'V1RoleBindingList', {
+        'kind': 'RoleBindingList',
+        'apiVersion': 'v1',
+        'metadata': {'resourceVersion': '123456'},
+        'items': [{
+            'metadata': {'name': 'system:image-pullers-{}'.format(idx), 'namespace': 'project-{}'.format(idx),
+                         'resourceVersion': str(idx), 'creationTimestamp': '2018-02-28T15:20:11Z'},
+            'roleRef': {'apiGroup': 'rbac.authorization.k8s.io', 'kind': 'ClusterRole', 'name': 'system:image-puller'},
+            'subjects': [{'kind': 'SystemGroup', 'name': 'system:serviceaccounts:project-{}'.format(idx)}],
+            'userNames': None,
+            'groupNames': ['system:serviceaccounts:project-{}'.format(idx)],
+        } for idx in range(count)]
+    }
+
+
+def deflate(data):
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def gzip(data):
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, 16 + 15)
+    return compressor.compress(data) + compressor.flush()
+
+
+CODINGS = [
+    ('identity', lambda data: data, lambda data: data),
+    ('gzip', gzip, lambda data: zlib.decompress(data, 16 + 15)),
+    ('deflate', deflate, zlib.decompress),
+]
+
+
+def best_time(func):
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def benchmark(name, response_type, body):
+    api_client = ApiClient()
+    raw = json.dumps(body).encode('utf8')
+    print('{} ({} items)'.format(name, len(body.get('items') or [])))
+    print('  {:<10} {:>12} {:>8} {:>12} {:>14} {:>16}'.format(
+        'coding', 'bytes', 'ratio', 'decode ms', 'deserialize ms', 'break-even Mbit/s'))
+
+    baseline = None
+    for coding, encode, decode in CODINGS:
+        encoded = encode(raw)
+        decode_time = best_time(lambda: json.loads(decode(encoded).decode('utf8')))
+        total_time = best_time(lambda: api_client.deserialize_data(json.loads(decode(encoded).decode('utf8')), response_type))
+        if baseline is None:
+            baseline = (len(encoded), decode_time)
+            break_even = '-'
+        else:
+            # compression wins on any link slower than saved bits / extra CPU seconds
+            extra = decode_time - baseline[1]
+            saved_bits = (baseline[0] - len(encoded)) * 8
+            break_even = '{:.0f}'.format(saved_bits / extra / 1e6) if extra > 0 else 'always'
+        print('  {:<10} {:>12} {:>8.2f} {:>12.1f} {:>14.1f} {:>16}'.format(
+            coding, len(encoded), float(len(raw)) / len(encoded), decode_time * 1000, total_time * 1000, break_even))
+
+
+def main():
+    args = sys.argv[1:]
+    count = int(args.pop(0)) if args and args[0].isdigit() else 2000
+
+    if args:
+        for filename in args:
+            with io.open(filename, encoding='utf8') as f:
+                body = json.load(f)
+            benchmark(filename, 'V1{}'.format(body.get('kind', 'List')), body)
+    else:
+        for response_type, body in (image_stream_list(count), image_list(count), role_binding_list(count)):
+            benchmark(response_type, response_type, body)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Generate protobuf field number schemas for openshift.client.protobuf from the
+generated.proto files of the Kubernetes and OpenShift API packages.
+
+Usage: python proto_schemas.py OUTPUT_FILE PROTO_FILE [PROTO_FILE ...]
+
+The output module defines SCHEMAS, which can be passed to
+openshift.client.protobuf.register_schemas().
+"""
+import io
+import pprint
+import re
+import sys
+
+PACKAGE_RX = re.compile(r'^package\s+([\w.]+)\s*;', re.MULTILINE)
+MESSAGE_RX = re.compile(r'^message\s+(\w+)\s*{(.*?)^}', re.MULTILINE | re.DOTALL)
+FIELD_RX = re.compile(r'^\s*(?:optional|repeated|required)?\s*(map<\s*\w+\s*,\s*([\w.]+)\s*>|[\w.]+)\s+(\w+)\s*=\s*(\d+)\s*;', re.MULTILINE)
+VERSION_RX = re.compile(r'^v\d+((alpha|beta)\d+)?$')
+
+# proto types that need a decoding hint, see openshift.client.protobuf
+HINTS = {
+    'k8s.io.apimachinery.pkg.api.resource.Quantity': 'quantity',
+    'k8s.io.apimachinery.pkg.util.intstr.IntOrString': 'intstr',
+    'k8s.io.apimachinery.pkg.runtime.RawExtension': 'raw',
+    'bytes': 'bytes',
+}
+
+
+def model_name(package, message):
+    """ github.com.openshift.api.build.v1 + Build -> V1Build """
+    version = package.split('.')[-1]
+    if not VERSION_RX.match(version):
+        return None
+    return version.capitalize() + message
+
+
+def parse_proto(text):
+    schemas = {}
+    package = PACKAGE_RX.search(text).group(1)
+    for message, body in MESSAGE_RX.findall(text):
+        name = model_name(package, message)
+        if name is None:
+            continue
+        fields = {}
+        for field_type, map_value_type, field_name, number in FIELD_RX.findall(body):
+            hint = HINTS.get(map_value_type or field_type)
+            fields[int(number)] = (field_name, hint) if hint else field_name
+        schemas[name] = fields
+    return schemas
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__)
+        return 1
+
+    schemas = {}
+    for filename in sys.argv[2:]:
+        with io.open(filename, encoding='utf8') as f:
+            for name, fields in parse_proto(f.read()).items():
+                if name in schemas and schemas[name] != fields:
+                    print("Warning: {} is defined more than once, keeping the definition from {}".format(name, filename))
+                schemas[name] = fields
+
+    with io.open(sys.argv[1], mode='w', encoding='utf8') as f:
+        f.write(u'# Generated by scripts/proto_schemas.py. Do not edit.\n\n')
+        f.write(u'SCHEMAS = {}\n'.format(pprint.pformat(schemas)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
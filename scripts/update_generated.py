@@ -1,5 +1,6 @@
 import io
 import os
+import re
 import sys
 
 from constants import PACKAGE_NAME
@@ -71,10 +72,98 @@ def process_apis_package():
     process_package(os.path.join(LIB_DIR, 'client', 'apis', '__init__.py'), skip_method)
 
 
+SWAGGER_TYPES_RX = re.compile(r'^    swagger_types = {\n(.*?)^    }\n', re.MULTILINE | re.DOTALL)
+ATTRIBUTE_MAP_RX = re.compile(r'^    attribute_map = {\n.*?^    }\n', re.MULTILINE | re.DOTALL)
+ATTRIBUTE_RX = re.compile(r"^        '(\w+)': ", re.MULTILINE)
+DICT_EQ = '        return self.__dict__ == other.__dict__\n'
+SLOTS_EQ = ('        for attr in self.swagger_types:\n'
+            '            if getattr(self, attr) != getattr(other, attr):\n'
+            '                return False\n'
+            '        return True\n')
+
+
+def add_model_slots(source):
+    """
+    Give a generated model class __slots__ for its private attributes and the
+    discriminator, so instances carry no __dict__, and compare instances through
+    their properties instead of __dict__.
+    """
+    if '__slots__ = (' in source:
+        return source
+    swagger_types = SWAGGER_TYPES_RX.search(source)
+    attribute_map = ATTRIBUTE_MAP_RX.search(source)
+    if not swagger_types or not attribute_map:
+        return source
+
+    slots = ["'_{}'".format(attr) for attr in ATTRIBUTE_RX.findall(swagger_types.group(1))] + ["'discriminator'"]
+    slots_block = '\n    __slots__ = (\n{}\n    )\n'.format(',\n'.join('        ' + slot for slot in slots))
+    source = source[:attribute_map.end()] + slots_block + source[attribute_map.end():]
+    return source.replace(DICT_EQ, SLOTS_EQ)
+
+
+NE_METHOD = ('    def __ne__(self, other):\n'
+             '        """\n'
+             '        Returns true if both objects are not equal\n'
+             '        """\n'
+             '        return not self == other\n')
+CLASS_NAME_RX = re.compile(r'^class (\w+)\(', re.MULTILINE)
+PICKLE_METHODS = (
+    '\n'
+    '    def __getstate__(self):\n'
+    '        """\n'
+    '        Returns the model attributes, for pickle\n'
+    '        """\n'
+    '        state = {{}}\n'
+    '        for slot in self.__slots__:\n'
+    "            if slot.startswith('__'):\n"
+    "                slot = '_{class_name}' + slot\n"
+    '            if hasattr(self, slot):\n'
+    '                state[slot] = getattr(self, slot)\n'
+    '        return state\n'
+    '\n'
+    '    def __setstate__(self, state):\n'
+    '        """\n'
+    '        Restores the model attributes returned by __getstate__\n'
+    '        """\n'
+    '        for slot, value in iteritems(state):\n'
+    '            setattr(self, slot, value)\n'
+)
+
+
+def add_model_pickling(source):
+    """
+    Give a model class with __slots__ __getstate__ and __setstate__ methods that
+    walk the slots, which pickle needs for protocols 0 and 1 on Python 2. Private
+    attributes like __from are read under their mangled name.
+    """
+    if '__slots__ = (' not in source or 'def __getstate__(self):' in source:
+        return source
+    class_name = CLASS_NAME_RX.search(source)
+    if not class_name or NE_METHOD not in source:
+        return source
+    methods = PICKLE_METHODS.format(class_name=class_name.group(1).lstrip('_'))
+    return source.replace(NE_METHOD, NE_METHOD + methods)
+
+
+def process_models():
+    model_dir = os.path.join(LIB_DIR, 'client', 'models')
+    for filename in sorted(os.listdir(model_dir)):
+        if not filename.endswith('.py') or filename == '__init__.py':
+            continue
+        model_file = os.path.join(model_dir, filename)
+        with io.open(model_file, encoding='utf-8') as f:
+            source = f.read()
+        updated = add_model_pickling(add_model_slots(source))
+        if updated != source:
+            with io.open(model_file, mode='w', encoding='utf-8') as f:
+                f.write(updated)
+
+
 def main():
     process_client_package()
     process_apis_package()
     process_models_package()
+    process_models()
 
     return 0
 
@@ -47,6 +47,9 @@ setup(
     url="https://github.com/openshift/openshift-restclient-python",
     keywords=["Swagger", "OpenAPI", "Kubernetes", "OpenShift"],
     install_requires=extract_requirements('requirements.txt'),
+    extras_require={
+        'asyncio': ['aiohttp >= 3.3'],
+    },
     packages=find_packages(include='openshift.*'),
     include_package_data=True,
     data_files=[
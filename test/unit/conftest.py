@@ -0,0 +1,66 @@
+import json
+import sys
+
+import pytest
+from six import text_type
+
+from openshift.client import clock as clock_module
+
+collect_ignore = []
+if sys.version_info < (3, 5):
+    # the asyncio client and its tests use async def and yield from
+    collect_ignore.append('test_aio.py')
+
+
+class FakeResponse(object):
+    """ urllib3 response of a request made with _preload_content, as RESTResponse and ApiException read it """
+
+    def __init__(self, status=200, body='', headers=None, reason='OK'):
+        self.status = status
+        self.reason = reason
+        self.data = body if isinstance(body, (bytes, text_type)) else json.dumps(body)
+        self.headers = headers or {}
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class FakeStream(object):
+    """ urllib3 response of a watch request, whose chunks are lines """
+
+    def __init__(self, lines, headers=None):
+        self.lines = lines
+        self.headers = headers or {}
+        self.decode_content = None
+
+    def read_chunked(self, decode_content=None):
+        self.decode_content = decode_content
+        for line in self.lines:
+            yield line if isinstance(line, bytes) else line.encode('utf8')
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+@pytest.fixture
+def fake_response():
+    return FakeResponse
+
+
+@pytest.fixture
+def fake_stream():
+    return FakeStream
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """ Stop the clock at [100.0], tests move it forward by adding to the item """
+    now = [100.0]
+    monkeypatch.setattr(clock_module, 'monotonic', lambda: now[0])
+    return now
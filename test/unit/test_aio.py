@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+from kubernetes.client.rest import ApiException  # noqa: E402
+
+from openshift.client import Configuration, OapiApi, models  # noqa: E402
+from openshift.client.aio import AsyncApiClient, AsyncWatch  # noqa: E402
+from openshift.client.retry import RetryPolicy  # noqa: E402
+
+BUILD = {
+    'kind': 'Build',
+    'apiVersion': 'v1',
+    'metadata': {'name': 'build-1', 'namespace': 'test', 'resourceVersion': '1'},
+    'spec': {'strategy': {'type': 'Source'}, 'nodeSelector': {}, 'triggeredBy': []},
+}
+
+
+def list_builds(request):
+    if request.query.get('watch') == 'True':
+        lines = ''.join(json.dumps({'type': 'ADDED', 'object': dict(BUILD, metadata=dict(BUILD['metadata'], name=name))}) + '\n'
+                        for name in ('build-1', 'build-2'))
+        return web.Response(text=lines, content_type='application/json')
+    assert request.headers['Authorization'] == 'Bearer token'
+    return web.json_response({'kind': 'BuildList', 'apiVersion': 'v1', 'metadata': {}, 'items': [BUILD]})
+
+
+def create_build(request):
+    body = yield from request.json()
+    assert body['metadata']['name'] == 'build-1'
+    return web.json_response(body, status=201)
+
+
+def read_build(request):
+    if request.match_info['name'] == 'flaky':
+        request.app['attempts'] += 1
+        if request.app['attempts'] == 1:
+            return web.json_response({'kind': 'Status', 'code': 503}, status=503, headers={'Retry-After': '0'})
+        return web.json_response(BUILD)
+    return web.json_response({'kind': 'Status', 'code': 404, 'reason': 'NotFound'}, status=404)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def api_client(loop):
+    app = web.Application()
+    app['attempts'] = 0
+    app.router.add_get('/oapi/v1/namespaces/test/builds', asyncio.coroutine(list_builds))
+    app.router.add_post('/oapi/v1/namespaces/test/builds', asyncio.coroutine(create_build))
+    app.router.add_get('/oapi/v1/namespaces/test/builds/{name}', asyncio.coroutine(read_build))
+    server = TestServer(app, loop=loop)
+    loop.run_until_complete(server.start_server())
+
+    configuration = Configuration()
+    configuration.host = str(server.make_url(''))
+    configuration.api_key = {'authorization': 'token'}
+    configuration.api_key_prefix = {'authorization': 'Bearer'}
+    api_client = AsyncApiClient(configuration)
+    yield api_client
+    loop.run_until_complete(api_client.close())
+    loop.run_until_complete(server.close())
+
+
+def test_operations(loop, api_client):
+    oapi = OapiApi(api_client)
+
+    builds = loop.run_until_complete(oapi.list_namespaced_build('test'))
+    assert isinstance(builds, models.V1BuildList)
+    assert builds.items[0].metadata.name == 'build-1'
+
+    build, status, _ = loop.run_until_complete(oapi.create_namespaced_build_with_http_info('test', builds.items[0]))
+    assert status == 201
+    assert build == builds.items[0]
+
+    with pytest.raises(ApiException) as error:
+        loop.run_until_complete(oapi.read_namespaced_build('missing', 'test'))
+    assert error.value.status == 404
+
+
+def test_gather(loop, api_client):
+    oapi = OapiApi(api_client)
+    results = loop.run_until_complete(asyncio.gather(*[oapi.list_namespaced_build('test') for _ in range(20)], loop=loop))
+    assert len(results) == 20
+
+
+def test_watch(loop, api_client):
+    oapi = OapiApi(api_client)
+    stream = AsyncWatch().stream(oapi.list_namespaced_build, 'test', timeout_seconds=5)
+    events = []
+    while True:
+        try:
+            events.append(loop.run_until_complete(stream.__anext__()))
+        except StopAsyncIteration:
+            break
+    assert [event['object'].metadata.name for event in events] == ['build-1', 'build-2']
+    assert isinstance(events[0]['object'], models.V1Build)
+
+
+def test_retry(loop, api_client):
+    api_client.retry_policy = RetryPolicy()
+    build = loop.run_until_complete(OapiApi(api_client).read_namespaced_build('flaky', 'test'))
+    assert build.metadata.name == 'build-1'
+    assert api_client.retry_policy.retries == 1
@@ -0,0 +1,331 @@
+import concurrent.futures
+import copy
+import gzip
+import io
+import json
+import pickle
+import threading
+import time
+from datetime import datetime
+
+import pytest
+import urllib3
+
+from openshift.cache import ObjectCache
+from openshift.client import ApiClient, Configuration, OapiApi, models
+
+from kubernetes.client import models as k8s_models
+from kubernetes.client.api_client import ApiClient as K8sApiClient
+
+
+class MockResponse(object):
+
+    def __init__(self, data):
+        self.data = json.dumps(data)
+
+
+BUILD_LIST = {
+    'kind': 'BuildList',
+    'apiVersion': 'v1',
+    'metadata': {'resourceVersion': '42'},
+    'items': [
+        {
+            'kind': 'Build',
+            'apiVersion': 'v1',
+            'metadata': {
+                'name': 'build-{}'.format(idx),
+                'namespace': 'test',
+                'labels': {'app': 'test'},
+                'creationTimestamp': '2018-01-30T20:49:53Z'
+            },
+            'spec': {
+                'nodeSelector': {},
+                'strategy': {'type': 'Source'},
+                'triggeredBy': [{'message': 'Manually triggered'}],
+                'output': {'to': {'kind': 'ImageStreamTag', 'name': 'test:latest'}}
+            },
+            'status': {
+                'phase': 'Complete',
+                'startTimestamp': '2018-01-30T20:49:53Z',
+                'stages': [{'name': 'FetchInputs', 'steps': [{'name': 'FetchGitSource'}]}]
+            }
+        } for idx in range(3)
+    ]
+}
+
+
+def test_deserialize_openshift_list():
+    client = ApiClient()
+    build_list = client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+
+    assert isinstance(build_list, models.V1BuildList)
+    assert isinstance(build_list.metadata, k8s_models.V1ListMeta)
+    assert build_list.metadata.resource_version == '42'
+    assert [build.metadata.name for build in build_list.items] == ['build-0', 'build-1', 'build-2']
+
+    build = build_list.items[0]
+    assert isinstance(build, models.V1Build)
+    assert isinstance(build.metadata, k8s_models.V1ObjectMeta)
+    assert build.metadata.labels == {'app': 'test'}
+    assert build.metadata.creation_timestamp.year == 2018
+    assert build.spec.output.to.name == 'test:latest'
+    assert build.status.stages[0].steps[0].name == 'FetchGitSource'
+
+
+def test_deserialize_matches_to_dict_round_trip():
+    client = ApiClient()
+    build_list = client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+    again = client.deserialize(MockResponse(client.sanitize_for_serialization(build_list)), 'V1BuildList')
+
+    assert again.to_dict() == build_list.to_dict()
+
+
+def test_deserialization_plans_are_cached():
+    client = ApiClient()
+    client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+
+    plan = ApiClient._plans[models.V1Build]
+    converter = ApiClient._converters['list[V1Build]']
+
+    ApiClient().deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+    assert ApiClient._plans[models.V1Build] is plan
+    assert ApiClient._converters['list[V1Build]'] is converter
+    assert ('metadata', 'metadata', ApiClient._converters['V1ObjectMeta']) in plan[0]
+
+
+def test_model_registry_precedence():
+    from openshift.client.api_client import MODEL_REGISTRY
+    from openshift.helper.openshift import OpenShiftObjectHelper
+
+    assert MODEL_REGISTRY['V1Build'] is models.V1Build
+    assert MODEL_REGISTRY['V1ObjectMeta'] is k8s_models.V1ObjectMeta
+    assert MODEL_REGISTRY['V1RoleBinding'] is k8s_models.V1RoleBinding
+    assert OpenShiftObjectHelper.model_class_from_name('V1RoleBinding') is models.V1RoleBinding
+    assert OpenShiftObjectHelper.model_class_from_name('V1ObjectMeta') is k8s_models.V1ObjectMeta
+
+
+def test_dict_and_object_response_formats():
+    client = ApiClient()
+    client.response_format = 'dict'
+    assert client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList') == BUILD_LIST
+
+    client.response_format = 'object'
+    build_list = client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+    build = build_list.items[0]
+    assert build.metadata.name == 'build-0'
+    assert build.metadata.creation_timestamp == '2018-01-30T20:49:53Z'
+    assert build.spec.output.to.name == 'test:latest'
+    assert build.status.completion_timestamp is None
+    assert build.to_dict() == BUILD_LIST['items'][0]
+    assert not hasattr(build, 'swagger_types')
+    assert client.sanitize_for_serialization({'body': build}) == {'body': BUILD_LIST['items'][0]}
+
+
+def test_call_raw():
+    from openshift.client.resource import call_raw
+
+    class MockHTTPResponse(object):
+        data = json.dumps(BUILD_LIST).encode('utf8')
+
+        def release_conn(self):
+            pass
+
+    def list_build(namespace, **kwargs):
+        assert namespace == 'test'
+        assert kwargs['_preload_content'] is False
+        return MockHTTPResponse()
+
+    assert call_raw(list_build, 'test') == BUILD_LIST
+
+
+def test_lazy_response_format():
+    client = ApiClient()
+    client.response_format = 'lazy'
+    build_list = client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+
+    assert isinstance(build_list, models.V1BuildList)
+    build = build_list.items[1]
+    assert isinstance(build, models.V1Build)
+    assert not hasattr(build, '_status')
+    assert build.metadata.name == 'build-1'
+    assert isinstance(build.metadata, k8s_models.V1ObjectMeta)
+    assert not hasattr(build, '_spec')
+    assert build.status.start_timestamp.year == 2018
+    assert build.status.stages[0].steps[0].name == 'FetchGitSource'
+
+    build.status.phase = 'Failed'
+    assert build.status.phase == 'Failed'
+    assert build.discriminator is None
+    build.discriminator = 'kind'
+    assert build.discriminator == 'kind'
+
+    eager = ApiClient().deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+    assert build_list.items[0] == eager.items[0]
+    assert build_list.to_dict()['items'][2] == eager.to_dict()['items'][2]
+
+
+def test_copy_lazy_model():
+    client = ApiClient()
+    client.response_format = 'lazy'
+    build = client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList').items[0]
+    build.metadata.name = 'renamed'
+
+    duplicate = copy.deepcopy(build)
+    assert type(duplicate) is type(build)
+    assert duplicate._lazy_client is client
+    assert not hasattr(duplicate, '_spec')
+    assert duplicate.metadata.name == 'renamed' and duplicate.metadata is not build.metadata
+    assert duplicate == build
+    duplicate.spec.node_selector['zone'] = 'a'
+    assert 'zone' not in build.spec.node_selector
+
+    objects = ObjectCache()
+    objects.set('build', build)
+    assert objects.get('build').metadata.name == 'renamed'
+
+    unpickled = pickle.loads(pickle.dumps(build))
+    assert type(unpickled) is models.V1Build
+    assert unpickled.to_dict() == build.to_dict()
+
+
+def test_copy_lazy_list_with_continue():
+    client = ApiClient()
+    client.response_format = 'lazy'
+    page = dict(BUILD_LIST, metadata={'resourceVersion': '42', 'continue': 'next-page'})
+    build_list = client.deserialize(MockResponse(page), 'V1BuildList')
+
+    shallow = copy.copy(build_list)
+    assert type(shallow) is models.V1BuildList
+    assert shallow.metadata._continue == 'next-page'
+    duplicate = copy.deepcopy(build_list)
+    assert duplicate.metadata._continue == 'next-page'
+    unpickled = pickle.loads(pickle.dumps(build_list))
+    assert unpickled.metadata._continue == 'next-page'
+    assert unpickled.to_dict() == build_list.to_dict()
+
+    build_list.metadata._continue = None
+    assert build_list.metadata._continue is None
+    assert copy.deepcopy(build_list).metadata._continue is None
+
+
+def test_compression(monkeypatch):
+    configuration = Configuration()
+    configuration.compression = True
+    api_client = ApiClient(configuration)
+    assert api_client.compression
+
+    body = io.BytesIO()
+    with gzip.GzipFile(fileobj=body, mode='wb') as f:
+        f.write(json.dumps(BUILD_LIST).encode('utf8'))
+    requests = []
+
+    def request(method, url, headers=None, **kwargs):
+        requests.append(headers)
+        return urllib3.HTTPResponse(body=io.BytesIO(body.getvalue()), status=200, preload_content=kwargs['preload_content'],
+                                    headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'})
+    monkeypatch.setattr(api_client.rest_client.pool_manager, 'request', request)
+
+    builds = OapiApi(api_client).list_namespaced_build('test')
+    assert requests[-1]['Accept-Encoding'] == 'gzip, deflate'
+    assert [build.metadata.name for build in builds.items] == ['build-0', 'build-1', 'build-2']
+
+    api_client.compression = False
+    OapiApi(api_client).list_namespaced_build('test')
+    assert 'Accept-Encoding' not in requests[-1]
+
+
+def test_models_use_slots():
+    build = ApiClient().deserialize(MockResponse(BUILD_LIST), 'V1BuildList').items[0]
+    assert not hasattr(build, '__dict__')
+    assert set(models.V1Build.__slots__) == set('_' + attr for attr in models.V1Build.swagger_types) | {'discriminator'}
+    assert build.spec == models.V1BuildSpec(**dict((attr, getattr(build.spec, attr)) for attr in build.spec.swagger_types))
+    with pytest.raises(AttributeError):
+        build.not_an_attribute = True
+
+
+def test_pickle_models():
+    build = ApiClient().deserialize(MockResponse(BUILD_LIST), 'V1BuildList').items[0]
+    request = models.V1BuildRequest(_from=k8s_models.V1ObjectReference(kind='ImageStreamTag', name='test:latest'), triggered_by=[])
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(build, protocol)) == build
+        unpickled = pickle.loads(pickle.dumps(request, protocol))
+        assert unpickled == request and unpickled._from.name == 'test:latest'
+
+
+def test_sanitize_for_serialization():
+    client = ApiClient()
+    build_list = client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+    client.response_format = 'lazy'
+    lazy_list = client.deserialize(MockResponse(BUILD_LIST), 'V1BuildList')
+    params = {'body': build_list, 'when': datetime(2018, 1, 30, 20, 49, 53), 'query': [('watch', True), ('limit', 5)]}
+
+    expected = K8sApiClient().sanitize_for_serialization(params)
+    assert client.sanitize_for_serialization(params) == expected
+    assert client.sanitize_for_serialization(lazy_list) == expected['body']
+    assert expected['body']['items'][0]['metadata']['creationTimestamp'] == '2018-01-30T20:49:53+00:00'
+    assert expected['query'] == [('watch', True), ('limit', 5)]
+    assert models.V1Build in ApiClient._serializers
+
+
+def test_map():
+    client = ApiClient()
+    client.max_workers = 4
+    lock = threading.Lock()
+    running = []
+
+    def read(name, namespace, _request_timeout=None):
+        assert _request_timeout == 5
+        with lock:
+            running.append(1)
+            assert len(running) <= 3
+        time.sleep(0.01)
+        with lock:
+            running.pop()
+        if name == 'missing':
+            raise ValueError(name)
+        return '{}/{}'.format(namespace, name)
+
+    arguments = [('route-{}'.format(idx), 'project-{}'.format(idx)) for idx in range(20)]
+    results = client.map(read, arguments, max_workers=3, _request_timeout=5)
+    assert list(results) == ['project-{0}/route-{0}'.format(idx) for idx in range(20)]
+
+    futures = list(client.map(read, [('a', 'test'), ('missing', 'test')], return_futures=True, _request_timeout=5))
+    assert futures[0].result() == 'test/a'
+    assert isinstance(futures[1].exception(), ValueError)
+
+    with pytest.raises(ValueError):
+        list(client.map(read, [('missing', 'test')] + arguments, max_workers=2, _request_timeout=5))
+
+    assert client.submit(read, 'a', 'test', _request_timeout=5).result() == 'test/a'
+
+
+def test_map_futures_timeout():
+    client = ApiClient()
+    release = threading.Event()
+    futures = client.map(lambda _: release.wait(5), [1], timeout=0.05, return_futures=True)
+    with pytest.raises(concurrent.futures.TimeoutError):
+        next(futures)
+    release.set()
+
+
+def test_map_beyond_client_max_workers():
+    client = ApiClient()
+    client.max_workers = 2
+    lock = threading.Lock()
+    running = []
+    peak = []
+    started = threading.Event()
+
+    def read(name):
+        with lock:
+            running.append(name)
+            peak.append(len(running))
+            if len(running) == 6:
+                started.set()
+        started.wait(5)
+        with lock:
+            running.remove(name)
+        return name
+
+    assert list(client.map(read, range(12), max_workers=6)) == list(range(12))
+    assert max(peak) == 6
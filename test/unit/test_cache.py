@@ -0,0 +1,142 @@
+import pytest
+
+from kubernetes.client import V1ObjectMeta
+from kubernetes.client.rest import ApiException, RESTResponse
+
+from openshift.cache import MISSING, ObjectCache, object_key
+from openshift.client import models
+from openshift.helper.openshift import OpenShiftObjectHelper
+
+
+def image_stream(name='ruby', resource_version='1', tag=None):
+    return models.V1ImageStream(
+        api_version='v1', kind='ImageStream', spec=models.V1ImageStreamSpec(),
+        metadata=V1ObjectMeta(name=name, namespace='test', resource_version=resource_version, labels={'tag': tag}),
+    )
+
+
+def test_object_key():
+    assert object_key('v1', 'image_stream', 'test', 'ruby') == object_key('v1', 'ImageStream', 'test', 'ruby')
+    assert object_key('apps/v1beta1', 'Deployment', None, 'web') == ('apps', 'v1beta1', 'deployment', None, 'web')
+
+
+def test_ttl_and_lru(clock):
+    objects = ObjectCache(ttl=10, maxsize=2)
+    objects.set('a', image_stream('a'))
+    objects.set('b', image_stream('b'))
+    assert objects.get('a').metadata.name == 'a'
+    objects.set('c', image_stream('c'))
+    assert objects.get('b') is MISSING
+    assert objects.get('a') is not MISSING
+
+    clock[0] += 11
+    assert objects.get('a') is MISSING
+    assert objects.metrics() == {'hits': 2, 'misses': 2, 'size': 1}
+
+
+def test_returns_copies(clock):
+    objects = ObjectCache()
+    objects.set('a', image_stream())
+    objects.get('a').metadata.name = 'changed'
+    assert objects.get('a').metadata.name == 'ruby'
+
+
+def test_observe(clock):
+    objects = ObjectCache()
+    key = object_key('v1', 'ImageStream', 'test', 'ruby')
+    objects.follow([
+        {'type': 'ADDED', 'object': image_stream(resource_version='5', tag='a')},
+        {'type': 'MODIFIED', 'object': image_stream(resource_version='4', tag='old')},
+    ])
+    assert objects.get(key).metadata.labels == {'tag': 'a'}
+
+    objects.observe('MODIFIED', image_stream(resource_version='6', tag='b'))
+    assert objects.get(key).metadata.labels == {'tag': 'b'}
+
+    objects.observe('DELETED', image_stream(resource_version='7'))
+    assert objects.get(key) is None
+
+
+def test_negative_entries(clock):
+    objects = ObjectCache(negative_ttl=5)
+    key = object_key('v1', 'ImageStream', 'test', 'ruby')
+    objects.set_missing(key)
+    assert objects.get(key) is None
+    clock[0] += 6
+    assert objects.get(key) is MISSING
+
+    objects.set_missing(key)
+    objects.observe('ADDED', image_stream())
+    assert objects.get(key).metadata.name == 'ruby'
+
+    objects = ObjectCache(negative_ttl=0)
+    objects.set_missing(key)
+    assert objects.get(key) is MISSING
+
+
+@pytest.fixture
+def helper(monkeypatch, fake_response):
+    helper = OpenShiftObjectHelper('v1', 'image_stream', object_cache=ObjectCache())
+    helper.requests = []
+    helper.responses = []
+
+    def request(method, url, **kwargs):
+        helper.requests.append(method)
+        status, body = helper.responses.pop(0)
+        if status >= 400:
+            raise ApiException(http_resp=fake_response(status, body))
+        return RESTResponse(fake_response(status, body))
+    monkeypatch.setattr(helper.api_client.rest_client, 'request', request)
+    return helper
+
+
+def test_helper_reads_through_cache(helper):
+    body = helper.api_client.sanitize_for_serialization(image_stream())
+    helper.responses = [(200, body)]
+    assert helper.get_object('ruby', 'test').metadata.name == 'ruby'
+    assert helper.get_object('ruby', 'test').metadata.name == 'ruby'
+    assert helper.requests == ['GET']
+
+    helper.responses = [(200, body)]
+    helper.get_object('ruby', 'test', cached=False)
+    assert helper.requests == ['GET', 'GET']
+
+    # writes invalidate the cached object
+    helper._invalidate('ruby', 'test')
+    helper.responses = [(404, {'kind': 'Status', 'code': 404})]
+    assert helper.get_object('ruby', 'test') is None
+    assert helper.get_object('ruby', 'test') is None
+    assert helper.requests == ['GET', 'GET', 'GET']
+
+
+def test_helper_create_clears_negative_entry(helper, monkeypatch):
+    monkeypatch.setattr(helper, '_create_stream', lambda namespace: (None, None))
+    body = helper.api_client.sanitize_for_serialization(image_stream())
+    body['status'] = {'dockerImageRepository': 'ruby'}
+    helper.responses = [(404, {'kind': 'Status', 'code': 404})]
+    assert helper.get_object('ruby', 'test') is None
+
+    helper.responses = [(201, body), (200, body)]
+    helper.create_object('test', body=body)
+    assert helper.get_object('ruby', 'test').metadata.name == 'ruby'
+    assert helper.requests == ['GET', 'POST', 'GET']
+
+
+def test_helper_replace_retries_stale_resource_version(helper, monkeypatch):
+    monkeypatch.setattr(helper, '_create_stream', lambda namespace: (None, None))
+    cached = helper.api_client.sanitize_for_serialization(image_stream(resource_version='1'))
+    current = helper.api_client.sanitize_for_serialization(image_stream(resource_version='2'))
+    current['status'] = {'dockerImageRepository': 'ruby'}
+    helper.responses = [(200, cached)]
+    helper.get_object('ruby', 'test')
+
+    helper.responses = [
+        (409, {'kind': 'Status', 'code': 409, 'message': 'conflict'}),
+        (200, current), (200, current),
+        (200, current),
+    ]
+    body = helper.api_client.sanitize_for_serialization(image_stream(resource_version=None))
+    result = helper.replace_object('ruby', 'test', body=body)
+    assert helper.requests == ['GET', 'PUT', 'GET', 'PUT', 'GET']
+    assert body['metadata']['resourceVersion'] == '2'
+    assert result.metadata.resource_version == '2'
@@ -0,0 +1,194 @@
+import json
+
+from kubernetes.client import V1ObjectMeta, V1OwnerReference
+from kubernetes.client.rest import RESTResponse
+
+from openshift.client import ApiClient, Configuration, OapiApi, models
+from openshift.informer import LABEL_INDEX, NAMESPACE_INDEX, OWNER_INDEX, DeltaFIFO, Informer, InformerFactory, Store
+
+
+def project(name, resource_version, labels=None):
+    return {
+        'kind': 'Project', 'apiVersion': 'v1', 'spec': {}, 'status': {},
+        'metadata': {'name': name, 'resourceVersion': resource_version, 'labels': labels},
+    }
+
+
+def event(event_type, obj):
+    return json.dumps({'type': event_type, 'object': obj}) + '\n'
+
+
+def test_store_indexes():
+    store = Store()
+    pod = models.V1Project(metadata=V1ObjectMeta(
+        name='web', namespace='test', labels={'app': 'web'},
+        owner_references=[V1OwnerReference(api_version='v1', kind='ReplicationController', name='web-1', uid='uid-1')],
+    ))
+    store.put(pod)
+    assert store.get('web', 'test') is pod
+    assert store.by_index(NAMESPACE_INDEX, 'test') == [pod]
+    assert store.by_index(LABEL_INDEX, 'app=web') == [pod]
+    assert store.by_index(OWNER_INDEX, 'uid-1') == [pod]
+
+    relabeled = models.V1Project(metadata=V1ObjectMeta(name='web', namespace='test', labels={'app': 'api'}))
+    assert store.put(relabeled) is pod
+    assert store.by_index(LABEL_INDEX, 'app=web') == []
+    assert store.index_values(LABEL_INDEX) == ['app=api']
+
+    store.add_indexer('name', lambda obj: [obj.metadata.name])
+    assert store.by_index('name', 'web') == [relabeled]
+
+    assert store.delete(relabeled) is relabeled
+    assert len(store) == 0 and store.index_values(NAMESPACE_INDEX) == []
+
+
+def test_informer_lists_then_watches(monkeypatch, fake_response, fake_stream):
+    api_client = ApiClient(Configuration())
+    oapi = OapiApi(api_client)
+    informer = Informer(oapi.list_project)
+    events = []
+    informer.add_handler(
+        on_add=lambda obj: events.append(('add', obj.metadata.name)),
+        on_update=lambda old, new: events.append(('update', new.metadata.name, old.metadata.resource_version)),
+        on_delete=lambda obj: events.append(('delete', obj.metadata.name)),
+    )
+
+    lists = [
+        {'kind': 'ProjectList', 'apiVersion': 'v1', 'metadata': {'resourceVersion': '10'},
+         'items': [project('a', '1'), project('b', '2')]},
+        {'kind': 'ProjectList', 'apiVersion': 'v1', 'metadata': {'resourceVersion': '20'},
+         'items': [project('a', '11', {'app': 'web'}), project('c', '13'), project('d', '14')]},
+    ]
+    watches = [
+        [event('MODIFIED', project('a', '11', {'app': 'web'})), event('DELETED', project('b', '12')),
+         event('ADDED', project('c', '13')), event('ERROR', {'kind': 'Status', 'code': 410, 'message': 'too old'})],
+        [],
+    ]
+    watched_from = []
+
+    def request(method, url, query_params=None, **kwargs):
+        query = dict(query_params)
+        if not query.get('watch'):
+            return RESTResponse(fake_response(200, lists.pop(0)))
+        watched_from.append(query['resourceVersion'])
+        if not lists:
+            informer.stop()
+        return fake_stream(watches.pop(0))
+    monkeypatch.setattr(api_client.rest_client, 'request', request)
+
+    informer.run()
+    assert informer.has_synced
+    assert watched_from == ['10', '20']
+    assert events == [
+        ('add', 'a'), ('add', 'b'),
+        ('update', 'a', '1'), ('delete', 'b'), ('add', 'c'),
+        ('add', 'd'),
+    ]
+    assert sorted(name for _, name in informer.store.keys()) == ['a', 'c', 'd']
+    assert [obj.metadata.name for obj in informer.store.by_index(LABEL_INDEX, 'app=web')] == ['a']
+
+    late = []
+    informer.add_handler(on_add=lambda obj: late.append(obj.metadata.name))
+    assert sorted(late) == ['a', 'c', 'd']
+
+
+def test_informer_stop_closes_watch():
+    class FakeWatch(object):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    informer = Informer(OapiApi().list_namespaced_build, 'test')
+    informer._watch = watch = FakeWatch()
+    informer.stop()
+    assert watch.closed
+
+
+def test_factory_shares_informers():
+    oapi = OapiApi(ApiClient(Configuration()))
+    factory = InformerFactory()
+    informer = factory.informer(oapi.list_namespaced_build, 'test')
+    assert factory.informer(OapiApi(oapi.api_client).list_namespaced_build, 'test') is informer
+    assert factory.informer(oapi.list_namespaced_build, 'other') is not informer
+
+
+def config(name, version):
+    return models.V1DeploymentConfig(
+        metadata=V1ObjectMeta(name=name, namespace='test', resource_version=version), spec=models.V1DeploymentConfigSpec(),
+    )
+
+
+def test_delta_fifo_keeps_latest_state(clock):
+    fifo = DeltaFIFO()
+    fifo.put('ADDED', config('a', '1'))
+    fifo.put('MODIFIED', config('b', '2'))
+    fifo.put('MODIFIED', config('a', '3'))
+    fifo.put('DELETED', config('b', '4'))
+
+    key, event_type, obj = fifo.get()
+    assert (key, event_type, obj.metadata.resource_version) == (('test', 'a'), 'ADDED', '3')
+
+    # an object being handled is not handed out again until done
+    fifo.put('MODIFIED', config('a', '5'))
+    _, event_type, obj = fifo.get()
+    assert (event_type, obj.metadata.name) == ('DELETED', 'b')
+    assert fifo.get(timeout=0) is None
+    fifo.done(key)
+    _, event_type, obj = fifo.get()
+    assert (event_type, obj.metadata.resource_version) == ('MODIFIED', '5')
+    assert fifo.metrics() == {'depth': 0, 'added': 5, 'coalesced': 2, 'delivered': 3}
+
+
+def test_delta_fifo_min_interval(clock):
+    fifo = DeltaFIFO(min_interval=5)
+    fifo.put('ADDED', config('a', '1'))
+    key = fifo.get()[0]
+    fifo.done(key)
+    for version in '234':
+        fifo.put('MODIFIED', config('a', version))
+    assert fifo.get(timeout=0) is None
+
+    clock[0] += 5
+    _, event_type, obj = fifo.get(timeout=0)
+    assert obj.metadata.resource_version == '4'
+
+    # closing hands out what min_interval still holds back
+    fifo.done(key)
+    fifo.put('MODIFIED', config('a', '5'))
+    fifo.close()
+    _, event_type, obj = fifo.get()
+    assert obj.metadata.resource_version == '5'
+    assert fifo.get() is None and len(fifo) == 0
+
+
+def test_delta_fifo_forgets_expired_deliveries(clock):
+    fifo = DeltaFIFO(min_interval=1)
+    for idx in range(1000):
+        fifo.put('ADDED', config('config-{}'.format(idx), '1'))
+    for _ in range(1000):
+        fifo.done(fifo.get(timeout=0)[0])
+    assert len(fifo._last_delivery) == 1000
+
+    clock[0] += 1
+    assert fifo.get(timeout=0) is None
+    assert len(fifo._last_delivery) == 0 and len(fifo._expiries) == 0
+
+
+def test_delta_fifo_run(clock):
+    fifo = DeltaFIFO()
+    handlers = fifo.handlers()
+    handlers['on_add'](config('a', '1'))
+    handlers['on_update'](config('a', '1'), config('a', '2'))
+    handlers['on_delete'](config('b', '3'))
+    fifo.close()
+
+    handled = []
+
+    def handler(key, event_type, obj):
+        handled.append((obj.metadata.name, event_type))
+        if obj.metadata.name == 'a':
+            raise RuntimeError('handler failures are logged')
+    fifo.run(handler)
+    assert handled == [('a', 'ADDED'), ('b', 'DELETED')]
+    assert len(fifo) == 0
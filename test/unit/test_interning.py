@@ -0,0 +1,49 @@
+import json
+
+from openshift.client import ApiClient
+from openshift.client.interning import intern_json
+
+
+def decode(data):
+    # every json.loads call creates its own copies of the strings
+    return json.loads(json.dumps(data))
+
+
+OBJECT = {
+    'kind': 'Build',
+    'apiVersion': 'v1',
+    'metadata': {
+        'name': 'build-1',
+        'namespace': 'project-' + 'a' * 20,
+        'labels': {'app.kubernetes.io/name': 'test-' + 'b' * 20},
+        'annotations': {'openshift.io/build.number': '1' * 20},
+    },
+    'spec': {'strategy': {'type': 'Source'}, 'nodeSelector': {}, 'triggeredBy': []},
+    'status': {'phase': 'Failed', 'message': 'Build failed after ' + '9' * 20 + ' seconds'},
+}
+
+
+def test_intern_json():
+    first, second = intern_json(decode(OBJECT)), intern_json(decode(OBJECT))
+    assert first == OBJECT
+
+    assert first['metadata']['namespace'] is second['metadata']['namespace']
+    assert first['metadata']['labels']['app.kubernetes.io/name'] is second['metadata']['labels']['app.kubernetes.io/name']
+    first_key, second_key = list(first['metadata']['annotations'])[0], list(second['metadata']['annotations'])[0]
+    assert first_key is second_key
+    # annotation values are not a low cardinality field
+    assert first['metadata']['annotations'][first_key] is not second['metadata']['annotations'][second_key]
+    # status is an object, only its low cardinality fields are interned
+    assert first['status']['phase'] is second['status']['phase']
+    assert first['status']['message'] is not second['status']['message']
+
+
+def test_intern_strings_option():
+    client = ApiClient()
+    client.intern_strings = True
+    first, second = client.deserialize_data(decode(OBJECT), 'V1Build'), client.deserialize_data(decode(OBJECT), 'V1Build')
+    assert first.metadata.namespace is second.metadata.namespace
+    assert list(first.metadata.labels)[0] is list(second.metadata.labels)[0]
+
+    client.response_format = 'dict'
+    assert client.deserialize_data(decode(OBJECT), 'V1Build')['kind'] is first.kind
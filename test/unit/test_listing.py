@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+
+import pytest
+
+from openshift import client
+from openshift.client import models
+from kubernetes.client import models as k8s_models
+from kubernetes.client.rest import ApiException
+
+from openshift.listing import item_type, iter_list, list_all, list_in_namespaces, paginate, supports_paging
+
+IMAGE_LIST = {
+    'kind': 'ImageList',
+    'apiVersion': 'v1',
+    'metadata': {'resourceVersion': '1234', 'selfLink': '/oapi/v1/images'},
+    'items': [
+        {
+            'metadata': {'name': 'sha256:{:064d}'.format(idx), 'annotations': {'note': u'caf\xe9 \u2603'}},
+            'dockerImageReference': 'registry/test@sha256:{:064d}'.format(idx),
+            'dockerImageLayers': [{'name': 'layer', 'size': 1024 * idx, 'mediaType': 'tar'}],
+        } for idx in range(5)
+    ]
+}
+
+
+class MockHTTPResponse(object):
+
+    def __init__(self, body, chunk_size):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.closed = False
+
+    def stream(self, amt, decode_content=True):
+        for idx in range(0, len(self.body), self.chunk_size):
+            yield self.body[idx:idx + self.chunk_size]
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        pass
+
+
+def mock_list_image(body, chunk_size):
+    response = MockHTTPResponse(json.dumps(body, indent=1).encode('utf8'), chunk_size)
+
+    def list_image(**kwargs):
+        assert kwargs['_preload_content'] is False
+        return response
+    list_image.__doc__ = client.OapiApi.list_image.__doc__
+    return list_image, response
+
+
+def test_item_type():
+    assert item_type(client.OapiApi.list_image) == 'V1Image'
+    assert item_type(client.OapiApi.list_namespaced_build) == 'V1Build'
+    assert supports_paging(client.OapiApi.list_image)
+    assert not supports_paging(client.OapiApi.read_image)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_iter_list(chunk_size):
+    list_image, response = mock_list_image(IMAGE_LIST, chunk_size)
+    stream = iter_list(list_image)
+    images = list(stream)
+
+    assert all(isinstance(image, models.V1Image) for image in images)
+    assert [image.metadata.name for image in images] == [item['metadata']['name'] for item in IMAGE_LIST['items']]
+    assert images[3].docker_image_layers[0].size == 3072
+    assert images[0].metadata.annotations['note'] == u'caf\xe9 \u2603'
+    assert stream.metadata['metadata']['resourceVersion'] == '1234'
+    assert response.closed
+
+
+def test_iter_list_empty_and_truncated():
+    list_image, _ = mock_list_image(dict(IMAGE_LIST, items=[]), 3)
+    assert list(iter_list(list_image)) == []
+
+    list_image, response = mock_list_image(IMAGE_LIST, 64)
+    response.body = response.body[:-40]
+    with pytest.raises(ValueError):
+        list(iter_list(list_image))
+
+
+def mock_paged_list_project(count, expire=None, delete_on_expiry=None):
+    projects = [models.V1Project(metadata=k8s_models.V1ObjectMeta(name='project-{}'.format(idx))) for idx in range(count)]
+    calls = []
+
+    def list_project(limit=None, _continue=None):
+        calls.append(_continue)
+        if expire is not None and _continue == expire and 'expired' not in calls:
+            calls.append('expired')
+            if delete_on_expiry is not None:
+                del projects[delete_on_expiry]
+            raise ApiException(status=410, reason='Gone')
+        start = int(_continue or 0)
+        end = start + limit
+        metadata = k8s_models.V1ListMeta(resource_version='1')
+        metadata._continue = str(end) if end < len(projects) else None
+        return models.V1ProjectList(items=projects[start:end], metadata=metadata)
+    list_project.__doc__ = client.OapiApi.list_project.__doc__
+    return list_project, calls
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_paginate(prefetch):
+    list_project, calls = mock_paged_list_project(25)
+    names = [project.metadata.name for project in paginate(list_project, limit=10, prefetch=prefetch)]
+    assert names == ['project-{}'.format(idx) for idx in range(25)]
+    assert calls == [None, '10', '20']
+
+
+def test_paginate_expired_continue():
+    list_project, calls = mock_paged_list_project(25, expire='20')
+    pages = paginate(list_project, limit=10)
+    names = [project.metadata.name for project in pages]
+    assert names == ['project-{}'.format(idx) for idx in range(25)]
+    assert calls[:4] == [None, '10', '20', 'expired']
+
+    # the last item yielded before the restart is gone from the new list
+    list_project, _ = mock_paged_list_project(25, expire='20', delete_on_expiry=19)
+    names = [project.metadata.name for project in paginate(list_project, limit=10)]
+    assert names == ['project-{}'.format(idx) for idx in range(25)]
+
+
+def test_paginate_from_client_executor():
+    api_client = client.ApiClient()
+    api_client.max_workers = 2
+
+    def count_projects(_):
+        list_project, _ = mock_paged_list_project(25)
+        list_project.__self__ = client.OapiApi(api_client)
+        return len(list(paginate(list_project, limit=10)))
+
+    assert list(api_client.map(count_projects, range(4), timeout=10)) == [25] * 4
+
+
+def test_list_all():
+    list_project, _ = mock_paged_list_project(25)
+    project_list = list_all(list_project, limit=10)
+    assert len(project_list.items) == 25
+    assert project_list.metadata._continue is None
+
+
+def test_list_in_namespaces():
+    api_client = client.ApiClient()
+    oapi = client.OapiApi(api_client)
+    running = []
+
+    def list_namespaced_route(namespace, label_selector=None):
+        assert label_selector == 'app=test'
+        running.append(namespace)
+        assert len(running) <= 3
+        try:
+            if namespace == 'forbidden':
+                raise ApiException(status=403, reason='Forbidden')
+            return models.V1RouteList(items=[
+                models.V1Route(metadata=k8s_models.V1ObjectMeta(name='route-{}'.format(idx), namespace=namespace), spec={}, status={})
+                for idx in range(2)
+            ])
+        finally:
+            running.remove(namespace)
+    list_namespaced_route.__self__ = oapi
+
+    namespaces = ['project-{}'.format(idx) for idx in range(10)] + ['forbidden']
+    results = list(list_in_namespaces(list_namespaced_route, namespaces, max_workers=3, label_selector='app=test'))
+    assert len(results) == 20
+    assert sorted(set(namespace for namespace, _ in results)) == sorted(namespaces[:-1])
+    assert all(route.metadata.namespace == namespace for namespace, route in results)
+
+
+def test_list_in_namespaces_beyond_client_max_workers():
+    api_client = client.ApiClient()
+    api_client.max_workers = 2
+    lock = threading.Lock()
+    running = []
+    peak = []
+    started = threading.Event()
+
+    def list_namespaced_route(namespace):
+        with lock:
+            running.append(namespace)
+            peak.append(len(running))
+            if len(running) == 5:
+                started.set()
+        started.wait(5)
+        with lock:
+            running.remove(namespace)
+        return models.V1RouteList(items=[])
+    list_namespaced_route.__self__ = client.OapiApi(api_client)
+
+    namespaces = ['project-{}'.format(idx) for idx in range(10)]
+    assert list(list_in_namespaces(list_namespaced_route, namespaces, max_workers=5)) == []
+    assert max(peak) == 5
+
+
+def test_list_in_namespaces_discovers_projects(monkeypatch):
+    projects = models.V1ProjectList(items=[models.V1Project(metadata=k8s_models.V1ObjectMeta(name=name)) for name in ('a', 'b')])
+    monkeypatch.setattr(client.OapiApi, 'list_project', lambda self, **kwargs: projects)
+
+    def list_namespaced_route(namespace):
+        return models.V1RouteList(items=[models.V1Route(metadata=k8s_models.V1ObjectMeta(name='route', namespace=namespace), spec={}, status={})])
+    list_namespaced_route.__self__ = client.OapiApi(client.ApiClient())
+
+    assert sorted(namespace for namespace, _ in list_in_namespaces(list_namespaced_route)) == ['a', 'b']
@@ -0,0 +1,149 @@
+import struct
+
+import pytest
+
+from openshift import client, watch
+from openshift.client import models, protobuf
+
+from kubernetes.client import models as k8s_models
+
+SCHEMAS = {
+    'V1Group': {1: 'metadata', 2: 'users'},
+    'V1GroupList': {1: 'metadata', 2: 'items'},
+    'V1ListMeta': {1: 'selfLink', 2: 'resourceVersion', 3: 'continue'},
+    'V1ObjectMeta': {1: 'name', 3: 'namespace', 6: 'resourceVersion', 7: 'generation', 8: 'creationTimestamp', 11: 'labels'},
+}
+
+
+def varint(value):
+    out = b''
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            out += struct.pack('B', byte | 0x80)
+        else:
+            return out + struct.pack('B', byte)
+
+
+def field(number, value):
+    if isinstance(value, int):
+        return varint(number << 3) + varint(value)
+    if not isinstance(value, bytes):
+        value = value.encode('utf8')
+    return varint(number << 3 | 2) + varint(len(value)) + value
+
+
+def envelope(kind, raw):
+    return protobuf.MAGIC + field(1, field(1, 'v1') + field(2, kind)) + field(2, raw)
+
+
+def group(name, resource_version):
+    metadata = (field(1, name) + field(6, resource_version) + field(7, 3) +
+                field(8, field(1, 1517345393)) + field(11, field(1, 'app') + field(2, 'test')))
+    return field(1, metadata) + field(2, 'alice') + field(2, 'bob')
+
+
+@pytest.fixture
+def schemas(monkeypatch):
+    monkeypatch.setattr(protobuf, 'SCHEMAS', {})
+    protobuf.register_schemas(SCHEMAS)
+    yield
+    protobuf.ProtobufCodec.clear_cache()
+
+
+class MockHTTPResponse(object):
+
+    def __init__(self, data, content_type):
+        self.data = data
+        self.status = 200
+        self.headers = {'Content-Type': content_type}
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def getheaders(self):
+        return self.headers
+
+    def stream(self, amt, decode_content=True):
+        for idx in range(0, len(self.data), 5):
+            yield self.data[idx:idx + 5]
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+def test_decode(schemas):
+    api_client = client.ApiClient()
+    codec = api_client.protobuf_codec
+    assert codec.supports('V1GroupList')
+    assert not codec.supports('V1Build')
+
+    data = codec.decode(envelope('Group', group('admins', '42')), 'V1Group')
+    assert data == {
+        'metadata': {
+            'name': 'admins',
+            'resourceVersion': '42',
+            'generation': 3,
+            'creationTimestamp': '2018-01-30T20:49:53Z',
+            'labels': {'app': 'test'}
+        },
+        'users': ['alice', 'bob']
+    }
+
+    obj = api_client.deserialize_data(data, 'V1Group')
+    assert isinstance(obj, models.V1Group)
+    assert isinstance(obj.metadata, k8s_models.V1ObjectMeta)
+    assert obj.metadata.creation_timestamp.year == 2018
+
+
+def test_negotiation(schemas, monkeypatch):
+    api_client = client.ApiClient()
+    api_client.protobuf = True
+    requests = []
+
+    def request(method, url, query_params=None, headers=None, **kwargs):
+        requests.append(headers['Accept'])
+        if headers['Accept'].startswith(protobuf.PROTOBUF):
+            return MockHTTPResponse(envelope('Group', group('admins', '42')), protobuf.PROTOBUF)
+        return MockHTTPResponse(b'{"metadata": {"name": "admins"}, "spec": {}}', 'application/json')
+
+    monkeypatch.setattr(api_client, 'request', request)
+    oapi = client.OapiApi(api_client)
+
+    assert oapi.read_group('admins').users == ['alice', 'bob']
+    assert requests[-1].startswith(protobuf.PROTOBUF)
+
+    monkeypatch.setattr(protobuf.ProtobufCodec, 'supports', lambda self, swagger_type: False)
+    with pytest.raises(Exception):
+        oapi.read_group('admins')
+    assert requests[-1] == 'application/json'
+
+
+def test_protobuf_watch(schemas, monkeypatch):
+    api_client = client.ApiClient()
+    api_client.protobuf = True
+    oapi = client.OapiApi(api_client)
+
+    frames = b''
+    for idx, event_type in enumerate(['ADDED', 'MODIFIED']):
+        event = field(1, event_type) + field(2, field(1, envelope('Group', group('group{}'.format(idx), str(idx + 10)))))
+        frames += struct.pack('>I', len(event)) + event
+
+    def list_group(**kwargs):
+        assert kwargs['watch'] is True
+        assert api_client._local.protobuf_stream
+        return MockHTTPResponse(frames, protobuf.PROTOBUF_WATCH)
+    list_group.__doc__ = oapi.list_group.__doc__
+    list_group.__self__ = oapi
+
+    w = watch.Watch(protobuf=True)
+    events = list(w.stream(list_group, timeout_seconds=1))
+
+    assert [event['type'] for event in events] == ['ADDED', 'MODIFIED']
+    assert [event['object'].metadata.name for event in events] == ['group0', 'group1']
+    assert isinstance(events[0]['object'], models.V1Group)
+    assert w.resource_version == '11'
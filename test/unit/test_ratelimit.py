@@ -0,0 +1,37 @@
+import pytest
+
+from openshift.client import ApiClient, Configuration, OapiApi, ratelimit
+from openshift.client.ratelimit import RateLimiter
+
+
+def test_token_bucket(clock):
+    limiter = RateLimiter(qps=2, burst=3)
+    assert [limiter.reserve() for _ in range(5)] == [0, 0, 0, 0.5, 1.0]
+
+    clock[0] += 10
+    assert [limiter.reserve() for _ in range(4)] == [0, 0, 0, 0.5]
+    assert limiter.metrics() == {'requests': 9, 'throttled_requests': 3, 'throttled_seconds': 2.0}
+
+    with pytest.raises(ValueError):
+        RateLimiter(qps=0)
+
+
+def test_client_rate_limit(clock, monkeypatch):
+    configuration = Configuration()
+    configuration.qps = 5
+    configuration.burst = 2
+    api_client = ApiClient(configuration)
+    sleeps = []
+    monkeypatch.setattr(ratelimit.time, 'sleep', sleeps.append)
+    monkeypatch.setattr(api_client.rest_client, 'request', lambda *args, **kwargs: None)
+
+    oapi = OapiApi(api_client)
+    for _ in range(4):
+        oapi.list_project(_preload_content=False)
+
+    assert sleeps == [0.2, 0.4]
+    assert api_client.rate_limiter.metrics()['throttled_requests'] == 2
+
+    # a limiter on the configuration is shared by every client built from it
+    configuration.rate_limiter = RateLimiter(qps=5)
+    assert ApiClient(configuration).rate_limiter is ApiClient(configuration).rate_limiter
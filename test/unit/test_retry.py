@@ -0,0 +1,126 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import MaxRetryError
+
+from openshift.client import ApiClient, Configuration, OapiApi, retry
+from openshift.client.retry import RetryPolicy, retry_after
+
+
+class FakeTime(object):
+    time = staticmethod(time.time)
+
+    def __init__(self):
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    # replace the module rather than time.sleep, which other threads use too
+    fake = FakeTime()
+    monkeypatch.setattr(retry, 'time', fake)
+    return fake.sleeps
+
+
+def failing(*failures):
+    calls = []
+
+    def request(method, url, **kwargs):
+        calls.append(method)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return None
+    request.calls = calls
+    return request
+
+
+def test_retry_after():
+    assert retry_after({'Retry-After': '7'}) == 7
+    assert 55 < retry_after({'Retry-After': formatdate(time.time() + 60, usegmt=True)}) <= 60
+    assert retry_after({'Retry-After': formatdate(time.time() - 60, usegmt=True)}) == 0
+    assert retry_after({'Retry-After': 'soon'}) is None
+    assert retry_after({}) is None
+    assert retry_after(None) is None
+
+
+def test_should_retry():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry(0, 'GET', 503)
+    assert policy.should_retry(1, 'delete')
+    assert not policy.should_retry(2, 'GET', 503)
+    assert not policy.should_retry(0, 'GET', 404)
+    assert not policy.should_retry(0, 'POST', 503)
+    assert not policy.should_retry(0, 'PATCH')
+    assert policy.should_retry(0, 'POST', 429)
+
+
+def test_delay(monkeypatch):
+    monkeypatch.setattr(retry.random, 'uniform', lambda low, high: high)
+    policy = RetryPolicy(backoff=1, max_backoff=5)
+    assert [policy.delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+    assert policy.delay(0, {'Retry-After': '3'}) == 3
+    # a Retry-After longer than max_backoff is capped too
+    assert policy.delay(0, {'Retry-After': '3600'}) == 5
+    assert policy.retries == 6
+
+
+def test_client_retries(sleeps, monkeypatch, fake_response):
+    configuration = Configuration()
+    configuration.retry_policy = RetryPolicy(max_retries=3)
+    api_client = ApiClient(configuration)
+    request = failing(
+        ApiException(http_resp=fake_response(503, headers={'Retry-After': '2'})),
+        MaxRetryError(None, '/oapi/v1/projects'),
+    )
+    monkeypatch.setattr(api_client.rest_client, 'request', request)
+
+    OapiApi(api_client).list_project(_preload_content=False)
+    assert request.calls == ['GET', 'GET', 'GET']
+    assert len(sleeps) == 2 and sleeps[0] == 2
+    assert api_client.retry_policy.retries == 2
+
+
+def test_client_gives_up(sleeps, monkeypatch, fake_response):
+    configuration = Configuration()
+    configuration.max_retries = 1
+    api_client = ApiClient(configuration)
+    request = failing(*[ApiException(http_resp=fake_response(500)) for _ in range(3)])
+    monkeypatch.setattr(api_client.rest_client, 'request', request)
+
+    with pytest.raises(ApiException):
+        OapiApi(api_client).list_project(_preload_content=False)
+    assert len(request.calls) == 2
+
+
+def test_client_retries_post_only_on_429(sleeps, monkeypatch, fake_response):
+    configuration = Configuration()
+    configuration.retry_policy = RetryPolicy()
+    api_client = ApiClient(configuration)
+    oapi = OapiApi(api_client)
+
+    request = failing(ApiException(http_resp=fake_response(503)))
+    monkeypatch.setattr(api_client.rest_client, 'request', request)
+    with pytest.raises(ApiException):
+        oapi.create_project({}, _preload_content=False)
+    assert request.calls == ['POST']
+
+    request = failing(ApiException(http_resp=fake_response(429)))
+    monkeypatch.setattr(api_client.rest_client, 'request', request)
+    oapi.create_project({}, _preload_content=False)
+    assert request.calls == ['POST', 'POST']
+
+
+def test_no_retries_by_default(monkeypatch, fake_response):
+    api_client = ApiClient(Configuration())
+    assert api_client.retry_policy is None
+    request = failing(ApiException(http_resp=fake_response(503)))
+    monkeypatch.setattr(api_client.rest_client, 'request', request)
+    with pytest.raises(ApiException):
+        OapiApi(api_client).list_project(_preload_content=False)
+    assert len(request.calls) == 1
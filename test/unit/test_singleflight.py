@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from kubernetes.client.rest import RESTResponse
+
+from openshift.client import ApiClient, Configuration, OapiApi
+from openshift.client.singleflight import SingleFlight
+
+
+IMAGE_STREAM = {'kind': 'ImageStream', 'apiVersion': 'v1', 'metadata': {'name': 'ruby', 'namespace': 'test'}, 'spec': {}}
+
+
+@pytest.fixture
+def blocking(fake_response):
+    def blocking(release, calls):
+        def request(method, url, **kwargs):
+            calls.append(url)
+            release.wait(5)
+            return RESTResponse(fake_response(200, IMAGE_STREAM))
+        return request
+    return blocking
+
+
+def wait_for(condition):
+    deadline = time.time() + 5
+    while not condition() and time.time() < deadline:
+        time.sleep(0.001)
+
+
+def run_threads(count, target):
+    results = [None] * count
+
+    def run(index):
+        results[index] = target()
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_do_shares_result_and_error():
+    flight = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+
+    def call():
+        started.set()
+        release.wait(5)
+        return object()
+
+    threads, results = run_threads(1, lambda: flight.do('key', call))
+    started.wait(5)
+    followers, shared = run_threads(3, lambda: flight.do('key', call))
+    wait_for(lambda: flight.shared == 3)
+    release.set()
+    for thread in threads + followers:
+        thread.join()
+    assert len(set(map(id, results + shared))) == 1
+    assert flight.metrics() == {'calls': 1, 'shared': 3}
+
+    with pytest.raises(ValueError):
+        flight.do('key', int, 'x')
+    assert flight.do('key', int, '1') == 1
+
+
+def test_client_coalesces_gets(monkeypatch, blocking):
+    configuration = Configuration()
+    configuration.coalesce_requests = True
+    api_client = ApiClient(configuration)
+    oapi = OapiApi(api_client)
+    release, calls = threading.Event(), []
+    monkeypatch.setattr(api_client.rest_client, 'request', blocking(release, calls))
+
+    threads, results = run_threads(4, lambda: oapi.read_namespaced_image_stream('ruby', 'test'))
+    wait_for(lambda: api_client.singleflight.shared == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result.metadata.name == 'ruby' for result in results)
+    # every caller deserializes its own copy
+    assert len(set(map(id, results))) == 4
+
+    oapi.read_namespaced_image_stream('ruby', 'other')
+    assert len(calls) == 2
+
+
+def test_client_does_not_coalesce_by_default(monkeypatch, blocking):
+    api_client = ApiClient(Configuration())
+    assert api_client.singleflight is None
+    release, calls = threading.Event(), []
+    release.set()
+    monkeypatch.setattr(api_client.rest_client, 'request', blocking(release, calls))
+    OapiApi(api_client).read_namespaced_image_stream('ruby', 'test')
+    assert len(calls) == 1
+
+
+def test_client_coalesces_non_ascii_queries(monkeypatch, fake_response):
+    configuration = Configuration()
+    configuration.coalesce_requests = True
+    api_client = ApiClient(configuration)
+    queries = []
+
+    def request(method, url, query_params=None, **kwargs):
+        queries.append(query_params)
+        return RESTResponse(fake_response(200, {'kind': 'ImageStreamList', 'apiVersion': 'v1', 'metadata': {}, 'items': []}))
+    monkeypatch.setattr(api_client.rest_client, 'request', request)
+
+    OapiApi(api_client).list_namespaced_image_stream('test', label_selector=u'app=caf\xe9')
+    assert queries == [[('labelSelector', u'app=caf\xe9')]]
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+from dateutil.parser import parse
+
+from openshift.client import ApiClient
+from openshift.client.timestamps import DatetimeCache, parse_rfc3339
+
+
+@pytest.mark.parametrize('value', [
+    '2018-01-30T20:49:53Z',
+    '2018-01-30t20:49:53z',
+    '2018-01-30T20:49:53.5Z',
+    '2018-01-30T20:49:53.123456789+02:00',
+    '2018-01-30T20:49:53-05:30',
+    '2018-01-30T20:49:53+00:00',
+])
+def test_parse_rfc3339(value):
+    parsed = parse_rfc3339(value)
+    assert parsed == parse(value)
+    assert parsed.utcoffset() == parse(value).utcoffset()
+
+
+@pytest.mark.parametrize('value', ['2018-01-30', '2018-01-30T20:49Z', 'Tue, 30 Jan 2018 20:49:53 GMT', '2018-02-30T20:49:53Z'])
+def test_parse_rfc3339_other_formats(value):
+    assert parse_rfc3339(value) is None
+
+
+def test_datetime_cache():
+    cache = DatetimeCache(2)
+    for idx in range(3):
+        cache.set(idx, datetime(2018, 1, idx + 1))
+    assert len(cache) == 2
+    assert cache.get(0) is None
+    assert cache.get(1) == datetime(2018, 1, 2)
+    cache.set(3, datetime(2018, 1, 4))
+    assert cache.get(2) is None
+    assert cache.get(1) == datetime(2018, 1, 2)
+
+
+def test_deserialize_timestamps():
+    client = ApiClient()
+    client.timestamp_cache_size = 16
+    data = [{'created': '2018-01-30T20:49:53Z', 'dockerImageReference': 'test', 'generation': 1, 'image': 'sha256:{}'.format(idx)}
+            for idx in range(3)]
+    events = client.deserialize_data(data, 'list[V1TagEvent]')
+    assert events[0].created == parse('2018-01-30T20:49:53Z')
+    assert events[0].created is events[2].created
+
+    # anything that is not RFC3339 still goes through dateutil
+    event = client.deserialize_data(dict(data[0], created='Tue, 30 Jan 2018 20:49:53 GMT'), 'V1TagEvent')
+    assert event.created == events[0].created
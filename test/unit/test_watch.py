@@ -1,4 +1,8 @@
 import json
+import threading
+import zlib
+
+import pytest
 
 from openshift import watch
 from openshift import client
@@ -6,6 +10,8 @@ from openshift.client import models
 
 from kubernetes import watch as k8s_watch
 from kubernetes.client import models as k8s_models
+from kubernetes.client.rest import RESTResponse
+from urllib3.exceptions import ProtocolError
 
 
 def test_watch(monkeypatch):
@@ -49,3 +55,320 @@ def test_watch(monkeypatch):
         count -= 1
         if not count:
             w.stop()
+
+
+def test_watch_compressed(fake_stream):
+    lines = ''.join(json.dumps({
+        'type': 'ADDED',
+        'object': {'metadata': {'name': name, 'resourceVersion': str(idx)}, 'spec': {}}
+    }) + '\n' for idx, name in enumerate([u'test1', u'caf\xe9']))
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + 15)
+    body = compressor.compress(lines.encode('utf8')) + compressor.flush()
+
+    # urllib3 decompresses the chunks it reads with decode_content
+    data = zlib.decompress(body, 16 + 15)
+    stream = fake_stream([data[idx:idx + 5] for idx in range(0, len(data), 5)],
+                         headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'})
+
+    w = watch.Watch(return_type='V1DeploymentConfig')
+    events = list(w.stream(lambda **kwargs: stream, timeout_seconds=1))
+    assert stream.decode_content
+    assert [event['object'].metadata.name for event in events] == [u'test1', u'caf\xe9']
+    assert w.resource_version == '1'
+
+
+def test_resilient_watch(monkeypatch, fake_response, fake_stream):
+    def project(name, resource_version):
+        return {'kind': 'Project', 'apiVersion': 'v1', 'spec': {}, 'status': {},
+                'metadata': {'name': name, 'resourceVersion': resource_version}}
+
+    def event(event_type, obj):
+        return json.dumps({'type': event_type, 'object': obj}) + '\n'
+
+    class MockTime(object):
+        sleeps = []
+
+        def sleep(self, seconds):
+            self.sleeps.append(seconds)
+
+    responses = [
+        fake_stream([event('ADDED', project('a', '1')), event('ADDED', project('b', '2'))]),
+        ProtocolError('Connection reset by peer'),
+        fake_stream([event('ERROR', {'kind': 'Status', 'code': 410, 'message': 'too old resource version'})]),
+        fake_response(200, {'kind': 'ProjectList', 'apiVersion': 'v1', 'metadata': {'resourceVersion': '10'},
+                            'items': [project('a', '5'), project('c', '6')]}),
+        fake_stream([event('ADDED', project('d', '11'))]),
+    ]
+    requests = []
+
+    def request(method, url, query_params=None, **kwargs):
+        query = dict(query_params)
+        requests.append((query.get('watch'), query.get('resourceVersion')))
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return RESTResponse(response) if isinstance(response, fake_response) else response
+
+    api_client = client.ApiClient(client.Configuration())
+    monkeypatch.setattr(api_client.rest_client, 'request', request)
+    monkeypatch.setattr(watch, 'time', MockTime())
+
+    w = watch.Watch(resilient=True)
+    w._api_client = api_client
+    events = []
+    for event in w.stream(client.OapiApi(api_client).list_project, timeout_seconds=60):
+        events.append((event['type'], event['object'].metadata.name, event.get('synthetic', False)))
+        if event['object'].metadata.name == 'd':
+            w.stop()
+
+    assert events == [
+        ('ADDED', 'a', False), ('ADDED', 'b', False),
+        ('MODIFIED', 'a', True), ('ADDED', 'c', True), ('DELETED', 'b', True),
+        ('ADDED', 'd', False),
+    ]
+    assert requests == [(True, None), (True, '2'), (True, '2'), (None, None), (True, '10')]
+    assert len(MockTime.sleeps) == 1
+    assert w.resource_version == '11'
+
+
+def test_watch_multiplexer(fake_stream):
+    from six.moves import queue
+
+    class BlockingStream(fake_stream):
+        """ Yields the lines put in its queue until it is closed """
+
+        def __init__(self):
+            self.queue = queue.Queue()
+            super(BlockingStream, self).__init__(iter(self.queue.get, None))
+
+        def close(self):
+            self.queue.put(None)
+
+    streams = queue.Queue()
+    api_client = client.ApiClient(client.Configuration())
+
+    def request(method, url, query_params=None, **kwargs):
+        assert dict(query_params)['watch']
+        stream = BlockingStream()
+        streams.put(stream)
+        return stream
+    api_client.rest_client.request = request
+    oapi = client.OapiApi(api_client)
+
+    def added(name):
+        return json.dumps({'type': 'ADDED', 'object': {
+            'kind': 'Build', 'apiVersion': 'v1', 'metadata': {'name': name, 'namespace': 'test', 'resourceVersion': '1'},
+            'spec': {'strategy': {'type': 'Source'}, 'nodeSelector': {}, 'triggeredBy': []}
+        }}).encode('utf8') + b'\n'
+
+    multiplexer = watch.WatchMultiplexer(idle_timeout=0)
+    first = multiplexer.subscribe(oapi.list_namespaced_build, 'test', timeout=5)
+    second = multiplexer.subscribe(client.OapiApi(api_client).list_namespaced_build, 'test', timeout=5)
+    other = multiplexer.subscribe(oapi.list_namespaced_build, 'other', timeout=0.1)
+    assert len(multiplexer) == 2
+
+    upstream = streams.get(timeout=5)
+    streams.get(timeout=5)
+    upstream.queue.put(added('build-1'))
+    first_events, second_events = iter(first), iter(second)
+    assert next(first_events)['object'].metadata.name == 'build-1'
+    assert next(second_events)['object'].metadata.name == 'build-1'
+    assert list(other) == []
+    assert len(multiplexer) == 1
+
+    first.close()
+    assert len(multiplexer) == 1
+    second.stop()
+    assert len(multiplexer) == 0
+    assert streams.empty()
+
+
+def test_subscription_queue_is_bounded():
+    multiplexer = watch.WatchMultiplexer(idle_timeout=0)
+    upstream = watch._Upstream(multiplexer, 'key', client.OapiApi().list_project, (), {})
+    subscription = watch.Subscription(multiplexer, upstream, timeout=0, maxsize=2)
+    for idx in range(3):
+        subscription.put({'type': 'ADDED', 'idx': idx})
+    subscription.put(watch._END)
+    assert subscription.dropped == 1
+    assert [event['idx'] for event in subscription] == [1, 2]
+
+
+def test_coalescing_subscription_keeps_latest_state():
+    def event(event_type, name, phase):
+        build = models.V1Build(metadata=k8s_models.V1ObjectMeta(name=name, namespace='test'), status=models.V1BuildStatus(phase=phase))
+        return {'type': event_type, 'object': build}
+
+    multiplexer = watch.WatchMultiplexer(idle_timeout=0)
+    upstream = watch._Upstream(multiplexer, 'key', client.OapiApi().list_namespaced_build, ('test',), {})
+    subscription = watch.Subscription(multiplexer, upstream, timeout=0, maxsize=2, overflow=watch.COALESCE)
+    subscription.put(event('ADDED', 'awaited', 'New'))
+    subscription.put(event('ADDED', 'other', 'New'))
+    subscription.put(event('MODIFIED', 'awaited', 'Complete'))
+    subscription.put(watch._END)
+    events = [(event['type'], event['object'].metadata.name, event['object'].status.phase) for event in subscription]
+    assert events == [('ADDED', 'awaited', 'Complete'), ('ADDED', 'other', 'New')]
+    assert subscription.dropped == 0
+
+
+def test_slow_coalescing_subscription_is_dropped():
+    from six.moves import queue
+
+    def added(name):
+        return {'type': 'ADDED', 'object': models.V1Project(metadata=k8s_models.V1ObjectMeta(name=name))}
+
+    multiplexer = watch.WatchMultiplexer(idle_timeout=0)
+    upstream = watch._Upstream(multiplexer, 'key', client.OapiApi().list_project, (), {})
+    slow = watch.Subscription(multiplexer, upstream, timeout=0, maxsize=1, overflow=watch.COALESCE)
+    other = watch.Subscription(multiplexer, upstream, timeout=0, maxsize=10, overflow=watch.COALESCE)
+    upstream.subscribers.update((slow, other))
+    multiplexer._publish(upstream, added('a'))
+    multiplexer._publish(upstream, added('b'))
+    assert upstream.subscribers == {other}
+    assert [other._queue.get(0)['object'].metadata.name for _ in range(2)] == ['a', 'b']
+    events = iter(slow)
+    assert next(events)['object'].metadata.name == 'a'
+    with pytest.raises(queue.Full):
+        next(events)
+
+
+def test_close_while_connecting(fake_stream):
+    class SilentStream(fake_stream):
+        def read_chunked(self, decode_content=None):
+            raise AssertionError('a closed watch must not read its response')
+
+    w = watch.Watch()
+
+    def list_project(**kwargs):
+        w.close()
+        return SilentStream([])
+    list_project.__doc__ = client.OapiApi.list_project.__doc__
+    assert list(w.stream(list_project)) == []
+
+
+def test_close_shuts_down_connection():
+    class Socket(object):
+        shut_down = False
+
+        def shutdown(self, how):
+            self.shut_down = True
+
+    class Response(object):
+        closed = False
+
+        def __init__(self):
+            self._connection = type('Connection', (object,), {'sock': Socket()})()
+
+        def close(self):
+            self.closed = True
+
+    w = watch.Watch()
+    w._response = response = Response()
+    w.close()
+    assert w._stop
+    assert response._connection.sock.shut_down and response.closed
+
+
+def test_helper_closes_subscription_when_write_fails(monkeypatch, fake_response):
+    from kubernetes.client.rest import ApiException
+    from openshift.helper.exceptions import OpenShiftException
+    from openshift.helper.openshift import OpenShiftObjectHelper
+
+    class Subscription(object):
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    helper = OpenShiftObjectHelper('v1', 'image_stream')
+    subscription = Subscription()
+    monkeypatch.setattr(helper, '_create_stream', lambda namespace: (subscription, subscription))
+
+    def request(method, url, **kwargs):
+        raise ApiException(http_resp=fake_response(403, {'kind': 'Status', 'message': 'forbidden'}))
+    monkeypatch.setattr(helper.api_client.rest_client, 'request', request)
+
+    with pytest.raises(OpenShiftException):
+        helper.create_object('test', body={'metadata': {'name': 'ruby'}})
+    assert subscription.closed
+
+
+def test_event_queue_overflow():
+    def event(event_type, name):
+        return {'type': event_type, 'object': models.V1Project(metadata=k8s_models.V1ObjectMeta(name=name))}
+
+    def drain(events):
+        events.close()
+        result = []
+        while True:
+            item = events.get()
+            if item is watch._END:
+                return result
+            result.append((item['type'], item['object'].metadata.name))
+
+    events = watch.EventQueue(2, watch.DROP_OLDEST)
+    for name in 'abc':
+        events.put(event('ADDED', name))
+    assert events.metrics() == {'depth': 2, 'max_depth': 2, 'dropped': 1, 'coalesced': 0}
+    assert drain(events) == [('ADDED', 'b'), ('ADDED', 'c')]
+
+    events = watch.EventQueue(10, watch.COALESCE)
+    events.put(event('ADDED', 'a'))
+    events.put(event('MODIFIED', 'b'))
+    events.put(event('MODIFIED', 'a'))
+    events.put(event('DELETED', 'b'))
+    events.put(event('ADDED', 'c'))
+    events.put(event('DELETED', 'c'))
+    assert events.metrics()['coalesced'] == 3
+    assert drain(events) == [('ADDED', 'a'), ('DELETED', 'b')]
+
+    with pytest.raises(ValueError):
+        watch.EventQueue(1, 'ignore')
+
+
+def test_background_decoding(fake_stream):
+    lines = [json.dumps({'type': 'ADDED', 'object': {'metadata': {'name': 'test{}'.format(idx), 'resourceVersion': str(idx)},
+                                                     'spec': {}}}) + '\n' for idx in range(5)]
+
+    def list_deployment_config(**kwargs):
+        return fake_stream(lines)
+
+    w = watch.Watch(return_type='V1DeploymentConfig', queue_size=2)
+    names = [event['object'].metadata.name for event in w.stream(list_deployment_config, timeout_seconds=1)]
+    assert names == ['test0', 'test1', 'test2', 'test3', 'test4']
+    assert w.events.metrics()['max_depth'] <= 2
+    assert w.resource_version == '4'
+
+    w = watch.Watch(return_type='V1DeploymentConfig', queue_size=2)
+    for event in w.stream(list_deployment_config, timeout_seconds=1):
+        w.stop()
+    assert event['object'].metadata.name == 'test0'
+
+
+def test_background_reader_ends_with_consumer(fake_stream):
+    line = json.dumps({'type': 'ADDED', 'object': {'metadata': {'name': 'test', 'resourceVersion': '1'}, 'spec': {}}}) + '\n'
+
+    class SilentStream(fake_stream):
+        """ Sends one event, then nothing until it is closed """
+
+        def __init__(self):
+            super(SilentStream, self).__init__([line])
+            self.closed = threading.Event()
+            self.reader = None
+
+        def read_chunked(self, decode_content=None):
+            self.reader = threading.current_thread()
+            yield line.encode('utf8')
+            self.closed.wait(10)
+
+        def close(self):
+            self.closed.set()
+
+    stream = SilentStream()
+    w = watch.Watch(return_type='V1DeploymentConfig', queue_size=2)
+    events = w.stream(lambda **kwargs: stream)
+    assert next(events)['object'].metadata.name == 'test'
+    events.close()
+    assert stream.closed.is_set()
+    stream.reader.join(5)
+    assert not stream.reader.is_alive()